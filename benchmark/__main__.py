@@ -0,0 +1,167 @@
+################################################################################
+#
+#  Copyright (C) 2019 Garrett Brown
+#  This file is part of pyqudt - https://github.com/eigendude/pyqudt
+#
+#  pyqudt is derived from jQUDT
+#  Copyright (C) 2012-2013  Egon Willighagen <egonw@users.sf.net>
+#
+#  SPDX-License-Identifier: BSD-3-Clause
+#  See the file LICENSE for more information.
+#
+################################################################################
+
+#
+# Benchmark suite for the ontology loading, lookup and conversion hot paths.
+#
+# Usage:
+#
+#   Run the benchmarks and store the results as a baseline:
+#
+#     python3 -m benchmark --output baseline.json
+#
+#   Run the benchmarks and flag regressions against the baseline:
+#
+#     python3 -m benchmark --compare baseline.json
+#
+
+from benchmark.benchmarks import BenchmarkResult
+from benchmark.benchmarks import get_benchmarks
+from benchmark.benchmarks import run_benchmarks
+
+import argparse
+import dataclasses
+import json
+import platform
+import sys
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+
+
+# Bump this when the layout of the results changes
+RESULTS_VERSION = 1
+
+# The default slowdown, relative to the baseline, that counts as a regression
+DEFAULT_THRESHOLD = 0.25
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python3 -m benchmark', description='Run the pyqudt benchmarks.')
+    parser.add_argument('--output', help='Write the results as JSON to this file')
+    parser.add_argument('--compare', metavar='BASELINE', help='Compare the results against a stored baseline')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='The relative slowdown that counts as a regression (default: %(default)s)')
+    parser.add_argument('--repeat', type=int, default=5, help='The number of measurements per benchmark')
+    parser.add_argument('--filter', default='', help='Only run benchmarks whose name contains this string')
+
+    args = parser.parse_args(argv)
+
+    benchmarks = [
+        benchmark for benchmark in get_benchmarks() if args.filter in benchmark.name
+    ]
+
+    results = run_benchmarks(benchmarks, args.repeat)
+
+    document = {
+        'version': RESULTS_VERSION,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': {
+            name: dataclasses.asdict(result) for (name, result) in results.items()
+        },
+    }
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(document, file, indent=2, sort_keys=True)
+
+    if not args.compare:
+        _print_results(results)
+        return 0
+
+    with open(args.compare) as file:
+        baseline = json.load(file)
+
+    if baseline.get('version') != RESULTS_VERSION:
+        parser.error(f'Unsupported baseline version: {baseline.get("version")}')
+
+    regressions = _compare_results(results, baseline['results'], args.threshold)
+
+    return 1 if regressions else 0
+
+
+def _print_results(results: Dict[str, BenchmarkResult]) -> None:
+    """
+    Print the results as a table.
+    """
+    print(f'{"benchmark":<32} {"min":>12} {"median":>12} {"mean":>12}')
+
+    for (name, result) in results.items():
+        print(
+            f'{name:<32} '
+            f'{_format_time(result.min):>12} '
+            f'{_format_time(result.median):>12} '
+            f'{_format_time(result.mean):>12}'
+        )
+
+
+def _compare_results(
+        results: Dict[str, BenchmarkResult],
+        baseline: Dict[str, Dict[str, Any]],
+        threshold: float,
+) -> List[str]:
+    """
+    Print the results next to the baseline and flag regressions.
+
+    Benchmarks are compared by their fastest measurement, which is the least
+    affected by noise.
+
+    :return: The names of the benchmarks that regressed
+    """
+    regressions: List[str] = list()
+
+    print(f'{"benchmark":<32} {"baseline":>12} {"current":>12} {"change":>9}')
+
+    for (name, result) in results.items():
+        baseline_result = baseline.get(name)
+        if baseline_result is None:
+            print(f'{name:<32} {"-":>12} {_format_time(result.min):>12} {"new":>9}')
+            continue
+
+        # A baseline below the timer resolution can't be compared against
+        if baseline_result['min'] <= 0:
+            print(f'{name:<32} {_format_time(baseline_result["min"]):>12} {_format_time(result.min):>12} {"n/a":>9}')
+            continue
+
+        change = result.min / baseline_result['min'] - 1.0
+
+        flag = ''
+        if change > threshold:
+            flag = '  REGRESSION'
+            regressions.append(name)
+
+        print(
+            f'{name:<32} '
+            f'{_format_time(baseline_result["min"]):>12} '
+            f'{_format_time(result.min):>12} '
+            f'{change:>+9.1%}{flag}'
+        )
+
+    return regressions
+
+
+def _format_time(seconds: float) -> str:
+    """
+    Format a duration with a readable unit.
+    """
+    for (unit, scale) in (('s', 1.0), ('ms', 1e-3), ('us', 1e-6)):
+        if seconds >= scale:
+            return f'{seconds / scale:.3f} {unit}'
+
+    return f'{seconds / 1e-9:.3f} ns'
+
+
+if __name__ == '__main__':
+    sys.exit(main())
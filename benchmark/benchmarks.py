@@ -0,0 +1,175 @@
+################################################################################
+#
+#  Copyright (C) 2019 Garrett Brown
+#  This file is part of pyqudt - https://github.com/eigendude/pyqudt
+#
+#  pyqudt is derived from jQUDT
+#  Copyright (C) 2012-2013  Egon Willighagen <egonw@users.sf.net>
+#
+#  SPDX-License-Identifier: BSD-3-Clause
+#  See the file LICENSE for more information.
+#
+################################################################################
+
+from qudt.ontology.ontology_reader import OntologyReader
+from qudt.ontology.unit_factory import REPO_FILES
+from qudt.ontology.unit_factory import UnitFactory
+from qudt.quantity import Quantity
+
+import dataclasses
+import functools
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Callable
+from typing import Dict
+from typing import List
+
+
+# Units used by the lookup and conversion benchmarks
+KELVIN_IRI = 'http://qudt.org/vocab/unit#Kelvin'
+CELSIUS_IRI = 'http://qudt.org/vocab/unit#DegreeCelsius'
+NANOMOLAR_IRI = 'http://www.openphacts.org/units/Nanomolar'
+MICROMOLAR_IRI = 'http://www.openphacts.org/units/Micromolar'
+TEMPERATURE_UNIT_IRI = 'http://qudt.org/schema/qudt#TemperatureUnit'
+
+# The number of values converted by the bulk conversion benchmarks
+BULK_SIZE = 10000
+ARRAY_SIZE = 1000000
+
+
+@dataclasses.dataclass
+class Benchmark(object):
+    """
+    A function to time, run `number` times per measurement.
+    """
+    name: str
+    function: Callable[[], object]
+    number: int = dataclasses.field(default=1)
+
+
+@dataclasses.dataclass
+class BenchmarkResult(object):
+    """
+    The timings of a benchmark, in seconds per run of its function.
+    """
+    number: int
+    repeat: int
+    min: float
+    median: float
+    mean: float
+
+
+def get_benchmarks() -> List[Benchmark]:
+    """
+    Get the benchmarks covering the ontology loading, lookup and conversion
+    hot paths.
+
+    :return: The list of benchmarks
+    """
+    repo_dir = UnitFactory.get_repo_dir()
+
+    kelvin = UnitFactory.get_unit(KELVIN_IRI)
+    celsius = UnitFactory.get_unit(CELSIUS_IRI)
+    nanomolar = UnitFactory.get_unit(NANOMOLAR_IRI)
+    micromolar = UnitFactory.get_unit(MICROMOLAR_IRI)
+
+    temperatures = [Quantity(float(i), celsius) for i in range(BULK_SIZE)]
+    concentrations = [Quantity(float(i), micromolar) for i in range(BULK_SIZE)]
+
+    def get_unit_cold() -> None:
+        UnitFactory.clear_unit_cache()
+        UnitFactory.get_unit(KELVIN_IRI)
+
+    def find_units_cold() -> None:
+        UnitFactory.clear_unit_cache()
+        UnitFactory.find_units('nM')
+
+    benchmarks = [
+        Benchmark('cold_start', _time_cold_start),
+        Benchmark('factory_construction', UnitFactory),
+    ]
+
+    for repo_file in REPO_FILES:
+        repo_path = os.path.join(repo_dir, repo_file)
+        benchmarks.append(Benchmark(f'read_{repo_file}', functools.partial(OntologyReader.read, repo_path)))
+
+    benchmarks.extend([
+        Benchmark('get_unit_hot', lambda: UnitFactory.get_unit(KELVIN_IRI), number=10000),
+        Benchmark('get_unit_cold', get_unit_cold, number=1000),
+        Benchmark('find_units_hot', lambda: UnitFactory.find_units('nM'), number=10000),
+        Benchmark('find_units_cold', find_units_cold, number=1000),
+        Benchmark('get_iris', lambda: UnitFactory.get_iris(TEMPERATURE_UNIT_IRI), number=10000),
+        Benchmark('get_units', lambda: UnitFactory.get_units(TEMPERATURE_UNIT_IRI, include_subtypes=True), number=10000),
+        Benchmark('convert_to_temperature', lambda: [q.convert_to(kelvin) for q in temperatures]),
+        Benchmark('convert_to_concentration', lambda: [q.convert_to(nanomolar) for q in concentrations]),
+        Benchmark('quantity_add', lambda: [q + q for q in concentrations]),
+        Benchmark('quantity_multiply', lambda: [q * q for q in concentrations]),
+    ])
+
+    try:
+        import numpy
+        from qudt.quantity_array import convert_array
+    except ImportError:
+        pass
+    else:
+        values = numpy.arange(ARRAY_SIZE, dtype=float)
+        out = numpy.empty_like(values)
+
+        benchmarks.append(Benchmark('convert_array', lambda: convert_array(values, celsius, kelvin, out=out)))
+
+    return benchmarks
+
+
+def run_benchmark(benchmark: Benchmark, repeat: int) -> BenchmarkResult:
+    """
+    Time a benchmark.
+
+    :param benchmark: The benchmark
+    :param repeat: The number of measurements to take
+    :return: The timings per run of the benchmark's function
+    """
+    # Warm up, e.g. to create the unit factory
+    benchmark.function()
+
+    timings: List[float] = list()
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(benchmark.number):
+            benchmark.function()
+        timings.append((time.perf_counter() - start) / benchmark.number)
+
+    return BenchmarkResult(
+        number=benchmark.number,
+        repeat=repeat,
+        min=min(timings),
+        median=statistics.median(timings),
+        mean=statistics.mean(timings),
+    )
+
+
+def run_benchmarks(benchmarks: List[Benchmark], repeat: int) -> Dict[str, BenchmarkResult]:
+    """
+    Time a list of benchmarks.
+
+    :param benchmarks: The benchmarks
+    :param repeat: The number of measurements to take per benchmark
+    :return: The timings, by benchmark name
+    """
+    return {
+        benchmark.name: run_benchmark(benchmark, repeat) for benchmark in benchmarks
+    }
+
+
+def _time_cold_start() -> None:
+    """
+    Import the package and create the unit factory in a new interpreter.
+    """
+    subprocess.check_call([
+        sys.executable,
+        '-c',
+        'from qudt.ontology.unit_factory import UnitFactory; UnitFactory._get_instance()',
+    ])
@@ -0,0 +1,196 @@
+################################################################################
+#
+#  Copyright (C) 2019 Garrett Brown
+#  This file is part of pyqudt - https://github.com/eigendude/pyqudt
+#
+#  pyqudt is derived from jQUDT
+#  Copyright (C) 2012-2013  Egon Willighagen <egonw@users.sf.net>
+#
+#  SPDX-License-Identifier: BSD-3-Clause
+#  See the file LICENSE for more information.
+#
+################################################################################
+
+from qudt.lru_cache import CacheInfo
+from qudt.lru_cache import LRUCache
+from qudt.slots import add_slots
+from qudt.unit import Unit
+
+import dataclasses
+import decimal
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+
+# The default maximum number of cached converters, or None for no limit
+DEFAULT_CONVERTER_CACHE_SIZE: Optional[int] = 1024
+
+# Types of quantities that share their dimension vector with other kinds of
+# quantities, but are never converted to them. E.g. becquerels and hertz are
+# both per second, and grays and sieverts are both joules per kilogram.
+ISOLATED_TYPES = frozenset([
+    'http://qudt.org/schema/qudt#AbsorbedDoseUnit',
+    'http://qudt.org/schema/qudt#ActivityUnit',
+    'http://qudt.org/schema/qudt#DoseEquivalentUnit',
+    'http://qudt.org/schema/qudt#HeartRateUnit',
+    'http://qudt.org/schema/qudt#RespiratoryRateUnit',
+    'http://qudt.org/schema/qudt#VideoFrameRateUnit',
+])
+
+
+@add_slots
+@dataclasses.dataclass(frozen=True)
+class Converter(object):
+    """
+    A conversion between two units, as a single scale and shift.
+    """
+    scale: float = dataclasses.field(default=1.0)
+    shift: float = dataclasses.field(default=0.0)
+
+    def __call__(self, value: float) -> float:
+        """
+        Convert a value.
+
+        :param value: The value in the source unit
+        :return: The value in the target unit
+        """
+        return value * self.scale + self.shift
+
+    def convert_values(self, values: Iterable[float]) -> List[float]:
+        """
+        Convert a batch of values in one call.
+
+        :param values: The values in the source unit
+        :return: The values in the target unit, in the same order
+        """
+        scale = self.scale
+        shift = self.shift
+
+        if not shift:
+            return [value * scale for value in values]
+
+        return [value * scale + shift for value in values]
+
+
+class ConverterRegistry(object):
+    """
+    A registry of converters between pairs of units.
+
+    Each pair of units is validated and collapsed into a converter once, and
+    the converter is cached for later conversions.
+    """
+
+    _converters: LRUCache[Tuple[Unit, Unit], Converter] = LRUCache(DEFAULT_CONVERTER_CACHE_SIZE)
+
+    @classmethod
+    def get_converter(cls, source: Unit, target: Unit) -> Converter:
+        """
+        Get the converter from one unit to another.
+
+        :param source: The unit to convert from
+        :param target: The unit to convert to
+        :return: The converter
+        :raises ValueError: If the units don't have the same type or dimension
+        """
+        key = (source, target)
+
+        converter: Optional[Converter] = cls._converters.get(key)
+
+        if converter is None:
+            converter = cls._create_converter(source, target)
+            cls._converters.put(key, converter)
+
+        return converter
+
+    @classmethod
+    def set_cache_size(cls, maxsize: Optional[int]) -> None:
+        """
+        Set the maximum number of cached converters.
+
+        :param maxsize: The maximum number of converters, or None for no limit
+        """
+        cls._converters.resize(maxsize)
+
+    @classmethod
+    def get_cache_info(cls) -> CacheInfo:
+        """
+        Get the statistics of the converter cache.
+
+        :return: The hits, misses, maximum size and current size of the cache
+        """
+        return cls._converters.info()
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """
+        Remove all converters from the cache.
+        """
+        cls._converters.clear()
+
+    @staticmethod
+    def _create_converter(source: Unit, target: Unit) -> Converter:
+        """
+        Helper function to validate a pair of units and create its converter.
+        """
+        if source is target or source == target:
+            # Nothing to be done
+            return Converter()
+
+        if not is_convertible(source, target):
+            raise ValueError(
+                f'The new unit does not have the same parent type or dimension '
+                f'(source: {source.type_iri}; target: {target.type_iri})'
+            )
+
+        # Converting to the base unit and then to the target unit is
+        #
+        #   (value * m1 + o1 - o2) / m2 = value * (m1 / m2) + (o1 - o2) / m2
+        #
+        # The factors are computed in decimal from the shortest representation
+        # of the floats, which is how they're written in the ontology. This
+        # avoids rounding errors like 0.001 / 0.000001 = 1000.0000000000001.
+        m1 = _to_decimal(source.multiplier.multiplier)
+        o1 = _to_decimal(source.multiplier.offset)
+        m2 = _to_decimal(target.multiplier.multiplier)
+        o2 = _to_decimal(target.multiplier.offset)
+
+        return Converter(
+            scale=float(m1 / m2),
+            shift=float((o1 - o2) / m2),
+        )
+
+
+def is_convertible(source: Unit, target: Unit) -> bool:
+    """
+    Check if a value can be converted from one unit to another.
+
+    Units of the same type are convertible, and so are units of different
+    types with the same dimension vector, e.g. watts and horsepower. Units
+    without a dimension are only convertible within their type, as are
+    dimensionless units, because e.g. percentages and bits are both
+    dimensionless but can't be converted into each other. Units of the
+    ISOLATED_TYPES, such as becquerels and grays, are also only convertible
+    within their type.
+
+    :param source: The unit to convert from
+    :param target: The unit to convert to
+    :return: True if the units are convertible, False otherwise
+    """
+    if source.type_iri == target.type_iri:
+        return True
+
+    dimension_vector = source.dimension_vector
+
+    return (
+        dimension_vector is not None and
+        dimension_vector == target.dimension_vector and
+        not dimension_vector.is_dimensionless() and
+        source.type_iri not in ISOLATED_TYPES and
+        target.type_iri not in ISOLATED_TYPES
+    )
+
+
+def _to_decimal(value: float) -> decimal.Decimal:
+    return decimal.Decimal(repr(value))
@@ -0,0 +1,297 @@
+################################################################################
+#
+#  Copyright (C) 2019 Garrett Brown
+#  This file is part of pyqudt - https://github.com/eigendude/pyqudt
+#
+#  pyqudt is derived from jQUDT
+#  Copyright (C) 2012-2013  Egon Willighagen <egonw@users.sf.net>
+#
+#  SPDX-License-Identifier: BSD-3-Clause
+#  See the file LICENSE for more information.
+#
+################################################################################
+
+#
+# Streaming conversion of unit-annotated CSV and TSV files.
+#
+# Usage:
+#
+#   python3 -m qudt.csv_converter --to nM --value-column value \
+#       --unit-column unit input.csv output.csv
+#
+
+from qudt.converter import Converter
+from qudt.converter import ConverterRegistry
+from qudt.lru_cache import LRUCache
+from qudt.ontology.unit_factory import UnitFactory
+from qudt.unit import Unit
+
+import argparse
+import csv
+import itertools
+import sys
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import TextIO
+from typing import Tuple
+
+
+# The default number of rows converted at a time
+DEFAULT_CHUNK_SIZE = 10000
+
+# The maximum number of distinct unit strings whose converters are kept
+DEFAULT_CONVERTER_CACHE_SIZE: Optional[int] = 1024
+
+
+# Type definitions
+Row = Dict[str, str]
+
+
+class CsvConverter(object):
+    """
+    Converts rows with a value column and a unit column to a single target
+    unit.
+
+    Rows are read lazily and converted a chunk at a time, so memory use is
+    bounded by the chunk size. The values of each chunk are grouped by unit
+    string, and each group is converted in one call. Each distinct unit
+    string is only resolved once, as long as it stays in the cache.
+    """
+
+    def __init__(
+            self,
+            target_unit: Unit,
+            value_column: str,
+            unit_column: str,
+            chunk_size: int = DEFAULT_CHUNK_SIZE,
+            ignore_case: bool = False,
+            normalize_whitespace: bool = False,
+            skip_invalid: bool = False,
+    ):
+        """
+        Create a converter.
+
+        :param target_unit: The unit to convert the values to
+        :param value_column: The name of the column containing the values
+        :param unit_column: The name of the column containing the unit
+                            abbreviations
+        :param chunk_size: The number of rows to convert at a time
+        :param ignore_case: True to match unit abbreviations case-insensitively
+        :param normalize_whitespace: True to ignore leading, trailing and
+                                     repeated whitespace in unit abbreviations
+        :param skip_invalid: True to drop rows that can't be converted, False
+                             to raise a ValueError
+        """
+        if chunk_size < 1:
+            raise ValueError(f'Invalid chunk size: {chunk_size}')
+
+        self.target_unit = target_unit
+        self.value_column = value_column
+        self.unit_column = unit_column
+        self.chunk_size = chunk_size
+        self.ignore_case = ignore_case
+        self.normalize_whitespace = normalize_whitespace
+        self.skip_invalid = skip_invalid
+
+        # Unit string -> converter to the target unit, or None if the unit
+        # string can't be converted. The converter is wrapped in a tuple so
+        # that unconvertible unit strings are cached too.
+        self._converters: LRUCache[str, Tuple[Optional[Converter]]] = LRUCache(DEFAULT_CONVERTER_CACHE_SIZE)
+
+    def convert_rows(self, rows: Iterable[Row]) -> Iterator[Row]:
+        """
+        Convert a stream of rows.
+
+        The value of each row is converted to the target unit, and the unit
+        column is replaced with the target unit's abbreviation. Empty values
+        are passed through, even if their unit is unknown.
+
+        :param rows: The rows, e.g. from a csv.DictReader
+        :return: A generator of the converted rows
+        """
+        iterator = iter(rows)
+        row_number = 0
+
+        while True:
+            chunk: List[Row] = list(itertools.islice(iterator, self.chunk_size))
+            if not chunk:
+                break
+
+            for row in self._convert_chunk(chunk, row_number):
+                yield row
+
+            row_number += len(chunk)
+
+    def convert_file(self, input_file: TextIO, output_file: TextIO, delimiter: str = ',') -> int:
+        """
+        Convert a CSV or TSV file.
+
+        :param input_file: The file to read, with a header row
+        :param output_file: The file to write
+        :param delimiter: The field delimiter, e.g. ',' or '\\t'
+        :return: The number of rows written, excluding the header
+        """
+        reader = csv.DictReader(input_file, delimiter=delimiter)
+
+        field_names = reader.fieldnames or []
+        for column in (self.value_column, self.unit_column):
+            if column not in field_names:
+                raise ValueError(f'Missing column: {column}')
+
+        writer = csv.DictWriter(output_file, fieldnames=field_names, delimiter=delimiter)
+        writer.writeheader()
+
+        row_count = 0
+
+        for row in self.convert_rows(reader):
+            writer.writerow(row)
+            row_count += 1
+
+        return row_count
+
+    def _convert_chunk(self, chunk: List[Row], first_row_number: int) -> List[Row]:
+        """
+        Helper function to convert a chunk of rows.
+
+        The rows are validated first, and then the values of each unit string
+        are converted in one call.
+        """
+        converted_rows: List[Row] = list()
+
+        # Unit string -> (converter, rows, values) of the rows with values
+        groups: Dict[str, Tuple[Converter, List[Row], List[float]]] = dict()
+
+        for (offset, row) in enumerate(chunk):
+            value = row.get(self.value_column)
+            unit_name = row.get(self.unit_column)
+
+            try:
+                # Short rows are missing their last fields
+                if value is None or unit_name is None:
+                    raise ValueError('Missing value or unit')
+
+                # csv.DictReader keeps the fields of long rows beyond the
+                # header under the key None
+                if None in row:
+                    raise ValueError('More fields than the header')
+
+                value = value.strip()
+
+                # Empty values are passed through, whatever their unit
+                if value:
+                    group = groups.get(unit_name)
+                    if group is None:
+                        converter = self._get_converter(unit_name)
+                        if converter is None:
+                            raise ValueError(f'Unit {unit_name!r} cannot be converted to {self.target_unit}')
+                        group = groups[unit_name] = (converter, [], [])
+
+                    number = float(value)
+                    group[1].append(row)
+                    group[2].append(number)
+            except ValueError as error:
+                if self.skip_invalid:
+                    continue
+                raise ValueError(f'Row {first_row_number + offset + 1}: {error}') from error
+
+            row[self.unit_column] = self.target_unit.abbreviation
+            converted_rows.append(row)
+
+        for (converter, rows, values) in groups.values():
+            for (row, converted_value) in zip(rows, converter.convert_values(values)):
+                row[self.value_column] = repr(converted_value)
+
+        return converted_rows
+
+    def _get_converter(self, unit_name: str) -> Optional[Converter]:
+        """
+        Helper function to get the converter for a unit string.
+
+        If several units share the abbreviation, the first one that can be
+        converted to the target unit is used.
+        """
+        cached_converter = self._converters.get(unit_name)
+        if cached_converter is not None:
+            return cached_converter[0]
+
+        converter: Optional[Converter] = None
+
+        units = UnitFactory.find_units(unit_name, self.ignore_case, self.normalize_whitespace)
+
+        for unit in units:
+            try:
+                converter = ConverterRegistry.get_converter(unit, self.target_unit)
+                break
+            except ValueError:
+                pass
+
+        self._converters.put(unit_name, (converter,))
+
+        return converter
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Convert the values of a unit-annotated CSV or TSV file to one unit.')
+    parser.add_argument('input', nargs='?', default='-', help='The file to read, or - for stdin')
+    parser.add_argument('output', nargs='?', default='-', help='The file to write, or - for stdout')
+    parser.add_argument('--to', required=True, help='The abbreviation or IRI of the target unit')
+    parser.add_argument('--value-column', default='value', help='The name of the value column')
+    parser.add_argument('--unit-column', default='unit', help='The name of the unit column')
+    parser.add_argument('--tsv', action='store_true', help='Read and write tab-separated values')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help='The number of rows to convert at a time')
+    parser.add_argument('--ignore-case', action='store_true', help='Match unit abbreviations case-insensitively')
+    parser.add_argument('--skip-invalid', action='store_true', help='Drop rows that cannot be converted')
+
+    args = parser.parse_args(argv)
+
+    target_unit = _resolve_target_unit(args.to)
+    if target_unit is None:
+        parser.error(f'Unknown unit: {args.to}')
+
+    converter = CsvConverter(
+        target_unit,
+        args.value_column,
+        args.unit_column,
+        chunk_size=args.chunk_size,
+        ignore_case=args.ignore_case,
+        normalize_whitespace=True,
+        skip_invalid=args.skip_invalid,
+    )
+
+    delimiter = '\t' if args.tsv else ','
+
+    input_file = sys.stdin if args.input == '-' else open(args.input, newline='', encoding='utf-8')
+    try:
+        output_file = sys.stdout if args.output == '-' else open(args.output, 'w', newline='', encoding='utf-8')
+        try:
+            converter.convert_file(input_file, output_file, delimiter)
+        finally:
+            if output_file is not sys.stdout:
+                output_file.close()
+    finally:
+        if input_file is not sys.stdin:
+            input_file.close()
+
+    return 0
+
+
+def _resolve_target_unit(name: str) -> Optional[Unit]:
+    """
+    Helper function to resolve a unit from an abbreviation or IRI.
+    """
+    units = UnitFactory.find_units(name)
+    if units:
+        return units[0]
+
+    unit = UnitFactory.get_unit(name)
+    if unit.type_iri:
+        return unit
+
+    return None
+
+
+if __name__ == '__main__':
+    sys.exit(main())
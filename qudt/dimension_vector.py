@@ -0,0 +1,154 @@
+################################################################################
+#
+#  Copyright (C) 2019 Garrett Brown
+#  This file is part of pyqudt - https://github.com/eigendude/pyqudt
+#
+#  pyqudt is derived from jQUDT
+#  Copyright (C) 2012-2013  Egon Willighagen <egonw@users.sf.net>
+#
+#  SPDX-License-Identifier: BSD-3-Clause
+#  See the file LICENSE for more information.
+#
+################################################################################
+
+from qudt.slots import add_slots
+
+import dataclasses
+import re
+from typing import Any
+
+
+# The namespace of QUDT's dimension vector IRIs
+NAMESPACE = 'http://qudt.org/vocab/dimensionvector/'
+
+# The local name of a dimension vector IRI, e.g. A0E0L1I0M0H0T-2D0 for
+# acceleration. D1 marks a dimensionless vector.
+LOCAL_NAME_PATTERN = re.compile(
+    r'A(-?\d+)E(-?\d+)L(-?\d+)I(-?\d+)M(-?\d+)H(-?\d+)T(-?\d+)D([01])'
+)
+
+
+@add_slots
+@dataclasses.dataclass(frozen=True)
+class DimensionVector(object):
+    """
+    The exponents of the seven SI base dimensions of a quantity.
+
+    Quantities with equal dimension vectors can be converted into each other.
+    The vectors of derived quantities are the products, quotients and powers
+    of the vectors they are derived from, e.g. force is mass times length per
+    time squared.
+
+    Dimension vectors are immutable and hashable.
+    """
+    amount_of_substance: int = dataclasses.field(default=0)
+    electric_current: int = dataclasses.field(default=0)
+    length: int = dataclasses.field(default=0)
+    luminous_intensity: int = dataclasses.field(default=0)
+    mass: int = dataclasses.field(default=0)
+    temperature: int = dataclasses.field(default=0)
+    time: int = dataclasses.field(default=0)
+
+    @classmethod
+    def from_iri(cls, iri: str) -> 'DimensionVector':
+        """
+        Parse a QUDT dimension vector IRI.
+
+        :param iri: The IRI, e.g.
+                    'http://qudt.org/vocab/dimensionvector/A0E0L1I0M0H0T0D0'
+        :return: The dimension vector
+        :raises ValueError: If the IRI isn't a dimension vector with integer
+                            exponents
+        """
+        match = LOCAL_NAME_PATTERN.fullmatch(iri.rsplit('/', 1)[-1].rsplit('#', 1)[-1])
+
+        if match is None:
+            raise ValueError(f'Invalid dimension vector: {iri}')
+
+        (amount_of_substance, electric_current, length, luminous_intensity, mass, temperature, time) = (
+            int(exponent) for exponent in match.groups()[:7]
+        )
+
+        return cls(
+            amount_of_substance=amount_of_substance,
+            electric_current=electric_current,
+            length=length,
+            luminous_intensity=luminous_intensity,
+            mass=mass,
+            temperature=temperature,
+            time=time,
+        )
+
+    @property
+    def iri(self) -> str:
+        """
+        Get the QUDT IRI of the dimension vector.
+        """
+        return (
+            f'{NAMESPACE}'
+            f'A{self.amount_of_substance}'
+            f'E{self.electric_current}'
+            f'L{self.length}'
+            f'I{self.luminous_intensity}'
+            f'M{self.mass}'
+            f'H{self.temperature}'
+            f'T{self.time}'
+            f'D{int(self.is_dimensionless())}'
+        )
+
+    def is_dimensionless(self) -> bool:
+        """
+        Check if all exponents are zero, as for ratios, counts and angles.
+
+        :return: True if the vector is dimensionless, False otherwise
+        """
+        return self == DIMENSIONLESS
+
+    def __mul__(self, other: Any) -> 'DimensionVector':
+        if not isinstance(other, DimensionVector):
+            return NotImplemented
+
+        return DimensionVector(
+            amount_of_substance=self.amount_of_substance + other.amount_of_substance,
+            electric_current=self.electric_current + other.electric_current,
+            length=self.length + other.length,
+            luminous_intensity=self.luminous_intensity + other.luminous_intensity,
+            mass=self.mass + other.mass,
+            temperature=self.temperature + other.temperature,
+            time=self.time + other.time,
+        )
+
+    def __truediv__(self, other: Any) -> 'DimensionVector':
+        if not isinstance(other, DimensionVector):
+            return NotImplemented
+
+        return DimensionVector(
+            amount_of_substance=self.amount_of_substance - other.amount_of_substance,
+            electric_current=self.electric_current - other.electric_current,
+            length=self.length - other.length,
+            luminous_intensity=self.luminous_intensity - other.luminous_intensity,
+            mass=self.mass - other.mass,
+            temperature=self.temperature - other.temperature,
+            time=self.time - other.time,
+        )
+
+    def __pow__(self, exponent: Any) -> 'DimensionVector':
+        if not isinstance(exponent, int) or isinstance(exponent, bool):
+            return NotImplemented
+
+        return DimensionVector(
+            amount_of_substance=self.amount_of_substance * exponent,
+            electric_current=self.electric_current * exponent,
+            length=self.length * exponent,
+            luminous_intensity=self.luminous_intensity * exponent,
+            mass=self.mass * exponent,
+            temperature=self.temperature * exponent,
+            time=self.time * exponent,
+        )
+
+    def __repr__(self) -> str:
+        return self.iri[len(NAMESPACE):]
+
+
+# The vector of dimensionless quantities
+DIMENSIONLESS = DimensionVector()
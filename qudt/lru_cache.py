@@ -0,0 +1,164 @@
+################################################################################
+#
+#  Copyright (C) 2019 Garrett Brown
+#  This file is part of pyqudt - https://github.com/eigendude/pyqudt
+#
+#  pyqudt is derived from jQUDT
+#  Copyright (C) 2012-2013  Egon Willighagen <egonw@users.sf.net>
+#
+#  SPDX-License-Identifier: BSD-3-Clause
+#  See the file LICENSE for more information.
+#
+################################################################################
+
+import heapq
+import itertools
+import threading
+from typing import Dict
+from typing import Generic
+from typing import Hashable
+from typing import NamedTuple
+from typing import Optional
+from typing import TypeVar
+
+
+# Type definitions
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+
+class CacheInfo(NamedTuple):
+    """
+    Statistics of a cache, in the style of functools.lru_cache().
+    """
+    hits: int
+    misses: int
+    maxsize: Optional[int]
+    currsize: int
+
+
+class _Entry(Generic[V]):
+    """
+    A cached value and the tick of its last use.
+    """
+    __slots__ = ('value', 'tick')
+
+    def __init__(self, value: V, tick: int):
+        self.value = value
+        self.tick = tick
+
+
+class LRUCache(Generic[K, V]):
+    """
+    A mapping that evicts the least recently used entry when it is full.
+
+    The cache is safe to use from multiple threads. Hits are plain dict reads
+    that don't take the lock, so lookups of cached values from many threads
+    never contend. Only misses, insertions and evictions are serialized.
+    """
+
+    def __init__(self, maxsize: Optional[int] = 128):
+        """
+        Create an empty cache.
+
+        :param maxsize: The maximum number of entries, or None for no limit
+        """
+        self._maxsize: Optional[int] = maxsize
+        self._entries: Dict[K, _Entry[V]] = dict()
+        self._clock = itertools.count()
+        self._hits: int = 0
+        self._misses: int = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K) -> Optional[V]:
+        """
+        Get a cached value and mark it as recently used.
+
+        Hits don't take the lock, so the hit count may miss some of the hits
+        of lookups running at the same time.
+
+        :param key: The key of the entry
+        :return: The value, or None if the key is not cached
+        """
+        entry = self._entries.get(key)
+
+        if entry is None:
+            with self._lock:
+                self._misses += 1
+            return None
+
+        # Assigning the tick is atomic, and an entry evicted in the meantime
+        # is simply dropped, so hits don't need the lock
+        entry.tick = next(self._clock)
+
+        self._hits += 1
+
+        return entry.value
+
+    def put(self, key: K, value: V) -> None:
+        """
+        Add a value to the cache, evicting the least recently used entries if
+        the cache is full.
+
+        :param key: The key of the entry
+        :param value: The value to cache
+        """
+        with self._lock:
+            self._entries[key] = _Entry(value, next(self._clock))
+            self._evict()
+
+    def clear(self) -> None:
+        """
+        Remove all entries from the cache. The statistics are kept.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def resize(self, maxsize: Optional[int]) -> None:
+        """
+        Change the maximum number of entries, evicting entries if needed.
+
+        :param maxsize: The maximum number of entries, or None for no limit
+        """
+        with self._lock:
+            self._maxsize = maxsize
+            self._evict()
+
+    def info(self) -> CacheInfo:
+        """
+        Get the statistics of the cache.
+
+        :return: The hits, misses, maximum size and current size
+        """
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                maxsize=self._maxsize,
+                currsize=len(self._entries),
+            )
+
+    def _evict(self) -> None:
+        """
+        Evict the least recently used entries if the cache doesn't fit. The
+        lock must be held.
+
+        Finding the least recently used entries scans the cache, so an eighth
+        of the entries are evicted at once, and the scan only runs once every
+        few insertions.
+        """
+        if self._maxsize is None:
+            return
+
+        maxsize = max(self._maxsize, 0)
+
+        if len(self._entries) <= maxsize:
+            return
+
+        count = len(self._entries) - maxsize + maxsize // 8
+
+        for (key, _) in heapq.nsmallest(count, self._entries.items(), key=lambda item: item[1].tick):
+            del self._entries[key]
@@ -11,13 +11,18 @@
 #
 ################################################################################
 
+from qudt.slots import add_slots
+
 import dataclasses
 
 
-@dataclasses.dataclass
+@add_slots
+@dataclasses.dataclass(frozen=True)
 class Multiplier(object):
     """
     A multiplier with an optional offset.
+
+    Multipliers are immutable and hashable.
     """
     offset: float = dataclasses.field(default=0.0)
     multiplier: float = dataclasses.field(default=1.0)
@@ -0,0 +1,291 @@
+################################################################################
+#
+#  Copyright (C) 2019 Garrett Brown
+#  This file is part of pyqudt - https://github.com/eigendude/pyqudt
+#
+#  pyqudt is derived from jQUDT
+#  Copyright (C) 2012-2013  Egon Willighagen <egonw@users.sf.net>
+#
+#  SPDX-License-Identifier: BSD-3-Clause
+#  See the file LICENSE for more information.
+#
+################################################################################
+
+
+from qudt.ontology.unit_factory import UnitFactory
+from qudt.ontology.unit_factory import WarmUpInfo
+from qudt.unit import Unit
+
+import asyncio
+import concurrent.futures
+import threading
+from typing import List
+from typing import Optional
+
+
+class AsyncUnitFactory(object):
+    """
+    An asyncio facade of UnitFactory.
+
+    Loading the bundled repositories on first use and loading user
+    repositories can take seconds. Here they run in an executor, so the
+    event loop stays responsive, and concurrent requests for the first use
+    share a single load. The tables that are otherwise built by the first
+    lookups, such as the prefixes of compact IRIs, are built in the executor
+    too.
+
+    Once the factory is ready, lookups are served from memory and run
+    directly on the event loop.
+    """
+
+    # The executor running the loads, or None until it's first needed
+    _executor: Optional[concurrent.futures.Executor] = None
+
+    # The warm-up of the factory on first use, shared by all waiters and
+    # event loops, and the lock guarding its creation
+    _ready_future: Optional['concurrent.futures.Future[WarmUpInfo]'] = None
+    _ready_lock = threading.Lock()
+
+    @classmethod
+    def set_executor(cls, executor: Optional[concurrent.futures.Executor]) -> None:
+        """
+        Set the executor running the loads.
+
+        A process pool can't be used, because the loaded repositories must
+        end up in this process. To parse repositories in other processes,
+        see UnitFactory.set_parallel_loading().
+
+        :param executor: The executor, or None for a thread pool created on
+                         first use
+        """
+        cls._executor = executor
+
+    @classmethod
+    def _get_executor(cls) -> concurrent.futures.Executor:
+        """
+        Helper function to get the executor, creating the default thread pool
+        if none is set.
+        """
+        with cls._ready_lock:
+            if cls._executor is None:
+                cls._executor = concurrent.futures.ThreadPoolExecutor(thread_name_prefix='pyqudt')
+            return cls._executor
+
+    @classmethod
+    async def ready(cls) -> None:
+        """
+        Wait until the factory is warmed up, see UnitFactory.warm_up().
+
+        The factory is warmed up once, in the executor, however many
+        coroutines wait for it. If the warm-up fails, the error is raised to
+        the waiters and the next call tries again. Cancelling a waiter
+        doesn't cancel the warm-up.
+        """
+        if UnitFactory.is_ready():
+            return
+
+        executor = cls._get_executor()
+
+        with cls._ready_lock:
+            future = cls._ready_future
+            if future is None or (future.done() and future.exception() is not None):
+                future = executor.submit(cls._warm_up)
+                cls._ready_future = future
+
+        await asyncio.shield(asyncio.wrap_future(future))
+
+    @classmethod
+    async def load_repo_async(cls, repo_file: str) -> int:
+        """
+        Load an RDF triplet repo in the executor, see UnitFactory.load_repo().
+
+        :param repo_file: The path to the RDF triplet repo
+        :return: The number of triplets loaded, or 0 if the file doesn't exist
+        """
+        await cls.ready()
+
+        loop = asyncio.get_running_loop()
+
+        return await loop.run_in_executor(cls._get_executor(), cls._load_repos, [repo_file], False)
+
+    @classmethod
+    async def load_repos_async(cls, repo_files: List[str], parallel: Optional[bool] = None) -> int:
+        """
+        Load several RDF triplet repos in the executor, see
+        UnitFactory.load_repos().
+
+        :param repo_files: The paths to the RDF triplet repos
+        :param parallel: True to parse the repos in a process pool, False to
+                         parse them in the executor, or None to use the
+                         setting of UnitFactory.set_parallel_loading()
+        :return: The number of triplets loaded
+        """
+        await cls.ready()
+
+        loop = asyncio.get_running_loop()
+
+        return await loop.run_in_executor(cls._get_executor(), cls._load_repos, repo_files, parallel)
+
+    @staticmethod
+    def _warm_up() -> WarmUpInfo:
+        """
+        Helper function to warm up the factory in the executor.
+        """
+        return UnitFactory.warm_up(background=False).result()
+
+    @staticmethod
+    def _load_repos(repo_files: List[str], parallel: Optional[bool]) -> int:
+        """
+        Helper function to load repos in the executor, and to build the
+        tables of the new snapshot before lookups need them.
+
+        A single repo is loaded with UnitFactory.load_repo(), so that it's
+        read like a repo loaded in place.
+        """
+        if len(repo_files) == 1 and not parallel:
+            triple_count = UnitFactory.load_repo(repo_files[0])
+        else:
+            triple_count = UnitFactory.load_repos(repo_files, parallel)
+
+        UnitFactory._get_instance()._build_tables()
+
+        return triple_count
+
+    @classmethod
+    async def get_unit(cls, resource_iri: str) -> Unit:
+        """
+        Get a unit by its resource IRI, see UnitFactory.get_unit().
+
+        :param resource_iri: The unit's resource IRI or compact IRI
+        :return: The unit
+        """
+        await cls.ready()
+
+        return UnitFactory.get_unit(resource_iri)
+
+    @classmethod
+    async def get_units(cls, type_iri: str, include_subtypes: bool = False) -> List[Unit]:
+        """
+        Get the units of a unit type, see UnitFactory.get_units().
+
+        :param type_iri: The IRI or compact IRI of the unit type
+        :param include_subtypes: True to include the units of the subclasses
+                                 of the type, recursively
+        :return: The list of units, or empty if none match the specified type
+        """
+        await cls.ready()
+
+        return UnitFactory.get_units(type_iri, include_subtypes)
+
+    @classmethod
+    async def get_iris(cls, type_iri: str, include_subtypes: bool = False) -> List[str]:
+        """
+        Get the unit IRIs of a unit type, see UnitFactory.get_iris().
+
+        :param type_iri: The IRI or compact IRI of the unit type
+        :param include_subtypes: True to include the units of the subclasses
+                                 of the type, recursively
+        :return: The list of unit IRIs, or empty if none match the specified
+                 type
+        """
+        await cls.ready()
+
+        return UnitFactory.get_iris(type_iri, include_subtypes)
+
+    @classmethod
+    async def find_units(
+            cls,
+            abbreviation: str,
+            ignore_case: bool = False,
+            normalize_whitespace: bool = False,
+            prefixes: bool = False,
+    ) -> List[Unit]:
+        """
+        Get units by their abbreviation, see UnitFactory.find_units().
+
+        :param abbreviation: The unit abbreviation, e.g. 'nM'
+        :param ignore_case: True to match the abbreviation case-insensitively
+        :param normalize_whitespace: True to ignore leading, trailing and
+                                     repeated whitespace
+        :param prefixes: True to synthesize prefixed units if no units match
+        :return: The list of units, or empty if no units matched the abbreviation
+        """
+        await cls.ready()
+
+        return UnitFactory.find_units(abbreviation, ignore_case, normalize_whitespace, prefixes)
+
+    @classmethod
+    async def find_units_by_symbol(
+            cls,
+            symbol: str,
+            ignore_case: bool = False,
+            normalize_whitespace: bool = False,
+            prefixes: bool = False,
+    ) -> List[Unit]:
+        """
+        Get units by their symbol, see UnitFactory.find_units_by_symbol().
+
+        :param symbol: The unit symbol, e.g. 'nmol/dm^3'
+        :param ignore_case: True to match the symbol case-insensitively
+        :param normalize_whitespace: True to ignore leading, trailing and
+                                     repeated whitespace
+        :param prefixes: True to synthesize prefixed units if no units match
+        :return: The list of units, or empty if no units matched the symbol
+        """
+        await cls.ready()
+
+        return UnitFactory.find_units_by_symbol(symbol, ignore_case, normalize_whitespace, prefixes)
+
+    @classmethod
+    async def find_units_by_label(
+            cls,
+            label: str,
+            ignore_case: bool = False,
+            normalize_whitespace: bool = False,
+            prefixes: bool = False,
+    ) -> List[Unit]:
+        """
+        Get units by their label, see UnitFactory.find_units_by_label().
+
+        :param label: The unit label, e.g. 'Nanomolar'
+        :param ignore_case: True to match the label case-insensitively
+        :param normalize_whitespace: True to ignore leading, trailing and
+                                     repeated whitespace
+        :param prefixes: True to synthesize prefixed units if no units match
+        :return: The list of units, or empty if no units matched the label
+        """
+        await cls.ready()
+
+        return UnitFactory.find_units_by_label(label, ignore_case, normalize_whitespace, prefixes)
+
+    @classmethod
+    async def get_prefixed_unit(cls, prefix: str, resource_iri: str) -> Unit:
+        """
+        Get a unit with an SI or binary prefix, see
+        UnitFactory.get_prefixed_unit().
+
+        :param prefix: The symbol or label of the prefix, e.g. 'a' or 'Atto'
+        :param resource_iri: The resource IRI or compact IRI of the unit to
+                             prefix
+        :return: The prefixed unit
+        :raises ValueError: If the prefix is unknown, or the unit is a prefix
+                            or has an offset
+        """
+        await cls.ready()
+
+        return UnitFactory.get_prefixed_unit(prefix, resource_iri)
+
+    @classmethod
+    async def parse_unit(cls, expression: str) -> Unit:
+        """
+        Get the unit of a composite unit expression, see
+        UnitFactory.parse_unit().
+
+        :param expression: The unit expression, e.g. 'mg/dL'
+        :return: The unit
+        :raises ValueError: If the expression is invalid or contains an
+                            unknown unit name
+        """
+        await cls.ready()
+
+        return UnitFactory.parse_unit(expression)
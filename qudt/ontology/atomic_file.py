@@ -0,0 +1,49 @@
+################################################################################
+#
+#  Copyright (C) 2019 Garrett Brown
+#  This file is part of pyqudt - https://github.com/eigendude/pyqudt
+#
+#  pyqudt is derived from jQUDT
+#  Copyright (C) 2012-2013  Egon Willighagen <egonw@users.sf.net>
+#
+#  SPDX-License-Identifier: BSD-3-Clause
+#  See the file LICENSE for more information.
+#
+################################################################################
+
+
+import os
+import tempfile
+
+
+class AtomicFile(object):
+    """
+    Helpers to write files shared between processes.
+    """
+
+    @staticmethod
+    def write(data: bytes, path: str) -> None:
+        """
+        Write a file, replacing it atomically.
+
+        The data is written to a temporary file in the same directory first,
+        so that readers, including other processes, never see a
+        partially-written file.
+
+        :param data: The contents of the file
+        :param path: The path of the file to write
+        """
+        temp_fd, temp_path = tempfile.mkstemp(
+            dir=os.path.dirname(os.path.abspath(path)),
+            suffix='.tmp',
+        )
+        try:
+            with os.fdopen(temp_fd, 'wb') as file:
+                file.write(data)
+
+            # mkstemp() creates the file readable only by the owner
+            os.chmod(temp_path, 0o644)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
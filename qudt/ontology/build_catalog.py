@@ -0,0 +1,54 @@
+################################################################################
+#
+#  Copyright (C) 2019 Garrett Brown
+#  This file is part of pyqudt - https://github.com/eigendude/pyqudt
+#
+#  pyqudt is derived from jQUDT
+#  Copyright (C) 2012-2013  Egon Willighagen <egonw@users.sf.net>
+#
+#  SPDX-License-Identifier: BSD-3-Clause
+#  See the file LICENSE for more information.
+#
+################################################################################
+
+#
+# Compile the bundled RDF triplet repositories into a precompiled catalog.
+#
+# Usage:
+#
+#   python3 -m qudt.ontology.build_catalog [catalog_path]
+#       [--mapped-catalog mapped_catalog_path]
+#
+# Without arguments, both the precompiled catalog and the memory-mapped
+# catalog are written next to the bundled repositories.
+#
+
+from qudt.ontology.unit_factory import UnitFactory
+
+import argparse
+import sys
+from typing import List
+from typing import Optional
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Compile the bundled unit repositories into catalogs.')
+    parser.add_argument('catalog_path', nargs='?', help='The path of the precompiled catalog to write')
+    parser.add_argument('--mapped-catalog', help='The path of the memory-mapped catalog to write')
+
+    args = parser.parse_args(argv)
+
+    statement_count = UnitFactory.build_catalog(args.catalog_path)
+
+    print(f'Compiled {statement_count} statements')
+
+    if args.mapped_catalog or not args.catalog_path:
+        statement_count = UnitFactory.build_mapped_catalog(args.mapped_catalog)
+
+        print(f'Compiled {statement_count} statements into the memory-mapped catalog')
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,53 @@
+################################################################################
+#
+#  Copyright (C) 2019 Garrett Brown
+#  This file is part of pyqudt - https://github.com/eigendude/pyqudt
+#
+#  pyqudt is derived from jQUDT
+#  Copyright (C) 2012-2013  Egon Willighagen <egonw@users.sf.net>
+#
+#  SPDX-License-Identifier: BSD-3-Clause
+#  See the file LICENSE for more information.
+#
+################################################################################
+
+import functools
+import hashlib
+import importlib.util
+from typing import Tuple
+
+
+class CodeStamp(object):
+    """
+    Helpers to stamp cached files with the code that computed them, so that
+    files written by other versions of the code are considered stale.
+    """
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def get_digest(module_names: Tuple[str, ...]) -> bytes:
+        """
+        Get the digest of the source of the given modules, which doesn't
+        change while the process runs.
+
+        :param module_names: The names of the modules, e.g.
+                             'qudt.ontology.ontology_reader'
+        :return: The SHA-256 digest of the module names and sources
+        """
+        digest = hashlib.sha256()
+
+        for module_name in module_names:
+            digest.update(module_name.encode('utf-8'))
+
+            spec = importlib.util.find_spec(module_name)
+            origin = spec.origin if spec is not None else None
+
+            try:
+                if origin is None:
+                    raise FileNotFoundError(module_name)
+                with open(origin, 'rb') as file:
+                    digest.update(hashlib.sha256(file.read()).digest())
+            except OSError:
+                digest.update(b'\0')
+
+        return digest.digest()
@@ -0,0 +1,319 @@
+################################################################################
+#
+#  Copyright (C) 2019 Garrett Brown
+#  This file is part of pyqudt - https://github.com/eigendude/pyqudt
+#
+#  pyqudt is derived from jQUDT
+#  Copyright (C) 2012-2013  Egon Willighagen <egonw@users.sf.net>
+#
+#  SPDX-License-Identifier: BSD-3-Clause
+#  See the file LICENSE for more information.
+#
+################################################################################
+
+from qudt.ontology.ontology_index import NAME_PREDICATES
+from qudt.ontology.ontology_index import OntologyIndex
+from qudt.ontology.ontology_index import Statement
+from qudt.ontology.qudt import QUDT
+from qudt.ontology.rdf import RDF
+from qudt.ontology.rdfs import RDFS
+from qudt.dimension_vector import DimensionVector
+from qudt.multiplier import Multiplier
+from qudt.unit import Unit
+
+import array
+import sys
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+
+class CompactUnitTable(object):
+    """
+    A table of only the unit fields of the loaded statements.
+
+    Instead of every statement, the table keeps the label, abbreviation,
+    symbol, types, multiplier, offset and dimension vector of each subject in
+    parallel columns indexed by integer IDs, and indexes the names and types
+    by ID. Subclasses are indexed too, for enumerating the units of a type
+    and its subtypes. All other statements, such as descriptions and codes,
+    are dropped.
+
+    Statements are applied in the order they are added, so later values
+    replace earlier ones, like when a unit is created from its statements.
+    Multipliers, offsets and dimension vectors that can't be parsed are
+    ignored.
+    """
+
+    def __init__(self, ignore_type: Callable[[str], bool]):
+        """
+        Create an empty table.
+
+        :param ignore_type: The function checking if a type IRI is ignored
+                            when choosing the type of a unit
+        """
+        self._ignore_type = ignore_type
+
+        # Subject IRI -> ID
+        self._ids: Dict[str, int] = dict()
+
+        # Columns, by ID
+        self._iris: List[str] = list()
+        self._labels: List[str] = list()
+        self._abbreviations: List[str] = list()
+        self._symbols: List[str] = list()
+        self._type_iris: List[str] = list()
+        self._all_type_iris: List[Tuple[str, ...]] = list()
+        self._multipliers: 'array.array[float]' = array.array('d')
+        self._offsets: 'array.array[float]' = array.array('d')
+        self._dimension_vectors: List[Optional[DimensionVector]] = list()
+
+        # Name predicate IRI -> name -> list of IDs
+        self._names: Dict[str, Dict[str, List[int]]] = {
+            predicate: dict() for predicate in NAME_PREDICATES
+        }
+
+        # Normalized names, built on demand
+        # (predicate IRI, ignore case, normalize whitespace) -> name -> list of IDs
+        self._normalized_names: Dict[Tuple[str, bool, bool], Dict[str, List[int]]] = dict()
+
+        # Type IRI -> list of IDs
+        self._types: Dict[str, List[int]] = dict()
+
+        # Type IRI -> list of subclass IDs
+        self._subclasses: Dict[str, List[int]] = dict()
+
+    def __len__(self) -> int:
+        """
+        Get the number of subjects in the table.
+        """
+        return len(self._iris)
+
+    def copy(self) -> 'CompactUnitTable':
+        """
+        Create a copy of the table that can be extended without affecting
+        this table.
+
+        :return: The copy
+        """
+        table = CompactUnitTable(self._ignore_type)
+
+        table._ids = dict(self._ids)
+        table._iris = list(self._iris)
+        table._labels = list(self._labels)
+        table._abbreviations = list(self._abbreviations)
+        table._symbols = list(self._symbols)
+        table._type_iris = list(self._type_iris)
+        table._all_type_iris = list(self._all_type_iris)
+        table._multipliers = array.array('d', self._multipliers)
+        table._offsets = array.array('d', self._offsets)
+        table._dimension_vectors = list(self._dimension_vectors)
+        table._names = {
+            predicate: {name: list(ids) for (name, ids) in names.items()}
+            for (predicate, names) in self._names.items()
+        }
+        table._types = {
+            type_iri: list(ids) for (type_iri, ids) in self._types.items()
+        }
+        table._subclasses = {
+            type_iri: list(ids) for (type_iri, ids) in self._subclasses.items()
+        }
+
+        return table
+
+    def add_statements(self, statements: Iterable[Statement]) -> None:
+        """
+        Add the unit fields of a sequence of statements.
+
+        :param statements: The statements
+        """
+        for (subject, predicate, obj) in statements:
+            self.add_statement(subject, predicate, obj)
+
+    def add_statement(self, subject: str, predicate: str, obj: str) -> None:
+        """
+        Add a single statement, if it is about a unit field.
+
+        :param subject: The subject IRI
+        :param predicate: The predicate IRI
+        :param obj: The object, as an IRI or literal string
+        """
+        if predicate == RDF.TYPE:
+            unit_id = self._get_id(subject)
+            self._types.setdefault(sys.intern(obj), []).append(unit_id)
+            self._all_type_iris[unit_id] += (sys.intern(obj),)
+            if not self._ignore_type(obj):
+                self._type_iris[unit_id] = sys.intern(obj)
+        elif predicate in self._names:
+            unit_id = self._get_id(subject)
+            if predicate == QUDT.SYMBOL:
+                self._symbols[unit_id] = obj
+            elif predicate == QUDT.ABBREVIATION:
+                self._abbreviations[unit_id] = obj
+            elif predicate == RDFS.LABEL:
+                self._labels[unit_id] = obj
+            self._names[predicate].setdefault(obj, []).append(unit_id)
+            self._normalized_names.clear()
+        elif predicate == QUDT.CONVERSION_MULTIPLIER:
+            try:
+                multiplier = float(obj)
+            except ValueError:
+                return
+            self._multipliers[self._get_id(subject)] = multiplier
+        elif predicate == QUDT.CONVERSION_OFFSET:
+            try:
+                offset = float(obj)
+            except ValueError:
+                return
+            self._offsets[self._get_id(subject)] = offset
+        elif predicate == RDFS.SUB_CLASS_OF:
+            self._subclasses.setdefault(sys.intern(obj), []).append(self._get_id(subject))
+        elif predicate == QUDT.HAS_DIMENSION_VECTOR:
+            try:
+                dimension_vector = DimensionVector.from_iri(obj)
+            except ValueError:
+                return
+            self._dimension_vectors[self._get_id(subject)] = dimension_vector
+
+    def get_unit(self, resource_iri: str) -> Optional[Unit]:
+        """
+        Create a unit from its row in the table.
+
+        :param resource_iri: The unit's resource IRI
+        :return: The unit, or None if the table has no fields for the IRI
+        """
+        unit_id = self._ids.get(resource_iri)
+        if unit_id is None:
+            return None
+
+        return Unit(
+            resource_iri=resource_iri,
+            label=self._labels[unit_id],
+            abbreviation=self._abbreviations[unit_id],
+            symbol=self._symbols[unit_id],
+            type_iri=self._type_iris[unit_id],
+            multiplier=Multiplier(
+                offset=self._offsets[unit_id],
+                multiplier=self._multipliers[unit_id],
+            ),
+            dimension_vector=self._get_dimension_vector(unit_id),
+        )
+
+    def get_subjects_by_name(
+            self,
+            predicate: str,
+            name: str,
+            ignore_case: bool = False,
+            normalize_whitespace: bool = False,
+    ) -> List[str]:
+        """
+        Get the subjects with the given name.
+
+        When matching loosely, subjects that match the name exactly are
+        returned first.
+
+        :param predicate: The IRI of the name's predicate, one of NAME_PREDICATES
+        :param name: The name, e.g. 'nM'
+        :param ignore_case: True to match the name case-insensitively
+        :param normalize_whitespace: True to ignore leading and trailing
+                                     whitespace, and to treat runs of
+                                     whitespace as a single space
+        :return: The list of subject IRIs, or empty if none match
+        """
+        exact_ids: List[int] = self._names[predicate].get(name, [])
+
+        ids = exact_ids
+
+        if ignore_case or normalize_whitespace:
+            normalized_names = self._get_normalized_names(predicate, ignore_case, normalize_whitespace)
+
+            normalized_ids: List[int] = normalized_names.get(
+                OntologyIndex.normalize_name(name, ignore_case, normalize_whitespace),
+                [],
+            )
+
+            ids = exact_ids + [unit_id for unit_id in normalized_ids if unit_id not in exact_ids]
+
+        return [self._iris[unit_id] for unit_id in ids]
+
+    def get_subjects_by_type(self, type_iri: str) -> List[str]:
+        """
+        Get the subjects with the given RDF type.
+
+        :param type_iri: The IRI of the type
+        :return: The list of subject IRIs, or empty if none match
+        """
+        return [self._iris[unit_id] for unit_id in self._types.get(type_iri, [])]
+
+    def get_subclasses(self, type_iri: str) -> List[str]:
+        """
+        Get the direct subclasses of a type.
+
+        :param type_iri: The IRI of the type
+        :return: The list of subclass IRIs, or empty if none match
+        """
+        return [self._iris[type_id] for type_id in self._subclasses.get(type_iri, [])]
+
+    def _get_id(self, subject: str) -> int:
+        """
+        Helper function to get the ID of a subject, adding a row for it if
+        needed.
+        """
+        unit_id = self._ids.get(subject)
+
+        if unit_id is None:
+            unit_id = len(self._iris)
+            self._ids[subject] = unit_id
+            self._iris.append(subject)
+            self._labels.append('')
+            self._abbreviations.append('')
+            self._symbols.append('')
+            self._type_iris.append('')
+            self._all_type_iris.append(())
+            self._multipliers.append(1.0)
+            self._offsets.append(0.0)
+            self._dimension_vectors.append(None)
+
+        return unit_id
+
+    def _get_dimension_vector(self, unit_id: int) -> Optional[DimensionVector]:
+        """
+        Helper function to get the dimension vector of a unit, which is its
+        own, or else that of its type or the first of its other types that has
+        one.
+        """
+        dimension_vector = self._dimension_vectors[unit_id]
+
+        if dimension_vector is None:
+            for type_iri in (self._type_iris[unit_id],) + self._all_type_iris[unit_id]:
+                type_id = self._ids.get(type_iri)
+                if type_id is not None and self._dimension_vectors[type_id] is not None:
+                    return self._dimension_vectors[type_id]
+
+        return dimension_vector
+
+    def _get_normalized_names(
+            self,
+            predicate: str,
+            ignore_case: bool,
+            normalize_whitespace: bool,
+    ) -> Dict[str, List[int]]:
+        """
+        Helper function to get the names of a predicate, indexed by their
+        normalized form.
+        """
+        key = (predicate, ignore_case, normalize_whitespace)
+
+        normalized_names = self._normalized_names.get(key)
+
+        if normalized_names is None:
+            normalized_names = dict()
+            for (name, ids) in self._names[predicate].items():
+                normalized_name = OntologyIndex.normalize_name(name, ignore_case, normalize_whitespace)
+                normalized_names.setdefault(normalized_name, []).extend(ids)
+            self._normalized_names[key] = normalized_names
+
+        return normalized_names
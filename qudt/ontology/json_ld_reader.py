@@ -0,0 +1,228 @@
+################################################################################
+#
+#  Copyright (C) 2019 Garrett Brown
+#  This file is part of pyqudt - https://github.com/eigendude/pyqudt
+#
+#  pyqudt is derived from jQUDT
+#  Copyright (C) 2012-2013  Egon Willighagen <egonw@users.sf.net>
+#
+#  SPDX-License-Identifier: BSD-3-Clause
+#  See the file LICENSE for more information.
+#
+################################################################################
+
+import rdflib
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+
+# Type definitions
+Triple = Tuple[rdflib.term.Node, rdflib.term.Node, rdflib.term.Node]
+
+# Characters that a prefix's IRI must end with for it to be used in compact
+# IRIs, following JSON-LD 1.1
+GEN_DELIMS = ':/?#[]@'
+
+
+class UnsupportedDocumentError(Exception):
+    """
+    Raised when a JSON-LD document uses features that the fast path doesn't
+    handle.
+    """
+    pass
+
+
+class JsonLdReader(object):
+    """
+    A reader for compacted JSON-LD documents with a flat shape.
+
+    The QUDT and Open PHACTS repositories consist of a single @context of
+    prefixes and term aliases, and a @graph of nodes with IRIs, literals and
+    references. Documents of that shape can be turned into triples directly,
+    without expanding them with pyld and parsing the expanded document again.
+
+    Anything else, such as nested contexts, typed terms, lists or blank nodes,
+    is left to pyld.
+    """
+
+    def __init__(self, context: Any):
+        """
+        Create a reader for a document's @context.
+
+        :param context: The @context of the document
+        :raises UnsupportedDocumentError: If the context isn't a flat mapping
+                                          of terms to IRIs
+        """
+        if not isinstance(context, dict):
+            raise UnsupportedDocumentError('Context is not a mapping')
+
+        for (term, iri) in context.items():
+            if not isinstance(iri, str) or term.startswith('@') or iri.startswith('@'):
+                raise UnsupportedDocumentError(f'Unsupported term definition: {term}')
+
+        self._context: Dict[str, str] = context
+
+        # Term -> expanded IRI
+        self._terms: Dict[str, str] = dict()
+
+        # Prefix -> expanded IRI
+        self._prefixes: Dict[str, str] = dict()
+
+        for term in context:
+            iri = self._expand_term_definition(term, [])
+            self._terms[term] = iri
+            if iri.endswith(tuple(GEN_DELIMS)):
+                self._prefixes[term] = iri
+
+    @classmethod
+    def read_triples(cls, document: Any) -> Optional[List[Triple]]:
+        """
+        Get the triples of a compacted JSON-LD document.
+
+        :param document: The parsed JSON document
+        :return: The triples, or None if the document doesn't have a flat
+                 shape and must be expanded by pyld instead
+        """
+        if not isinstance(document, dict) or set(document) != {'@context', '@graph'}:
+            return None
+
+        try:
+            reader = cls(document['@context'])
+            return reader._get_triples(document['@graph'])
+        except UnsupportedDocumentError:
+            return None
+
+    def expand_iri(self, value: str, vocab: bool) -> str:
+        """
+        Expand a term, compact IRI or absolute IRI.
+
+        :param value: The value to expand
+        :param vocab: True if terms are expanded, as for properties and types,
+                      or False if only compact IRIs are, as for node IDs
+        :return: The absolute IRI
+        :raises UnsupportedDocumentError: If the value isn't a string, or is a
+                                          blank node or a relative IRI
+        """
+        if not isinstance(value, str):
+            raise UnsupportedDocumentError(f'Unsupported IRI: {value}')
+
+        if vocab:
+            iri = self._terms.get(value)
+            if iri is not None:
+                return iri
+
+        (prefix, colon, suffix) = value.partition(':')
+
+        if not colon or prefix == '_':
+            raise UnsupportedDocumentError(f'Unsupported IRI: {value}')
+
+        if not suffix.startswith('//'):
+            prefix_iri = self._prefixes.get(prefix)
+            if prefix_iri is not None:
+                return prefix_iri + suffix
+
+        return value
+
+    def _expand_term_definition(self, term: str, active: List[str]) -> str:
+        """
+        Helper function to expand the IRI of a term, which may itself be a
+        compact IRI or another term.
+        """
+        if term in active:
+            raise UnsupportedDocumentError(f'Cyclic term definition: {term}')
+
+        value = self._context[term]
+
+        (prefix, colon, suffix) = value.partition(':')
+
+        if not colon or prefix == '_':
+            raise UnsupportedDocumentError(f'Unsupported term definition: {term}')
+
+        if prefix in self._context and prefix != term and not suffix.startswith('//'):
+            prefix_iri = self._expand_term_definition(prefix, active + [term])
+            if not prefix_iri.endswith(tuple(GEN_DELIMS)):
+                raise UnsupportedDocumentError(f'Unsupported term definition: {term}')
+            return prefix_iri + suffix
+
+        return value
+
+    def _get_triples(self, graph: Any) -> List[Triple]:
+        """
+        Helper function to get the triples of the nodes in a @graph.
+        """
+        if not isinstance(graph, list):
+            graph = [graph]
+
+        triples: List[Triple] = list()
+
+        for node in graph:
+            if not isinstance(node, dict):
+                raise UnsupportedDocumentError('Node is not an object')
+
+            node_id = node.get('@id')
+            if not isinstance(node_id, str):
+                raise UnsupportedDocumentError('Node has no IRI')
+
+            subject = rdflib.URIRef(self.expand_iri(node_id, vocab=False))
+
+            for (key, values) in node.items():
+                if key == '@id':
+                    continue
+
+                if not isinstance(values, list):
+                    values = [values]
+
+                if key == '@type':
+                    for type_name in values:
+                        if not isinstance(type_name, str):
+                            raise UnsupportedDocumentError(f'Unsupported type: {type_name}')
+                        triples.append((subject, rdflib.RDF.type, rdflib.URIRef(self.expand_iri(type_name, vocab=True))))
+                    continue
+
+                if key.startswith('@'):
+                    raise UnsupportedDocumentError(f'Unsupported keyword: {key}')
+
+                predicate = rdflib.URIRef(self.expand_iri(key, vocab=True))
+
+                for value in values:
+                    obj = self._get_object(value)
+                    if obj is not None:
+                        triples.append((subject, predicate, obj))
+
+        # Like a graph, only keep one copy of repeated triples
+        return list(dict.fromkeys(triples))
+
+    def _get_object(self, value: Any) -> Optional[rdflib.term.Node]:
+        """
+        Helper function to get the object of a property value, or None if the
+        value is null.
+        """
+        if value is None:
+            return None
+
+        if isinstance(value, (str, bool, int, float)):
+            return rdflib.Literal(value)
+
+        if not isinstance(value, dict):
+            raise UnsupportedDocumentError(f'Unsupported value: {value}')
+
+        keys = set(value)
+
+        if keys == {'@id'}:
+            return rdflib.URIRef(self.expand_iri(value['@id'], vocab=False))
+
+        literal = value.get('@value')
+
+        if keys == {'@value'}:
+            return self._get_object(literal)
+
+        if keys == {'@value', '@type'} and isinstance(literal, str) and isinstance(value['@type'], str):
+            return rdflib.Literal(literal, datatype=rdflib.URIRef(self.expand_iri(value['@type'], vocab=True)))
+
+        if keys == {'@value', '@language'} and isinstance(literal, str) and isinstance(value['@language'], str):
+            return rdflib.Literal(literal, lang=value['@language'])
+
+        raise UnsupportedDocumentError(f'Unsupported value: {value}')
@@ -0,0 +1,591 @@
+################################################################################
+#
+#  Copyright (C) 2019 Garrett Brown
+#  This file is part of pyqudt - https://github.com/eigendude/pyqudt
+#
+#  pyqudt is derived from jQUDT
+#  Copyright (C) 2012-2013  Egon Willighagen <egonw@users.sf.net>
+#
+#  SPDX-License-Identifier: BSD-3-Clause
+#  See the file LICENSE for more information.
+#
+################################################################################
+
+from qudt.ontology.ontology_index import NAME_PREDICATES
+from qudt.ontology.ontology_index import OntologyIndex
+from qudt.ontology.ontology_index import Property
+from qudt.ontology.ontology_index import Statement
+from qudt.ontology.ontology_reader import OntologyReader
+from qudt.ontology.atomic_file import AtomicFile
+from qudt.ontology.code_stamp import CodeStamp
+from qudt.ontology.rdf import RDF
+from qudt.ontology.rdfs import RDFS
+from qudt.ontology.unit_catalog import UnitCatalog
+from qudt.dimension_vector import DimensionVector
+from qudt.multiplier import Multiplier
+from qudt.unit import Unit
+
+import functools
+import hashlib
+import mmap
+import struct
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+
+# Identifies a memory-mapped catalog
+MAGIC = b'PYQUDTMC'
+
+# Bump this when the layout of the catalog changes
+MAPPED_CATALOG_VERSION = 3
+
+# The modules whose code computes the contents of the catalog, such as the
+# fields of unit records. Their source is part of the stamp, so catalogs
+# built by other versions of the code are considered stale.
+STAMPED_MODULES = [
+    'qudt.dimension_vector',
+    'qudt.ontology.json_ld_reader',
+    'qudt.ontology.mapped_catalog',
+    'qudt.ontology.ontology_index',
+    'qudt.ontology.ontology_reader',
+    'qudt.ontology.unit_factory',
+]
+
+# The layout of the catalog, in little-endian byte order:
+#
+#   Header: magic, version, stamp of the repositories, format and code
+#   Section table: (byte offset, item count) of each section
+#   Sections, each aligned to 8 bytes:
+#     String offsets: the start of each string, plus the end of the last one
+#     String data: UTF-8 encoded strings
+#     Records: one per subject, sorted by subject IRI
+#     Statements: (predicate, object) string IDs, grouped by subject
+#     Name entries: (name, record, ordinal), one table per name predicate,
+#                   sorted by name
+#     Type entries: (type, record, ordinal), sorted by type
+#     Subclass entries: (superclass, record, ordinal), sorted by superclass
+#
+# Strings are compared by their UTF-8 encoding, which sorts like the decoded
+# strings. Ordinals are the positions of the statements in the repositories,
+# which keep lookups in the order that the statements were loaded.
+HEADER = struct.Struct('<8sI64s')
+SECTION = struct.Struct('<QQ')
+OFFSET = struct.Struct('<I')
+
+# Subject, first statement, statement count, flags, label, abbreviation,
+# symbol, type, multiplier, offset, dimension exponents
+RECORD = struct.Struct('<8I2d7bx')
+STATEMENT = struct.Struct('<2I')
+ENTRY = struct.Struct('<3I')
+
+# Record flags
+HAS_UNIT = 1 << 0
+HAS_DIMENSION_VECTOR = 1 << 1
+
+# The range of the dimension exponents in a record
+EXPONENT_RANGE = range(-128, 128)
+
+# The sections, in the order they are stored
+SECTION_COUNT = 4 + len(NAME_PREDICATES) + 2
+(STRING_OFFSETS, STRING_DATA, RECORDS, STATEMENTS) = range(4)
+NAME_ENTRIES = {
+    predicate: 4 + i for (i, predicate) in enumerate(NAME_PREDICATES)
+}
+TYPE_ENTRIES = SECTION_COUNT - 2
+SUBCLASS_ENTRIES = SECTION_COUNT - 1
+
+# Alignment of the sections, in bytes
+ALIGNMENT = 8
+
+
+class MappedCatalog(object):
+    """
+    A read-only catalog of units that is memory-mapped instead of loaded.
+
+    The catalog is a flat file of string tables and fixed-width records, so
+    lookups read it in place. Processes that map the same catalog share one
+    copy of its pages, e.g. the workers of a pre-forking server.
+
+    Besides the statements about each subject, the records contain the fields
+    of the unit they describe, so units can be created without scanning their
+    statements.
+    """
+
+    def __init__(self, buffer: mmap.mmap):
+        """
+        Create a catalog over a mapped file. Use open() to map and validate
+        a catalog.
+
+        :param buffer: The mapped file
+        """
+        self._buffer = buffer
+
+        self._sections: List[Tuple[int, int]] = [
+            SECTION.unpack_from(buffer, HEADER.size + i * SECTION.size) for i in range(SECTION_COUNT)
+        ]
+
+        # Names by predicate, in the order they were loaded, built on demand
+        self._names: Dict[str, Dict[str, List[str]]] = dict()
+
+    def __len__(self) -> int:
+        """
+        Get the number of subjects in the catalog.
+        """
+        return self._sections[RECORDS][1]
+
+    @classmethod
+    def build(
+            cls,
+            catalog_path: str,
+            repo_paths: List[str],
+            create_unit: Callable[[OntologyIndex, str], Unit],
+    ) -> int:
+        """
+        Compile the given repositories into a memory-mapped catalog.
+
+        Repositories that don't exist are skipped.
+
+        :param catalog_path: The path of the catalog to write
+        :param repo_paths: The paths to the RDF triplet repositories
+        :param create_unit: The function creating the unit of a subject from
+                            the index of all statements
+        :return: The number of statements in the catalog
+        """
+        statements: List[Statement] = list()
+
+        for repo_path in repo_paths:
+            try:
+                statements.extend(OntologyReader.read_statements(repo_path))
+            except FileNotFoundError:
+                continue
+
+        index = OntologyIndex()
+        index.add_statements(statements)
+
+        # Intern the strings in the order they are first used
+        string_ids: Dict[str, int] = dict()
+
+        def get_string_id(string: str) -> int:
+            return string_ids.setdefault(string, len(string_ids))
+
+        encoded_strings: Dict[str, bytes] = dict()
+
+        def encode(string: str) -> bytes:
+            encoded = encoded_strings.get(string)
+            if encoded is None:
+                encoded = encoded_strings[string] = string.encode('utf-8')
+            return encoded
+
+        # Group the statements by subject
+        subject_statements: Dict[str, List[Tuple[int, str, str]]] = dict()
+        for (ordinal, (subject, predicate, obj)) in enumerate(statements):
+            subject_statements.setdefault(subject, []).append((ordinal, predicate, obj))
+
+        subjects = sorted(subject_statements, key=encode)
+        record_ids = {subject: i for (i, subject) in enumerate(subjects)}
+
+        records = bytearray()
+        statement_data = bytearray()
+        name_entries: Dict[str, List[Tuple[bytes, int, int, int]]] = {
+            predicate: list() for predicate in NAME_PREDICATES
+        }
+        type_entries: List[Tuple[bytes, int, int, int]] = list()
+        subclass_entries: List[Tuple[bytes, int, int, int]] = list()
+
+        statement_count = 0
+
+        for subject in subjects:
+            record_id = record_ids[subject]
+
+            for (ordinal, predicate, obj) in subject_statements[subject]:
+                statement_data += STATEMENT.pack(get_string_id(predicate), get_string_id(obj))
+
+                entry = (encode(obj), ordinal, get_string_id(obj), record_id)
+                if predicate in name_entries:
+                    name_entries[predicate].append(entry)
+                elif predicate == RDF.TYPE:
+                    type_entries.append(entry)
+                elif predicate == RDFS.SUB_CLASS_OF:
+                    subclass_entries.append(entry)
+
+            try:
+                unit: Optional[Unit] = create_unit(index, subject)
+            except ValueError:
+                # Leave invalid units to be created from the statements
+                unit = None
+
+            flags = 0
+            label = abbreviation = symbol = type_iri = ''
+            multiplier = 1.0
+            offset = 0.0
+            exponents: Tuple[int, ...] = (0,) * 7
+
+            if unit is not None:
+                flags |= HAS_UNIT
+                label = unit.label
+                abbreviation = unit.abbreviation
+                symbol = unit.symbol
+                type_iri = unit.type_iri
+                multiplier = unit.multiplier.multiplier
+                offset = unit.multiplier.offset
+
+                dimension_vector = unit.dimension_vector
+                if dimension_vector is not None:
+                    dimension_exponents = (
+                        dimension_vector.amount_of_substance,
+                        dimension_vector.electric_current,
+                        dimension_vector.length,
+                        dimension_vector.luminous_intensity,
+                        dimension_vector.mass,
+                        dimension_vector.temperature,
+                        dimension_vector.time,
+                    )
+                    # Vectors that don't fit leave the unit to be created
+                    # from the statements
+                    if all(exponent in EXPONENT_RANGE for exponent in dimension_exponents):
+                        flags |= HAS_DIMENSION_VECTOR
+                        exponents = dimension_exponents
+                    else:
+                        flags &= ~HAS_UNIT
+
+            records += RECORD.pack(
+                get_string_id(subject),
+                statement_count,
+                len(subject_statements[subject]),
+                flags,
+                get_string_id(label),
+                get_string_id(abbreviation),
+                get_string_id(symbol),
+                get_string_id(type_iri),
+                multiplier,
+                offset,
+                *exponents,
+            )
+
+            statement_count += len(subject_statements[subject])
+
+        # Pack the string table
+        string_offsets = bytearray()
+        string_data = bytearray()
+        for string in string_ids:
+            string_offsets += OFFSET.pack(len(string_data))
+            string_data += encode(string)
+        string_offsets += OFFSET.pack(len(string_data))
+
+        def pack_entries(entries: List[Tuple[bytes, int, int, int]]) -> bytes:
+            return b''.join(
+                ENTRY.pack(string_id, record_id, ordinal)
+                for (_, ordinal, string_id, record_id) in sorted(entries)
+            )
+
+        sections: List[Tuple[bytes, int]] = [
+            (bytes(string_offsets), len(string_ids) + 1),
+            (bytes(string_data), len(string_data)),
+            (bytes(records), len(subjects)),
+            (bytes(statement_data), statement_count),
+        ]
+        sections.extend(
+            (pack_entries(name_entries[predicate]), len(name_entries[predicate])) for predicate in NAME_PREDICATES
+        )
+        sections.append((pack_entries(type_entries), len(type_entries)))
+        sections.append((pack_entries(subclass_entries), len(subclass_entries)))
+
+        stamp = cls.get_stamp(repo_paths)
+
+        data = bytearray(HEADER.pack(MAGIC, MAPPED_CATALOG_VERSION, stamp))
+        data += bytes(SECTION.size * len(sections))
+
+        for (i, (section_data, count)) in enumerate(sections):
+            data += bytes(-len(data) % ALIGNMENT)
+            SECTION.pack_into(data, HEADER.size + i * SECTION.size, len(data), count)
+            data += section_data
+
+        AtomicFile.write(bytes(data), catalog_path)
+
+        return len(statements)
+
+    @classmethod
+    def open(cls, catalog_path: str, repo_paths: List[str]) -> Optional['MappedCatalog']:
+        """
+        Map a catalog into memory.
+
+        :param catalog_path: The path of the catalog to map
+        :param repo_paths: The paths to the RDF triplet repositories that the
+                           catalog is expected to be built from
+        :return: The catalog, or None if the catalog is missing or stale
+        """
+        try:
+            with open(catalog_path, 'rb') as file:
+                buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            # The file is missing or empty
+            return None
+
+        if len(buffer) < HEADER.size + SECTION_COUNT * SECTION.size:
+            buffer.close()
+            return None
+
+        (magic, version, stamp) = HEADER.unpack_from(buffer, 0)
+
+        if magic != MAGIC or version != MAPPED_CATALOG_VERSION:
+            buffer.close()
+            return None
+
+        if stamp != cls.get_stamp(repo_paths):
+            buffer.close()
+            return None
+
+        return cls(buffer)
+
+    @classmethod
+    def get_stamp(cls, repo_paths: List[str]) -> bytes:
+        """
+        Get the stamp identifying the contents of the given repositories, the
+        catalog format and the code computing the catalog.
+
+        :param repo_paths: The paths to the RDF triplet repositories
+        :return: The hex digest of the repositories, format and code
+        """
+        digest = hashlib.sha256()
+
+        digest.update(UnitCatalog.get_stamp(repo_paths).encode('ascii'))
+        digest.update(_get_code_stamp())
+
+        return digest.hexdigest().encode('ascii')
+
+    def close(self) -> None:
+        """
+        Unmap the catalog. It can't be used afterwards.
+        """
+        self._buffer.close()
+
+    def has_subject(self, subject: str) -> bool:
+        """
+        Check if the catalog contains statements about a subject.
+
+        :param subject: The subject IRI
+        :return: True if the subject is in the catalog, False otherwise
+        """
+        return self._find_record(subject) is not None
+
+    def get_unit(self, resource_iri: str) -> Optional[Unit]:
+        """
+        Get a unit from the fields in its record.
+
+        :param resource_iri: The unit's resource IRI
+        :return: The unit, or None if the unit must be created from its
+                 statements
+        """
+        record_id = self._find_record(resource_iri)
+        if record_id is None:
+            return None
+
+        record = self._get_record(record_id)
+
+        (_, _, _, flags, label, abbreviation, symbol, type_iri, multiplier, offset) = record[:10]
+
+        if not flags & HAS_UNIT:
+            return None
+
+        dimension_vector: Optional[DimensionVector] = None
+        if flags & HAS_DIMENSION_VECTOR:
+            dimension_vector = DimensionVector(*record[10:])
+
+        return Unit(
+            resource_iri=resource_iri,
+            label=self._get_string(label),
+            abbreviation=self._get_string(abbreviation),
+            symbol=self._get_string(symbol),
+            type_iri=self._get_string(type_iri),
+            multiplier=Multiplier(
+                offset=offset,
+                multiplier=multiplier,
+            ),
+            dimension_vector=dimension_vector,
+        )
+
+    def get_properties(self, subject: str) -> List[Property]:
+        """
+        Get the properties of a subject, in the order they were loaded.
+
+        :param subject: The subject IRI
+        :return: The list of (predicate, object) pairs, or empty if unknown
+        """
+        record_id = self._find_record(subject)
+        if record_id is None:
+            return []
+
+        (_, first_statement, statement_count) = self._get_record(record_id)[:3]
+
+        (position, _) = self._sections[STATEMENTS]
+        position += first_statement * STATEMENT.size
+
+        properties: List[Property] = list()
+        for (predicate, obj) in STATEMENT.iter_unpack(self._buffer[position:position + statement_count * STATEMENT.size]):
+            properties.append((self._get_string(predicate), self._get_string(obj)))
+
+        return properties
+
+    def get_subjects_by_name(self, predicate: str, name: str) -> List[str]:
+        """
+        Get the subjects with the given name.
+
+        :param predicate: The IRI of the name's predicate, one of NAME_PREDICATES
+        :param name: The name, e.g. 'nM'
+        :return: The list of subject IRIs, or empty if none match
+        """
+        return self._get_subjects_by_entry(NAME_ENTRIES[predicate], name)
+
+    def get_subjects_by_type(self, type_iri: str) -> List[str]:
+        """
+        Get the subjects with the given RDF type.
+
+        :param type_iri: The IRI of the type
+        :return: The list of subject IRIs, or empty if none match
+        """
+        return self._get_subjects_by_entry(TYPE_ENTRIES, type_iri)
+
+    def get_subclasses(self, type_iri: str) -> List[str]:
+        """
+        Get the direct subclasses of a type.
+
+        :param type_iri: The IRI of the type
+        :return: The list of subclass IRIs, or empty if none match
+        """
+        return self._get_subjects_by_entry(SUBCLASS_ENTRIES, type_iri)
+
+    def get_names(self, predicate: str) -> Dict[str, List[str]]:
+        """
+        Get all names of a predicate.
+
+        The mapping is built on first use and kept in memory.
+
+        :param predicate: The IRI of the names' predicate, one of
+                          NAME_PREDICATES
+        :return: The subject IRIs by name, in the order they were loaded
+        """
+        names = self._names.get(predicate)
+
+        if names is None:
+            entries = sorted(self._iter_entries(NAME_ENTRIES[predicate]), key=lambda entry: entry[2])
+
+            names = dict()
+            for (name, record_id, _) in entries:
+                names.setdefault(self._get_string(name), []).append(self._get_subject(record_id))
+
+            self._names[predicate] = names
+
+        return names
+
+    def _get_string(self, string_id: int) -> str:
+        """
+        Helper function to decode a string from the string table.
+        """
+        return self._get_string_bytes(string_id).decode('utf-8')
+
+    def _get_string_bytes(self, string_id: int) -> bytes:
+        """
+        Helper function to get the encoded bytes of a string.
+        """
+        (offsets, _) = self._sections[STRING_OFFSETS]
+        (data, _) = self._sections[STRING_DATA]
+
+        (start,) = OFFSET.unpack_from(self._buffer, offsets + string_id * OFFSET.size)
+        (end,) = OFFSET.unpack_from(self._buffer, offsets + (string_id + 1) * OFFSET.size)
+
+        return self._buffer[data + start:data + end]
+
+    def _get_record(self, record_id: int) -> Tuple:
+        """
+        Helper function to unpack a record.
+        """
+        (position, _) = self._sections[RECORDS]
+
+        return RECORD.unpack_from(self._buffer, position + record_id * RECORD.size)
+
+    def _get_subject(self, record_id: int) -> str:
+        """
+        Helper function to get the subject IRI of a record.
+        """
+        return self._get_string(self._get_record(record_id)[0])
+
+    def _find_record(self, subject: str) -> Optional[int]:
+        """
+        Helper function to find the record of a subject by binary search.
+        """
+        key = subject.encode('utf-8')
+
+        (position, count) = self._sections[RECORDS]
+
+        low = 0
+        high = count
+        while low < high:
+            middle = (low + high) // 2
+            (string_id,) = OFFSET.unpack_from(self._buffer, position + middle * RECORD.size)
+            if self._get_string_bytes(string_id) < key:
+                low = middle + 1
+            else:
+                high = middle
+
+        if low < count:
+            (string_id,) = OFFSET.unpack_from(self._buffer, position + low * RECORD.size)
+            if self._get_string_bytes(string_id) == key:
+                return low
+
+        return None
+
+    def _get_subjects_by_entry(self, section: int, value: str) -> List[str]:
+        """
+        Helper function to get the subjects of the entries with the given
+        value by binary search.
+        """
+        key = value.encode('utf-8')
+
+        (position, count) = self._sections[section]
+
+        def get_key(entry_id: int) -> bytes:
+            (string_id,) = OFFSET.unpack_from(self._buffer, position + entry_id * ENTRY.size)
+            return self._get_string_bytes(string_id)
+
+        low = 0
+        high = count
+        while low < high:
+            middle = (low + high) // 2
+            if get_key(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+
+        subjects: List[str] = list()
+
+        # Entries with the same value are sorted by ordinal
+        while low < count and get_key(low) == key:
+            (_, record_id, _) = ENTRY.unpack_from(self._buffer, position + low * ENTRY.size)
+            subjects.append(self._get_subject(record_id))
+            low += 1
+
+        return subjects
+
+    def _iter_entries(self, section: int) -> List[Tuple[int, int, int]]:
+        """
+        Helper function to unpack all entries of a section.
+        """
+        (position, count) = self._sections[section]
+
+        return list(ENTRY.iter_unpack(self._buffer[position:position + count * ENTRY.size]))
+
+
+@functools.lru_cache(maxsize=None)
+def _get_code_stamp() -> bytes:
+    """
+    Helper function to get the digest of the catalog format and the source of
+    the stamped modules, which doesn't change while the process runs.
+    """
+    digest = hashlib.sha256(MAGIC + MAPPED_CATALOG_VERSION.to_bytes(4, 'little'))
+
+    digest.update(CodeStamp.get_digest(tuple(STAMPED_MODULES)))
+
+    return digest.digest()
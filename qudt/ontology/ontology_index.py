@@ -0,0 +1,288 @@
+################################################################################
+#
+#  Copyright (C) 2019 Garrett Brown
+#  This file is part of pyqudt - https://github.com/eigendude/pyqudt
+#
+#  pyqudt is derived from jQUDT
+#  Copyright (C) 2012-2013  Egon Willighagen <egonw@users.sf.net>
+#
+#  SPDX-License-Identifier: BSD-3-Clause
+#  See the file LICENSE for more information.
+#
+################################################################################
+
+from qudt.ontology.qudt import QUDT
+from qudt.ontology.rdf import RDF
+from qudt.ontology.rdfs import RDFS
+
+from typing import TYPE_CHECKING
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+if TYPE_CHECKING:
+    from qudt.ontology.mapped_catalog import MappedCatalog
+
+
+# Type definitions
+Statement = Tuple[str, str, str]
+Property = Tuple[str, str]
+
+# The predicates of the names that units can be looked up by
+NAME_PREDICATES = [
+    QUDT.ABBREVIATION,
+    QUDT.SYMBOL,
+    RDFS.LABEL,
+]
+
+
+class OntologyIndex(object):
+    """
+    An in-memory index over the statements of RDF triplet repositories.
+
+    The index is built once when a repository is loaded, so that lookups by
+    subject, name or type don't need to scan every statement.
+
+    The index can be layered over a memory-mapped catalog, in which case the
+    statements of the catalog come before the indexed statements.
+    """
+
+    def __init__(self, base: Optional['MappedCatalog'] = None):
+        """
+        Create an empty index.
+
+        :param base: The catalog to layer the index over, or None
+        """
+        self.base: Optional['MappedCatalog'] = base
+
+        # Subject IRI -> list of (predicate, object)
+        self._properties: Dict[str, List[Property]] = dict()
+
+        # Name predicate IRI -> name -> list of subject IRIs
+        self._names: Dict[str, Dict[str, List[str]]] = {
+            predicate: dict() for predicate in NAME_PREDICATES
+        }
+
+        # Normalized names, built on demand
+        # (predicate IRI, ignore case, normalize whitespace) -> name -> list of subject IRIs
+        self._normalized_names: Dict[Tuple[str, bool, bool], Dict[str, List[str]]] = dict()
+
+        # Type IRI -> list of subject IRIs
+        self._types: Dict[str, List[str]] = dict()
+
+        # Type IRI -> list of subclass IRIs
+        self._subclasses: Dict[str, List[str]] = dict()
+
+    def __len__(self) -> int:
+        """
+        Get the number of indexed subjects.
+        """
+        if self.base is None:
+            return len(self._properties)
+
+        base = self.base
+
+        return len(base) + sum(1 for subject in self._properties if not base.has_subject(subject))
+
+    def copy(self) -> 'OntologyIndex':
+        """
+        Create a copy of the index that can be extended without affecting
+        this index.
+
+        :return: The copy
+        """
+        index = OntologyIndex(self.base)
+
+        index._properties = {
+            subject: list(properties) for (subject, properties) in self._properties.items()
+        }
+        index._names = {
+            predicate: {name: list(subjects) for (name, subjects) in names.items()}
+            for (predicate, names) in self._names.items()
+        }
+        index._types = {
+            type_iri: list(subjects) for (type_iri, subjects) in self._types.items()
+        }
+        index._subclasses = {
+            type_iri: list(subclasses) for (type_iri, subclasses) in self._subclasses.items()
+        }
+
+        return index
+
+    def add_statements(self, statements: Iterable[Statement]) -> None:
+        """
+        Index a sequence of statements.
+
+        :param statements: The statements
+        """
+        for (subject, predicate, obj) in statements:
+            self.add_statement(subject, predicate, obj)
+
+    def add_statement(self, subject: str, predicate: str, obj: str) -> None:
+        """
+        Index a single statement.
+
+        :param subject: The subject IRI
+        :param predicate: The predicate IRI
+        :param obj: The object, as an IRI or literal string
+        """
+        self._properties.setdefault(subject, []).append((predicate, obj))
+
+        names = self._names.get(predicate)
+        if names is not None:
+            names.setdefault(obj, []).append(subject)
+            self._normalized_names.clear()
+        elif predicate == RDF.TYPE:
+            self._types.setdefault(obj, []).append(subject)
+        elif predicate == RDFS.SUB_CLASS_OF:
+            self._subclasses.setdefault(obj, []).append(subject)
+
+    def get_properties(self, subject: str) -> List[Property]:
+        """
+        Get the properties of a subject, in the order they were indexed.
+
+        :param subject: The subject IRI
+        :return: The list of (predicate, object) pairs, or empty if unknown
+        """
+        properties = self._properties.get(subject, [])
+
+        if self.base is not None:
+            properties = self.base.get_properties(subject) + properties
+
+        return properties
+
+    def has_own_properties(self, subject: str) -> bool:
+        """
+        Check if any properties of a subject were indexed, rather than only
+        read from the base catalog.
+
+        :param subject: The subject IRI
+        :return: True if statements about the subject were indexed
+        """
+        return subject in self._properties
+
+    def get_subjects_by_abbreviation(self, abbreviation: str) -> List[str]:
+        """
+        Get the subjects with the given abbreviation.
+
+        :param abbreviation: The abbreviation, e.g. 'nM'
+        :return: The list of subject IRIs, or empty if none match
+        """
+        return self.get_subjects_by_name(QUDT.ABBREVIATION, abbreviation)
+
+    def get_subjects_by_name(
+            self,
+            predicate: str,
+            name: str,
+            ignore_case: bool = False,
+            normalize_whitespace: bool = False,
+    ) -> List[str]:
+        """
+        Get the subjects with the given name.
+
+        When matching loosely, subjects that match the name exactly are
+        returned first.
+
+        :param predicate: The IRI of the name's predicate, one of NAME_PREDICATES
+        :param name: The name, e.g. 'nM'
+        :param ignore_case: True to match the name case-insensitively
+        :param normalize_whitespace: True to ignore leading and trailing
+                                     whitespace, and to treat runs of
+                                     whitespace as a single space
+        :return: The list of subject IRIs, or empty if none match
+        """
+        exact_subjects: List[str] = self._names[predicate].get(name, [])
+
+        if self.base is not None:
+            exact_subjects = self.base.get_subjects_by_name(predicate, name) + exact_subjects
+
+        if not ignore_case and not normalize_whitespace:
+            return exact_subjects
+
+        normalized_names = self._get_normalized_names(predicate, ignore_case, normalize_whitespace)
+
+        normalized_subjects: List[str] = normalized_names.get(
+            self.normalize_name(name, ignore_case, normalize_whitespace),
+            [],
+        )
+
+        return exact_subjects + [
+            subject for subject in normalized_subjects if subject not in exact_subjects
+        ]
+
+    def get_subjects_by_type(self, type_iri: str) -> List[str]:
+        """
+        Get the subjects with the given RDF type.
+
+        :param type_iri: The IRI of the type
+        :return: The list of subject IRIs, or empty if none match
+        """
+        subjects = self._types.get(type_iri, [])
+
+        if self.base is not None:
+            subjects = self.base.get_subjects_by_type(type_iri) + subjects
+
+        return subjects
+
+    def get_subclasses(self, type_iri: str) -> List[str]:
+        """
+        Get the direct subclasses of a type.
+
+        :param type_iri: The IRI of the type
+        :return: The list of subclass IRIs, or empty if none match
+        """
+        subclasses = self._subclasses.get(type_iri, [])
+
+        if self.base is not None:
+            subclasses = self.base.get_subclasses(type_iri) + subclasses
+
+        return subclasses
+
+    @staticmethod
+    def normalize_name(name: str, ignore_case: bool, normalize_whitespace: bool) -> str:
+        """
+        Normalize a name for loose matching.
+
+        :param name: The name
+        :param ignore_case: True to fold the name's case
+        :param normalize_whitespace: True to strip the name and collapse runs
+                                     of whitespace into a single space
+        :return: The normalized name
+        """
+        if normalize_whitespace:
+            name = ' '.join(name.split())
+
+        if ignore_case:
+            name = name.casefold()
+
+        return name
+
+    def _get_normalized_names(
+            self,
+            predicate: str,
+            ignore_case: bool,
+            normalize_whitespace: bool,
+    ) -> Dict[str, List[str]]:
+        """
+        Helper function to get the names of a predicate, indexed by their
+        normalized form.
+        """
+        key = (predicate, ignore_case, normalize_whitespace)
+
+        normalized_names = self._normalized_names.get(key)
+
+        if normalized_names is None:
+            names = [self._names[predicate]]
+            if self.base is not None:
+                names.insert(0, self.base.get_names(predicate))
+
+            normalized_names = dict()
+            for layer in names:
+                for (name, subjects) in layer.items():
+                    normalized_name = self.normalize_name(name, ignore_case, normalize_whitespace)
+                    normalized_names.setdefault(normalized_name, []).extend(subjects)
+            self._normalized_names[key] = normalized_names
+
+        return normalized_names
@@ -11,10 +11,23 @@
 #
 ################################################################################
 
+from qudt.ontology.json_ld_reader import GEN_DELIMS
+from qudt.ontology.json_ld_reader import JsonLdReader
+from qudt.ontology.json_ld_reader import Triple
+from qudt.ontology.ontology_index import Statement
+
+import concurrent.futures
+import functools
 import json
 import os
 import pyld.jsonld
 import rdflib
+import sys
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import List
 from typing import Optional
 
 
@@ -40,20 +53,155 @@ class OntologyReader(object):
         g = rdflib.ConjunctiveGraph()
 
         if repo_format == 'json-ld':
-            # JSON-LD support in rdflib is limited. Particularly, while it can
-            # handle namespaces, it cannot handle fully compacted JSON-LD.
-            #
-            # To allow for compacted JSON-LD, we use pyld to expand the JSON-LD
-            # for rdflib.
-            with open(repo_path, 'r') as file:
-                compacted = json.loads(file.read())
-            expanded = pyld.jsonld.expand(compacted)
-            g.parse(data=json.dumps(expanded), format=repo_format)
+            triples = cls._read_json_ld_triples(repo_path)
+            if triples is not None:
+                for triple in triples:
+                    g.add(triple)
+            else:
+                # JSON-LD support in rdflib is limited. Particularly, while it
+                # can handle namespaces, it cannot handle fully compacted
+                # JSON-LD.
+                #
+                # To allow for compacted JSON-LD, we use pyld to expand the
+                # JSON-LD for rdflib.
+                with open(repo_path, 'r') as file:
+                    compacted = json.loads(file.read())
+                expanded = pyld.jsonld.expand(compacted)
+                g.parse(data=json.dumps(expanded), format=repo_format)
         else:
             g.parse(repo_path, format=repo_format)
 
         return g
 
+    @classmethod
+    def read_statements(cls, repo_path: str) -> List[Statement]:
+        """
+        Read the statements of an RDF triplet repository.
+
+        Unlike the graph returned by read(), the statements are plain strings
+        that can be pickled, e.g. to return them from another process.
+
+        :param repo_path: The path to the RDF repository
+        :return: The statements
+        """
+        # Skip building a graph if the triples can be read directly
+        if cls._get_repo_format(repo_path) == 'json-ld':
+            triples = cls._read_json_ld_triples(repo_path)
+            if triples is not None:
+                return cls._get_statements(triples)
+
+        return cls.get_statements(cls.read(repo_path))
+
+    @classmethod
+    def read_statements_parallel(
+            cls,
+            repo_paths: List[str],
+            max_workers: Optional[int] = None,
+            read_statements: Optional[Callable[[str], List[Statement]]] = None,
+    ) -> List[Optional[List[Statement]]]:
+        """
+        Read the statements of several RDF triplet repositories in a process
+        pool.
+
+        :param repo_paths: The paths to the RDF repositories
+        :param max_workers: The maximum number of processes, or None for the
+                            number of processors
+        :param read_statements: The picklable function reading a repository's
+                                statements, or None for read_statements()
+        :return: The statements of each repository, in the order of the paths,
+                 or None for repositories that don't exist
+        """
+        read = functools.partial(_read_statements_if_exists, read_statements or cls.read_statements)
+
+        if len(repo_paths) <= 1:
+            return [read(repo_path) for repo_path in repo_paths]
+
+        with concurrent.futures.ProcessPoolExecutor(max_workers) as executor:
+            return list(executor.map(read, repo_paths))
+
+    @classmethod
+    def read_namespaces(cls, repo_path: str) -> Dict[str, str]:
+        """
+        Read the namespace prefixes declared by an RDF triplet repository.
+
+        Only the @context of JSON-LD repositories is read. Terms are prefixes
+        if their IRI ends with a character like '/' or '#', following JSON-LD
+        1.1.
+
+        :param repo_path: The path to the RDF repository
+        :return: The namespaces by prefix, in the order they are declared, or
+                 empty if the repository isn't JSON-LD
+        :raises FileNotFoundError: If the repository doesn't exist
+        """
+        if cls._get_repo_format(repo_path) != 'json-ld':
+            return dict()
+
+        with open(repo_path, 'r') as file:
+            document = json.load(file)
+
+        contexts: Any = document.get('@context') if isinstance(document, dict) else None
+        if not isinstance(contexts, list):
+            contexts = [contexts]
+
+        namespaces: Dict[str, str] = dict()
+
+        for context in contexts:
+            if not isinstance(context, dict):
+                continue
+
+            for (term, definition) in context.items():
+                if isinstance(definition, dict):
+                    definition = definition.get('@id')
+
+                if (
+                    isinstance(definition, str)
+                    and not term.startswith('@')
+                    and definition.endswith(tuple(GEN_DELIMS))
+                ):
+                    namespaces[term] = definition
+
+        return namespaces
+
+    @staticmethod
+    def get_statements(graph: rdflib.Graph) -> List[Statement]:
+        """
+        Get the statements of an RDF graph as strings.
+
+        The order in which a graph yields its triples depends on the hash
+        seed, so the statements are sorted to load the same units in every
+        process.
+
+        :param graph: The RDF graph
+        :return: The statements, sorted
+        """
+        return sorted(OntologyReader._get_statements(graph))
+
+    @staticmethod
+    def _get_statements(triples: Iterable[Triple]) -> List[Statement]:
+        """
+        Helper function to convert triples to statements.
+        """
+        # Intern the strings so that repeated IRIs are only stored once
+        return [
+            (sys.intern(str(subject)), sys.intern(str(predicate)), sys.intern(str(obj)))
+            for (subject, predicate, obj) in triples
+        ]
+
+    @staticmethod
+    def _read_json_ld_triples(repo_path: str) -> Optional[List[Triple]]:
+        """
+        Helper function to read the triples of a JSON-LD repository without
+        expanding it.
+
+        :param repo_path: The path to the JSON-LD repository
+        :return: The triples, or None if the repository must be expanded by
+                 pyld
+        """
+        with open(repo_path, 'r') as file:
+            document = json.load(file)
+
+        return JsonLdReader.read_triples(document)
+
     @staticmethod
     def _get_repo_format(repo_path: str) -> Optional[str]:
         """
@@ -70,3 +218,21 @@ class OntologyReader(object):
         }
 
         return formats.get(repo_ext)
+
+
+def _read_statements_if_exists(
+        read_statements: Callable[[str], List[Statement]],
+        repo_path: str,
+) -> Optional[List[Statement]]:
+    """
+    Helper function to read the statements of a repository in a worker
+    process.
+
+    :param read_statements: The function reading the repository's statements
+    :param repo_path: The path to the RDF repository
+    :return: The statements, or None if the repository doesn't exist
+    """
+    try:
+        return read_statements(repo_path)
+    except FileNotFoundError:
+        return None
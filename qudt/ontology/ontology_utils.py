@@ -52,3 +52,13 @@ class OntologyUtils(object):
         :return: The full IRI containing the namespace and local part
         """
         return cls.get_namespace(shorthand) + local_part
+
+    @classmethod
+    def get_namespaces(cls) -> Dict[str, str]:
+        """
+        Get all registered namespaces.
+
+        :return: A copy of the namespaces by shorthand, in the order they were
+                 registered
+        """
+        return dict(cls._namespaces)
@@ -0,0 +1,51 @@
+################################################################################
+#
+#  Copyright (C) 2019 Garrett Brown
+#  This file is part of pyqudt - https://github.com/eigendude/pyqudt
+#
+#  pyqudt is derived from jQUDT
+#  Copyright (C) 2012-2013  Egon Willighagen <egonw@users.sf.net>
+#
+#  SPDX-License-Identifier: BSD-3-Clause
+#  See the file LICENSE for more information.
+#
+################################################################################
+
+from qudt.ontology.atomic_file import AtomicFile
+
+import pickle
+from typing import Any
+
+
+class PickleFile(object):
+    """
+    Helpers to store pickled objects in files shared between processes.
+    """
+
+    @staticmethod
+    def dump_atomic(obj: Any, path: str) -> None:
+        """
+        Pickle an object to a file, replacing the file atomically.
+
+        :param obj: The object to pickle
+        :param path: The path of the file to write
+        """
+        AtomicFile.write(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL), path)
+
+    @staticmethod
+    def load(path: str) -> Any:
+        """
+        Unpickle an object from a file.
+
+        :param path: The path of the file to read
+        :return: The object, or None if the file is missing or can't be
+                 unpickled
+        """
+        try:
+            with open(path, 'rb') as file:
+                return pickle.load(file)
+        except Exception:
+            # Truncated or stale files can fail in many ways, e.g. with an
+            # AttributeError for a class that was renamed. Any failure means
+            # that the file must be rebuilt.
+            return None
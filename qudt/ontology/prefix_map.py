@@ -0,0 +1,182 @@
+################################################################################
+#
+#  Copyright (C) 2019 Garrett Brown
+#  This file is part of pyqudt - https://github.com/eigendude/pyqudt
+#
+#  pyqudt is derived from jQUDT
+#  Copyright (C) 2012-2013  Egon Willighagen <egonw@users.sf.net>
+#
+#  SPDX-License-Identifier: BSD-3-Clause
+#  See the file LICENSE for more information.
+#
+################################################################################
+
+from qudt.lru_cache import LRUCache
+from qudt.ontology.ontology_reader import OntologyReader
+from qudt.ontology.ontology_utils import OntologyUtils
+
+import threading
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+
+# The default maximum number of memoized expansions, or None for no limit
+DEFAULT_EXPANSION_CACHE_SIZE: Optional[int] = 1024
+
+
+class PrefixMap(object):
+    """
+    The namespace prefixes of loaded repositories, used to expand compact
+    IRIs (CURIEs) such as 'unit:Kelvin' and to compact IRIs again.
+
+    The prefixes are the namespaces registered with OntologyUtils, followed
+    by those declared in the @context of each JSON-LD repository. The first
+    declaration of a prefix, and the first prefix of a namespace, wins.
+
+    Repositories are only read when the map is first used, so creating a map
+    is cheap. Maps are never modified once they are in use, and extend()
+    returns a new map on top of an existing one.
+
+    The map is safe to use from multiple threads.
+    """
+
+    def __init__(self, repo_paths: Iterable[str] = (), parent: Optional['PrefixMap'] = None):
+        """
+        Create a map of the prefixes of the given repositories.
+
+        :param repo_paths: The paths to the repositories, in the order they
+                           are loaded
+        :param parent: The map whose prefixes come first, or None to start
+                       with the namespaces registered with OntologyUtils
+        """
+        self._repo_paths: Tuple[str, ...] = tuple(repo_paths)
+        self._parent = parent
+
+        # Lock guarding the reading of the repositories
+        self._load_lock = threading.Lock()
+        self._loaded = False
+
+        # Prefix -> namespace
+        self._namespaces: Dict[str, str] = dict()
+
+        # Namespace -> prefix, and the distinct lengths of the namespaces,
+        # longest first, so that the longest matching namespace is found with
+        # one lookup per length
+        self._prefixes: Dict[str, str] = dict()
+        self._namespace_lengths: List[int] = list()
+
+        # Memoized expansions, by compact IRI
+        self._expansions: LRUCache[str, str] = LRUCache(DEFAULT_EXPANSION_CACHE_SIZE)
+
+    def __len__(self) -> int:
+        """
+        Get the number of prefixes.
+        """
+        return len(self.get_namespaces())
+
+    def extend(self, repo_paths: Iterable[str]) -> 'PrefixMap':
+        """
+        Create a map that adds the prefixes of more repositories, without
+        affecting this map.
+
+        :param repo_paths: The paths to the repositories
+        :return: The new map
+        """
+        return PrefixMap(repo_paths, self)
+
+    def get_namespaces(self) -> Dict[str, str]:
+        """
+        Get the namespaces of all prefixes.
+
+        :return: A copy of the namespaces by prefix
+        """
+        self._load()
+
+        return dict(self._namespaces)
+
+    def expand(self, curie: str) -> str:
+        """
+        Expand a compact IRI, e.g. 'unit:Kelvin' to
+        'http://qudt.org/vocab/unit#Kelvin'.
+
+        :param curie: The compact IRI
+        :return: The expanded IRI, or the value unchanged if it isn't a compact
+                 IRI with a known prefix, such as an absolute IRI
+        """
+        (prefix, colon, local_part) = curie.partition(':')
+
+        # Absolute IRIs, like http://..., are returned without loading the
+        # repositories
+        if not colon or local_part.startswith('//'):
+            return curie
+
+        iri: Optional[str] = self._expansions.get(curie)
+
+        if iri is None:
+            self._load()
+
+            namespace = self._namespaces.get(prefix)
+            iri = namespace + local_part if namespace is not None else curie
+
+            self._expansions.put(curie, iri)
+
+        return iri
+
+    def compact(self, iri: str) -> str:
+        """
+        Compact an IRI with the prefix of its longest matching namespace, e.g.
+        'http://qudt.org/vocab/unit#Kelvin' to 'unit:Kelvin'.
+
+        :param iri: The IRI
+        :return: The compact IRI, or the IRI unchanged if no namespace matches
+        """
+        self._load()
+
+        for length in self._namespace_lengths:
+            if length >= len(iri):
+                continue
+
+            prefix = self._prefixes.get(iri[:length])
+            if prefix is not None:
+                return f'{prefix}:{iri[length:]}'
+
+        return iri
+
+    def _load(self) -> None:
+        """
+        Helper function to read the prefixes of the repositories the first
+        time the map is used.
+        """
+        if self._loaded:
+            return
+
+        with self._load_lock:
+            if self._loaded:
+                return
+
+            if self._parent is not None:
+                namespaces = self._parent.get_namespaces()
+            else:
+                namespaces = OntologyUtils.get_namespaces()
+
+            for repo_path in self._repo_paths:
+                try:
+                    repo_namespaces = OntologyReader.read_namespaces(repo_path)
+                except FileNotFoundError:
+                    continue
+
+                for (prefix, namespace) in repo_namespaces.items():
+                    namespaces.setdefault(prefix, namespace)
+
+            prefixes: Dict[str, str] = dict()
+            for (prefix, namespace) in namespaces.items():
+                prefixes.setdefault(namespace, prefix)
+
+            self._namespaces = namespaces
+            self._prefixes = prefixes
+            self._namespace_lengths = sorted({len(namespace) for namespace in prefixes}, reverse=True)
+
+            self._loaded = True
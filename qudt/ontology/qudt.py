@@ -23,6 +23,7 @@ class QUDT(object):
     ABBREVIATION = OntologyUtils.get_iri('qudt', 'abbreviation')
     CONVERSION_OFFSET = OntologyUtils.get_iri('qudt', 'conversionOffset')
     CONVERSION_MULTIPLIER = OntologyUtils.get_iri('qudt', 'conversionMultiplier')
+    HAS_DIMENSION_VECTOR = OntologyUtils.get_iri('qudt', 'hasDimensionVector')
 
     SI_UNIT = OntologyUtils.get_iri('qudt', 'SIUnit')
     SI_BASE_UNIT = OntologyUtils.get_iri('qudt', 'SIBaseUnit')
@@ -30,3 +31,5 @@ class QUDT(object):
     DERIVED_UNIT = OntologyUtils.get_iri('qudt', 'DerivedUnit')
     NOT_USED_WITH_SI_UNIT = OntologyUtils.get_iri('qudt', 'NotUsedWithSIUnit')
     USED_WITH_SI_UNIT = OntologyUtils.get_iri('qudt', 'UsedWithSIUnit')
+    DECIMAL_PREFIX_UNIT = OntologyUtils.get_iri('qudt', 'DecimalPrefixUnit')
+    BINARY_PREFIX_UNIT = OntologyUtils.get_iri('qudt', 'BinaryPrefixUnit')
@@ -50,3 +50,13 @@ class RDFS(object):
         https://www.w3.org/TR/rdf-schema/#ch_label
 
     """
+
+    SUB_CLASS_OF = OntologyUtils.get_iri('rdfs', 'subClassOf')
+    """
+    States that all the instances of one class are instances of another.
+
+    Reference:
+
+        https://www.w3.org/TR/rdf-schema/#ch_subclassof
+
+    """
@@ -0,0 +1,250 @@
+################################################################################
+#
+#  Copyright (C) 2019 Garrett Brown
+#  This file is part of pyqudt - https://github.com/eigendude/pyqudt
+#
+#  pyqudt is derived from jQUDT
+#  Copyright (C) 2012-2013  Egon Willighagen <egonw@users.sf.net>
+#
+#  SPDX-License-Identifier: BSD-3-Clause
+#  See the file LICENSE for more information.
+#
+################################################################################
+
+from qudt.ontology.code_stamp import CodeStamp
+from qudt.ontology.ontology_index import Statement
+from qudt.ontology.ontology_reader import OntologyReader
+from qudt.ontology.pickle_file import PickleFile
+
+import hashlib
+import os
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+
+# Bump this when the layout of the cache entries changes
+CACHE_VERSION = 1
+
+# The modules whose code parses the statements. Their source is part of the
+# keys, so entries written by other versions of the code aren't used.
+STAMPED_MODULES = [
+    'qudt.ontology.json_ld_reader',
+    'qudt.ontology.ontology_reader',
+    'qudt.ontology.repo_cache',
+]
+
+# The extension of the cache entries
+ENTRY_EXT = '.statements'
+
+# The default maximum total size of the cache entries, in bytes
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+
+
+class RepoCache(object):
+    """
+    A persistent cache of the statements parsed from RDF triplet repositories.
+
+    Entries are keyed by a hash of the repository's contents and of the code
+    parsing it, so a repository is only parsed again when either changes,
+    wherever it is loaded from. Entries
+    are written atomically, so that many processes can share the cache, and
+    the least recently used entries are evicted when the cache grows beyond
+    its maximum size.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_size: Optional[int] = DEFAULT_MAX_SIZE):
+        """
+        Create a cache.
+
+        :param cache_dir: The directory to store the entries in, or None for
+                          the default directory
+        :param max_size: The maximum total size of the entries in bytes, or
+                         None for no limit
+        """
+        self.cache_dir: str = cache_dir if cache_dir is not None else self.get_default_dir()
+        self.max_size: Optional[int] = max_size
+
+    @staticmethod
+    def get_default_dir() -> str:
+        """
+        Get the default cache directory.
+
+        This is $PYQUDT_CACHE_DIR if set, otherwise a pyqudt directory in
+        $XDG_CACHE_HOME or ~/.cache.
+
+        :return: The path to the default cache directory
+        """
+        cache_dir = os.environ.get('PYQUDT_CACHE_DIR')
+        if cache_dir:
+            return cache_dir
+
+        cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+
+        return os.path.join(cache_home, 'pyqudt')
+
+    def read_statements(self, repo_path: str) -> List[Statement]:
+        """
+        Read the statements of an RDF triplet repository, parsing it only if
+        it isn't cached.
+
+        Failing to write to the cache, e.g. because the directory is read-only,
+        is not an error.
+
+        :param repo_path: The path to the RDF repository
+        :return: The statements
+        :raises FileNotFoundError: If the repository doesn't exist
+        """
+        key = self.get_key(repo_path)
+
+        statements = self.load(key)
+
+        if statements is None:
+            statements = OntologyReader.read_statements(repo_path)
+            try:
+                self.store(key, statements)
+            except OSError:
+                pass
+
+        return statements
+
+    @staticmethod
+    def get_key(repo_path: str) -> str:
+        """
+        Get the key of a repository's cache entry.
+
+        :param repo_path: The path to the RDF repository
+        :return: The hex digest of the repository's format and contents, and
+                 of the code parsing it
+        :raises FileNotFoundError: If the repository doesn't exist
+        """
+        # The format is chosen by extension, so it's part of the key
+        _, repo_ext = os.path.splitext(repo_path)
+
+        digest = hashlib.sha256(CodeStamp.get_digest(tuple(STAMPED_MODULES)))
+        digest.update(repo_ext.lower().encode('utf-8'))
+        digest.update(b'\0')
+
+        with open(repo_path, 'rb') as file:
+            digest.update(file.read())
+
+        return digest.hexdigest()
+
+    def load(self, key: str) -> Optional[List[Statement]]:
+        """
+        Load the statements of a cache entry, and mark it as recently used.
+
+        :param key: The key of the entry
+        :return: The statements, or None if the entry is missing or invalid
+        """
+        entry_path = self._get_entry_path(key)
+
+        entry = PickleFile.load(entry_path)
+
+        if not isinstance(entry, dict):
+            return None
+
+        if entry.get('version') != CACHE_VERSION or entry.get('key') != key:
+            return None
+
+        # The modification time orders the entries for eviction
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+
+        return entry.get('statements')
+
+    def store(self, key: str, statements: List[Statement]) -> None:
+        """
+        Store the statements of a repository, evicting the least recently
+        used entries if the cache grows too large.
+
+        :param key: The key of the entry
+        :param statements: The statements
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        entry = {
+            'version': CACHE_VERSION,
+            'key': key,
+            'statements': statements,
+        }
+
+        PickleFile.dump_atomic(entry, self._get_entry_path(key))
+
+        self.evict()
+
+    def evict(self) -> None:
+        """
+        Remove the least recently used entries until the cache fits in its
+        maximum size.
+        """
+        if self.max_size is None:
+            return
+
+        entries = self._get_entries()
+
+        total_size = sum(size for (_, _, size) in entries)
+
+        for (_, entry_path, size) in sorted(entries):
+            if total_size <= self.max_size:
+                break
+
+            try:
+                os.unlink(entry_path)
+            except FileNotFoundError:
+                # Evicted by another process
+                pass
+
+            total_size -= size
+
+    def clear(self) -> None:
+        """
+        Remove all entries from the cache.
+        """
+        for (_, entry_path, _) in self._get_entries():
+            try:
+                os.unlink(entry_path)
+            except FileNotFoundError:
+                pass
+
+    def get_size(self) -> int:
+        """
+        Get the total size of the cache entries.
+
+        :return: The size in bytes
+        """
+        return sum(size for (_, _, size) in self._get_entries())
+
+    def _get_entry_path(self, key: str) -> str:
+        """
+        Helper function to get the path of a cache entry.
+        """
+        return os.path.join(self.cache_dir, key + ENTRY_EXT)
+
+    def _get_entries(self) -> List[Tuple[float, str, int]]:
+        """
+        Helper function to list the cache entries.
+
+        :return: The list of (modification time, path, size) of the entries
+        """
+        entries: List[Tuple[float, str, int]] = list()
+
+        try:
+            dir_entries = list(os.scandir(self.cache_dir))
+        except FileNotFoundError:
+            return entries
+
+        for dir_entry in dir_entries:
+            if not dir_entry.name.endswith(ENTRY_EXT):
+                continue
+
+            try:
+                stat = dir_entry.stat()
+            except FileNotFoundError:
+                continue
+
+            entries.append((stat.st_mtime, dir_entry.path, stat.st_size))
+
+        return entries
@@ -0,0 +1,41 @@
+################################################################################
+#
+#  Copyright (C) 2019 Garrett Brown
+#  This file is part of pyqudt - https://github.com/eigendude/pyqudt
+#
+#  pyqudt is derived from jQUDT
+#  Copyright (C) 2012-2013  Egon Willighagen <egonw@users.sf.net>
+#
+#  SPDX-License-Identifier: BSD-3-Clause
+#  See the file LICENSE for more information.
+#
+################################################################################
+
+from qudt.ontology.ontology_utils import OntologyUtils
+
+
+OntologyUtils.register_namespace('skos', 'http://www.w3.org/2004/02/skos/core#')
+
+
+class SKOS(object):
+    """
+    The Simple Knowledge Organization System is a vocabulary for linking
+    concepts of different schemes.
+
+    Reference:
+
+        https://www.w3.org/TR/skos-reference/
+
+    """
+
+    namespace = OntologyUtils.get_namespace('skos')
+
+    EXACT_MATCH = OntologyUtils.get_iri('skos', 'exactMatch')
+    """
+    Links two concepts that can be used interchangeably.
+
+    Reference:
+
+        https://www.w3.org/TR/skos-reference/#mapping
+
+    """
@@ -0,0 +1,123 @@
+################################################################################
+#
+#  Copyright (C) 2019 Garrett Brown
+#  This file is part of pyqudt - https://github.com/eigendude/pyqudt
+#
+#  pyqudt is derived from jQUDT
+#  Copyright (C) 2012-2013  Egon Willighagen <egonw@users.sf.net>
+#
+#  SPDX-License-Identifier: BSD-3-Clause
+#  See the file LICENSE for more information.
+#
+################################################################################
+
+from qudt.ontology.code_stamp import CodeStamp
+from qudt.ontology.ontology_index import Statement
+from qudt.ontology.ontology_reader import OntologyReader
+from qudt.ontology.pickle_file import PickleFile
+
+import hashlib
+import os
+from typing import List
+from typing import Optional
+
+
+# Bump this when the layout of the catalog changes
+CATALOG_VERSION = 1
+
+# The modules whose code computes the statements of the catalog. Their source
+# is part of the stamp, so catalogs built by other versions of the code are
+# considered stale.
+STAMPED_MODULES = [
+    'qudt.ontology.json_ld_reader',
+    'qudt.ontology.ontology_index',
+    'qudt.ontology.ontology_reader',
+    'qudt.ontology.unit_catalog',
+]
+
+
+class UnitCatalog(object):
+    """
+    A precompiled catalog of the statements in a set of RDF triplet
+    repositories.
+
+    Parsing the JSON-LD repositories is slow, so the statements are compiled
+    ahead of time into a pickled catalog. The catalog is stamped with a hash
+    of the repositories it was built from, and is considered stale if any of
+    them change, or if the code reading them changes.
+    """
+
+    @classmethod
+    def build(cls, catalog_path: str, repo_paths: List[str]) -> int:
+        """
+        Compile the given repositories into a catalog.
+
+        Repositories that don't exist are skipped.
+
+        :param catalog_path: The path of the catalog to write
+        :param repo_paths: The paths to the RDF triplet repositories
+        :return: The number of statements in the catalog
+        """
+        statements: List[Statement] = list()
+
+        for repo_path in repo_paths:
+            try:
+                statements.extend(OntologyReader.read_statements(repo_path))
+            except FileNotFoundError:
+                continue
+
+        catalog = {
+            'version': CATALOG_VERSION,
+            'stamp': cls.get_stamp(repo_paths),
+            'statements': statements,
+        }
+
+        # Readers never see a partially-written catalog
+        PickleFile.dump_atomic(catalog, catalog_path)
+
+        return len(statements)
+
+    @classmethod
+    def load(cls, catalog_path: str, repo_paths: List[str]) -> Optional[List[Statement]]:
+        """
+        Load the statements of a catalog.
+
+        :param catalog_path: The path of the catalog to read
+        :param repo_paths: The paths to the RDF triplet repositories that the
+                           catalog is expected to be built from
+        :return: The statements, or None if the catalog is missing or stale
+        """
+        catalog = PickleFile.load(catalog_path)
+
+        if not isinstance(catalog, dict):
+            return None
+
+        if catalog.get('version') != CATALOG_VERSION:
+            return None
+
+        if catalog.get('stamp') != cls.get_stamp(repo_paths):
+            return None
+
+        return catalog.get('statements')
+
+    @staticmethod
+    def get_stamp(repo_paths: List[str]) -> str:
+        """
+        Get the stamp identifying the contents of the given repositories and
+        the code reading them.
+
+        :param repo_paths: The paths to the RDF triplet repositories
+        :return: The hex digest of the repository names and contents, and of
+                 the code
+        """
+        digest = hashlib.sha256(CodeStamp.get_digest(tuple(STAMPED_MODULES)))
+
+        for repo_path in repo_paths:
+            digest.update(os.path.basename(repo_path).encode('utf-8'))
+            try:
+                with open(repo_path, 'rb') as file:
+                    digest.update(hashlib.sha256(file.read()).digest())
+            except FileNotFoundError:
+                digest.update(b'\0')
+
+        return digest.hexdigest()
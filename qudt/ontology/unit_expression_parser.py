@@ -0,0 +1,210 @@
+################################################################################
+#
+#  Copyright (C) 2019 Garrett Brown
+#  This file is part of pyqudt - https://github.com/eigendude/pyqudt
+#
+#  pyqudt is derived from jQUDT
+#  Copyright (C) 2012-2013  Egon Willighagen <egonw@users.sf.net>
+#
+#  SPDX-License-Identifier: BSD-3-Clause
+#  See the file LICENSE for more information.
+#
+################################################################################
+
+from qudt.unit import Unit
+from qudt.unit_algebra import UnitAlgebra
+
+import re
+from typing import Callable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+
+# Common spellings of units whose names are missing or ambiguous in the
+# ontology, e.g. L is also the abbreviation of the lambert
+UNIT_ALIASES = {
+    'L': 'http://qudt.org/vocab/unit#Liter',
+    'l': 'http://qudt.org/vocab/unit#Liter',
+    'h': 'http://qudt.org/vocab/unit#Hour',
+    'sec': 'http://qudt.org/vocab/unit#SecondTime',
+    'day': 'http://qudt.org/vocab/unit#Day',
+    'lb': 'http://qudt.org/vocab/unit#PoundMass',
+    '°C': 'http://qudt.org/vocab/unit#DegreeCelsius',
+    '°F': 'http://qudt.org/vocab/unit#DegreeFahrenheit',
+}
+
+# Other spellings of prefix symbols, e.g. u for micro
+PREFIX_ALIASES = {
+    'u': 'µ',
+    'μ': 'µ',
+}
+
+# The tokens of unit expressions. A dash followed by digits is a negative
+# exponent, as in kg.m-2, and otherwise a product, as in N-m.
+TOKEN_PATTERN = re.compile(r'''
+    (?P<space>\s+)
+    |(?P<power>\^|\*\*)
+    |(?P<multiply>[*.·×])
+    |(?P<divide>/)
+    |(?P<open>\()
+    |(?P<close>\))
+    |(?P<number>[+-]?\d+)
+    |(?P<dash>-)
+    |(?P<name>[^\s*.·×/^()+\-0-9]+)
+''', re.VERBOSE)
+
+# Type definitions
+Token = Tuple[str, str]
+
+
+class UnitExpressionParser(object):
+    """
+    A parser of composite unit expressions, such as 'mg/dL', 'umol/(L*min)'
+    or 'kg.m-2'.
+
+    Expressions are products and quotients of unit names, which may have
+    integer exponents and be grouped with parentheses:
+
+      - Products are written with '*', '.', '·', '×', '-' or a space
+      - Quotients are written with '/', and '1/s' or '/s' is a reciprocal
+      - Exponents are written with '^' or '**', or as digits right after a
+        name, e.g. m2 or m-2
+
+    Each name is resolved by a function, e.g. one that also handles prefixes,
+    and the units are combined with unit algebra.
+    """
+
+    def __init__(self, resolve_name: Callable[[str], Optional[Unit]]):
+        """
+        Create a parser.
+
+        :param resolve_name: The function resolving a unit name, such as an
+                             abbreviation, to a unit, or None if the name is
+                             unknown
+        """
+        self._resolve_name = resolve_name
+
+    def parse(self, expression: str) -> Unit:
+        """
+        Parse a unit expression.
+
+        An expression that is the name of a unit resolves to that unit.
+
+        :param expression: The expression, e.g. 'umol/(L*min)'
+        :return: The unit
+        :raises ValueError: If the expression is invalid or contains an
+                            unknown unit name
+        """
+        unit = self._resolve_name(expression.strip())
+        if unit is not None:
+            return unit
+
+        tokens = self._tokenize(expression)
+
+        # A leading slash is a reciprocal
+        if tokens and tokens[0][0] == 'divide':
+            tokens.insert(0, ('number', '1'))
+
+        (unit, position) = self._parse_product(tokens, 0)
+
+        if position != len(tokens) or unit is None:
+            raise ValueError(f'Invalid unit expression: {expression}')
+
+        return unit
+
+    @staticmethod
+    def _tokenize(expression: str) -> List[Token]:
+        """
+        Helper function to split an expression into (kind, text) tokens,
+        without whitespace.
+        """
+        tokens: List[Token] = list()
+
+        position = 0
+        while position < len(expression):
+            match = TOKEN_PATTERN.match(expression, position)
+            if match is None:
+                raise ValueError(f'Invalid unit expression: {expression}')
+
+            kind = match.lastgroup
+            assert kind is not None
+
+            if kind == 'dash':
+                kind = 'multiply'
+
+            if kind != 'space':
+                tokens.append((kind, match.group()))
+
+            position = match.end()
+
+        return tokens
+
+    def _parse_product(self, tokens: List[Token], position: int) -> Tuple[Optional[Unit], int]:
+        """
+        Helper function to parse a sequence of factors joined by products and
+        quotients. None stands for the unit one.
+        """
+        (unit, position) = self._parse_factor(tokens, position)
+
+        while position < len(tokens):
+            kind = tokens[position][0]
+
+            if kind in ('multiply', 'divide'):
+                position += 1
+            elif kind not in ('name', 'open'):
+                break
+
+            # Adjacent factors are multiplied
+            (factor, position) = self._parse_factor(tokens, position)
+
+            if kind == 'divide':
+                if factor is not None:
+                    unit = UnitAlgebra.divide(unit, factor) if unit is not None else UnitAlgebra.power(factor, -1)
+            elif unit is None:
+                unit = factor
+            elif factor is not None:
+                unit = UnitAlgebra.multiply(unit, factor)
+
+        return (unit, position)
+
+    def _parse_factor(self, tokens: List[Token], position: int) -> Tuple[Optional[Unit], int]:
+        """
+        Helper function to parse a unit name, a parenthesized expression or
+        the number one, and its exponent, if any.
+        """
+        if position >= len(tokens):
+            raise ValueError('Unexpected end of unit expression')
+
+        (kind, text) = tokens[position]
+        position += 1
+
+        unit: Optional[Unit]
+
+        if kind == 'name':
+            unit = self._resolve_name(text)
+            if unit is None:
+                raise ValueError(f'Unknown unit: {text}')
+        elif kind == 'open':
+            (unit, position) = self._parse_product(tokens, position)
+            if position >= len(tokens) or tokens[position][0] != 'close':
+                raise ValueError('Unbalanced parentheses in unit expression')
+            position += 1
+        elif kind == 'number' and text == '1':
+            return (None, position)
+        else:
+            raise ValueError(f'Unexpected token in unit expression: {text}')
+
+        # Exponents follow the factor, with or without a power operator
+        if position < len(tokens) and tokens[position][0] == 'power':
+            position += 1
+            if position >= len(tokens) or tokens[position][0] != 'number':
+                raise ValueError('Missing exponent in unit expression')
+
+        if position < len(tokens) and tokens[position][0] == 'number':
+            exponent = int(tokens[position][1])
+            position += 1
+            if unit is not None and exponent != 1:
+                unit = UnitAlgebra.power(unit, exponent)
+
+        return (unit, position)
@@ -11,23 +11,42 @@
 #
 ################################################################################
 
+from qudt.ontology.compact_unit_table import CompactUnitTable
+from qudt.ontology.mapped_catalog import MappedCatalog
+from qudt.ontology.ontology_index import OntologyIndex
+from qudt.ontology.ontology_index import Statement
 from qudt.ontology.ontology_reader import OntologyReader
+from qudt.ontology.prefix_map import PrefixMap
 from qudt.ontology.qudt import QUDT
 from qudt.ontology.rdf import RDF
 from qudt.ontology.rdfs import RDFS
+from qudt.ontology.repo_cache import DEFAULT_MAX_SIZE as DEFAULT_REPO_CACHE_SIZE
+from qudt.ontology.repo_cache import RepoCache
+from qudt.ontology.unit_catalog import UnitCatalog
+from qudt.ontology.unit_expression_parser import PREFIX_ALIASES
+from qudt.ontology.unit_expression_parser import UNIT_ALIASES
+from qudt.ontology.unit_expression_parser import UnitExpressionParser
+from qudt.converter import ConverterRegistry
+from qudt.dimension_vector import DimensionVector
+from qudt.lru_cache import CacheInfo
+from qudt.lru_cache import LRUCache
+from qudt.multiplier import Multiplier
 from qudt.unit import Unit
+from qudt.unit_algebra import UnitAlgebra
 
+import concurrent.futures
+import dataclasses
+import functools
 import os
-import rdflib
-from typing import Callable
+import threading
+import time
+from typing import Dict
+from typing import Iterable
 from typing import List
+from typing import NamedTuple
 from typing import Optional
 from typing import Tuple
-
-
-# Type definitions
-Statement = Tuple[str, str, rdflib.term.Identifier]
-Predicate = Callable[[str, str, rdflib.term.Identifier], bool]
+from typing import Union
 
 
 # The package containing the RDF triplet repositories
@@ -38,46 +57,202 @@ REPO_FILES = [
     'openphacts.jsonld',
     'unit.jsonld',
     'contrib.jsonld',
+    'dimensionvector.jsonld',
+    'unittype.jsonld',
 ]
 
+# The precompiled catalog of the RDF triplet repositories
+CATALOG_FILE = 'units.catalog'
+
+# The memory-mapped catalog of the RDF triplet repositories
+MAPPED_CATALOG_FILE = 'units.mapped'
+
+# The default maximum number of cached units, or None for no limit
+DEFAULT_UNIT_CACHE_SIZE: Optional[int] = None
+
+# The default maximum number of cached unit expressions, or None for no limit
+DEFAULT_EXPRESSION_CACHE_SIZE: Optional[int] = 1024
+
+
+class WarmUpInfo(NamedTuple):
+    """
+    Timing metrics of a warm-up of the unit factory.
+    """
+    # Seconds spent loading the repositories, or 0 if they were loaded before
+    load_time: float
+
+    # Seconds spent building the indexes and resolving the unit constants
+    index_time: float
+
+    # The number of unit constants of the qudt.units package resolved
+    constant_count: int
+
+
+@dataclasses.dataclass(frozen=True)
+class _Snapshot(object):
+    """
+    The index of the loaded repositories and everything derived from it.
+
+    Snapshots are never modified once they are in use. Loading a repository
+    creates a new snapshot and swaps it in with a single assignment, so
+    lookups can read the current snapshot without locking.
+    """
+    index: Union[OntologyIndex, CompactUnitTable]
+
+    # Canonical units, by resource IRI
+    unit_cache: LRUCache[str, Unit]
+
+    # Units of parsed unit expressions, by expression
+    expression_cache: LRUCache[str, Unit]
+
+    # Synthesized prefixed units, by prefix and unit resource IRI
+    prefixed_unit_cache: LRUCache[Tuple[str, str], Unit]
+
+    # Namespace prefixes of the loaded repositories, for compact IRIs
+    prefix_map: PrefixMap
+
+    # Prefix units by symbol, or None until they are first needed
+    prefixes: Optional[Dict[str, Unit]] = None
+
+    # Units by type IRI and whether subtypes are included, built on demand
+    type_units: Dict[Tuple[str, bool], Tuple[Unit, ...]] = dataclasses.field(default_factory=dict)
+
+    # The number of times repositories were loaded into the factory
+    generation: int = 0
+
+    # Lock serializing the building of the tables above. The tables are
+    # built in full and then published with a single assignment, so readers
+    # never see a partial table and don't need to lock.
+    build_lock: threading.Lock = dataclasses.field(default_factory=threading.Lock, compare=False, repr=False)
+
+    def publish(self, name: str, value: object) -> None:
+        """
+        Publish a table built on demand.
+
+        :param name: The name of the field, e.g. 'prefixes'
+        :param value: The complete table
+        """
+        object.__setattr__(self, name, value)
+
 
 class UnitFactory(object):
     """
     A factory for creating units of measurement.
+
+    The factory is safe to use from multiple threads.
     """
 
     _instance: Optional['UnitFactory'] = None
 
+    # Lock guarding the creation of the singleton
+    _instance_lock = threading.Lock()
+
+    # Whether repositories are parsed in a process pool, and its size
+    _parallel_loading: bool = False
+    _max_workers: Optional[int] = None
+
+    # The on-disk cache of parsed user repositories, or None if disabled
+    _repo_cache: Optional[RepoCache] = None
+
+    # Whether lookups are served from the memory-mapped catalog, and its path
+    _use_mapped_catalog: bool = False
+    _mapped_catalog_path: Optional[str] = None
+
+    # Whether only the unit fields of the statements are kept
+    _compact_mode: bool = False
+
+    # The running or completed warm-up, and the lock guarding its creation
+    _warm_up_future: Optional['concurrent.futures.Future[WarmUpInfo]'] = None
+    _warm_up_lock = threading.Lock()
+
     def __init__(self):
         """
         Create an instance of the unit factory and load the RDF triplet
         repositories.
         """
-        # Get the path to this package
-        package_path = os.path.dirname(os.path.realpath(__file__))
-
         # Get the path to the repository files
-        self._repo_path: str = os.path.join(package_path, REPO_PACKAGE_NAME)
+        self._repo_path: str = self._get_bundled_repo_dir()
+
+        # Lock serializing changes to the snapshot
+        self._update_lock = threading.Lock()
+
+        self._unit_cache_size: Optional[int] = DEFAULT_UNIT_CACHE_SIZE
+        self._expression_cache_size: Optional[int] = DEFAULT_EXPRESSION_CACHE_SIZE
+
+        index: Union[OntologyIndex, CompactUnitTable] = OntologyIndex()
+
+        # In compact mode, only the unit fields are kept
+        if self._compact_mode:
+            index = CompactUnitTable(self._should_be_ignored)
 
-        # Load the repositories
-        self._repos: List[rdflib.Graph] = list()
-        for repo_file in REPO_FILES:
-            try:
-                self._repos.append(self._read_repo(repo_file))
-            except FileNotFoundError:
-                pass
+        # Map the memory-mapped catalog if it's enabled and up to date. Its
+        # pages are shared by all processes that map it, and nothing is
+        # loaded into memory.
+        mapped_catalog: Optional[MappedCatalog] = None
+        if self._use_mapped_catalog:
+            mapped_catalog = MappedCatalog.open(
+                self._mapped_catalog_path or os.path.join(self._repo_path, MAPPED_CATALOG_FILE),
+                self._get_bundled_repo_paths(),
+            )
+
+        # Otherwise, load the precompiled catalog if it is up to date
+        statements: Optional[List[Statement]] = None
+        if mapped_catalog is None:
+            statements = UnitCatalog.load(
+                os.path.join(self._repo_path, CATALOG_FILE),
+                self._get_bundled_repo_paths(),
+            )
+
+        if mapped_catalog is not None:
+            index = OntologyIndex(mapped_catalog)
+        elif statements is not None:
+            index.add_statements(statements)
+        elif self._parallel_loading:
+            # Fall back to loading the repositories in a process pool
+            for repo_statements in OntologyReader.read_statements_parallel(
+                    self._get_bundled_repo_paths(),
+                    self._max_workers,
+            ):
+                if repo_statements is not None:
+                    index.add_statements(repo_statements)
+        else:
+            # Fall back to reading the repositories in this process. Like the
+            # catalogs, the statements are indexed in document order, so that
+            # every path loads the same units.
+            for repo_path in self._get_bundled_repo_paths():
+                try:
+                    index.add_statements(OntologyReader.read_statements(repo_path))
+                except FileNotFoundError:
+                    continue
+
+        self._snapshot = _Snapshot(
+            index=index,
+            unit_cache=LRUCache(self._unit_cache_size),
+            expression_cache=LRUCache(self._expression_cache_size),
+            prefixed_unit_cache=LRUCache(self._unit_cache_size),
+            prefix_map=PrefixMap(self._get_bundled_repo_paths()),
+        )
 
     @classmethod
     def _get_instance(cls) -> 'UnitFactory':
         """
         Get the singleton used to store repository contents.
 
+        The singleton is created exactly once, even if several threads ask
+        for it at the same time.
+
         :return: The singleton instance of type UnitFactory
         """
-        if not cls._instance:
-            cls._instance = UnitFactory()
+        instance = cls._instance
+
+        if instance is None:
+            with cls._instance_lock:
+                instance = cls._instance
+                if instance is None:
+                    instance = UnitFactory()
+                    cls._instance = instance
 
-        return cls._instance
+        return instance
 
     @classmethod
     def get_repo_dir(cls) -> str:
@@ -88,6 +263,197 @@ class UnitFactory(object):
         """
         return cls._get_instance()._repo_path
 
+    @classmethod
+    def warm_up(cls, background: bool = True) -> 'concurrent.futures.Future[WarmUpInfo]':
+        """
+        Load the repositories, build the indexes that are otherwise built on
+        first use, and resolve the unit constants of the qudt.units package,
+        so that the first requests of a service don't pay for them.
+
+        Only one warm-up runs at a time, and later calls return the same
+        future. If a warm-up fails, the next call starts another one.
+
+        :param background: True to warm up on a daemon thread and return
+                           immediately, or False to warm up before returning
+        :return: The future of the warm-up's timing metrics, which is done
+                 when the factory is ready, see is_ready()
+        """
+        with cls._warm_up_lock:
+            future = cls._warm_up_future
+            start = False
+            if future is None or (future.done() and future.exception() is not None):
+                future = concurrent.futures.Future()
+                future.set_running_or_notify_cancel()
+                cls._warm_up_future = future
+                start = True
+
+        if start:
+            if background:
+                threading.Thread(
+                    target=cls._run_warm_up,
+                    args=(future,),
+                    name='pyqudt-warm-up',
+                    daemon=True,
+                ).start()
+            else:
+                cls._run_warm_up(future)
+
+        if not background:
+            future.result()
+
+        return future
+
+    @classmethod
+    def is_ready(cls) -> bool:
+        """
+        Check if a warm-up has completed, e.g. for the readiness probe of a
+        load balancer.
+
+        :return: True if warm_up() has completed successfully
+        """
+        future = cls._warm_up_future
+
+        return future is not None and future.done() and future.exception() is None
+
+    @classmethod
+    def _run_warm_up(cls, future: 'concurrent.futures.Future[WarmUpInfo]') -> None:
+        """
+        Helper function to warm up the factory and complete the future of the
+        warm-up.
+        """
+        # Imported here because the unit constants import the factory
+        from qudt.units.lazy_unit import LazyUnit
+
+        try:
+            start_time = time.perf_counter()
+
+            factory = cls._get_instance()
+
+            load_time = time.perf_counter()
+
+            factory._build_tables()
+
+            constant_count = LazyUnit.resolve_all()
+
+            end_time = time.perf_counter()
+        except BaseException as error:
+            future.set_exception(error)
+            return
+
+        future.set_result(WarmUpInfo(
+            load_time=load_time - start_time,
+            index_time=end_time - load_time,
+            constant_count=constant_count,
+        ))
+
+    def _build_tables(self) -> None:
+        """
+        Helper function to build the tables of the current snapshot that are
+        otherwise built on first use: the prefix units, and the namespace
+        prefixes of the loaded repositories.
+        """
+        snapshot = self._snapshot
+
+        self._get_prefixes(snapshot)
+        snapshot.prefix_map.get_namespaces()
+
+    @classmethod
+    def build_catalog(cls, catalog_path: Optional[str] = None) -> int:
+        """
+        Compile the bundled RDF triplet repositories into a catalog that is
+        loaded instead of the repositories on the next start.
+
+        :param catalog_path: The path of the catalog to write, or None to write
+                             it next to the bundled repositories
+        :return: The number of statements in the catalog
+        """
+        if catalog_path is None:
+            catalog_path = os.path.join(cls._get_bundled_repo_dir(), CATALOG_FILE)
+
+        return UnitCatalog.build(catalog_path, cls._get_bundled_repo_paths())
+
+    @classmethod
+    def build_mapped_catalog(cls, catalog_path: Optional[str] = None) -> int:
+        """
+        Compile the bundled RDF triplet repositories into a catalog that can
+        be memory-mapped, see set_mapped_catalog().
+
+        :param catalog_path: The path of the catalog to write, or None to write
+                             it next to the bundled repositories
+        :return: The number of statements in the catalog
+        """
+        if catalog_path is None:
+            catalog_path = os.path.join(cls._get_bundled_repo_dir(), MAPPED_CATALOG_FILE)
+
+        return MappedCatalog.build(catalog_path, cls._get_bundled_repo_paths(), cls._create_unit)
+
+    @classmethod
+    def set_mapped_catalog(cls, enabled: bool, catalog_path: Optional[str] = None) -> None:
+        """
+        Set whether lookups are served from a memory-mapped catalog.
+
+        The catalog is read in place instead of being loaded, so processes
+        that use it, such as the workers of a pre-forking server, share one
+        copy of it. This must be set before the factory is first used. If the
+        catalog is missing or out of date, the repositories are loaded as
+        usual.
+
+        :param enabled: True to use the memory-mapped catalog
+        :param catalog_path: The path of the catalog built by
+                             build_mapped_catalog(), or None for the catalog
+                             next to the bundled repositories
+        """
+        cls._use_mapped_catalog = enabled
+        cls._mapped_catalog_path = catalog_path
+
+    @classmethod
+    def set_compact_mode(cls, enabled: bool) -> None:
+        """
+        Set whether only the fields of units are kept in memory.
+
+        In compact mode, the label, abbreviation, symbol, type, multiplier and
+        offset of each unit are extracted into a table, and all other
+        statements are released. This
+        must be set before the factory is first used, and doesn't apply if
+        the memory-mapped catalog is used.
+
+        :param enabled: True to keep only the fields of units
+        """
+        cls._compact_mode = enabled
+
+    @classmethod
+    def set_parallel_loading(cls, enabled: bool, max_workers: Optional[int] = None) -> None:
+        """
+        Set whether repositories are parsed in a process pool.
+
+        This applies to the bundled repositories if it's set before the
+        factory is first used and the precompiled catalog can't be used, and
+        to load_repos().
+
+        :param enabled: True to parse repositories in parallel
+        :param max_workers: The maximum number of processes, or None for the
+                            number of processors
+        """
+        cls._parallel_loading = enabled
+        cls._max_workers = max_workers
+
+    @classmethod
+    def set_repo_cache_dir(cls, cache_dir: Optional[str], max_size: Optional[int] = DEFAULT_REPO_CACHE_SIZE) -> None:
+        """
+        Set the directory of the on-disk cache of repositories loaded by
+        load_repo() and load_repos().
+
+        The cache stores the parsed statements of each repository keyed by the
+        hash of its contents, so a repository that hasn't changed isn't parsed
+        again, even in another process. The cache is disabled by default.
+
+        :param cache_dir: The cache directory, e.g. RepoCache.get_default_dir(),
+                          or None to disable the cache
+        :param max_size: The maximum total size of the cache in bytes, or None
+                         for no limit
+        """
+        cls._repo_cache = RepoCache(cache_dir, max_size) if cache_dir is not None else None
+
     @classmethod
     def load_repo(cls, repo_file: str) -> int:
         """
@@ -96,28 +462,93 @@ class UnitFactory(object):
         If the repo's file does not exist, this function has no effect and
         returns 0.
 
+        Lookups running at the same time see the units either before or after
+        the repo is added.
+
         :param repo_file: The path to the RDF triplet repo
         :return: The number of triplets loaded, or 0 if the file doesn't exist
         """
+        repo_cache = cls._repo_cache
+        read_statements = repo_cache.read_statements if repo_cache is not None else OntologyReader.read_statements
+
         # Load the repository
         try:
-            repo = OntologyReader.read(repo_file)
+            statements = read_statements(repo_file)
         except FileNotFoundError:
             return 0
 
         # Store the results
-        if repo:
-            cls._get_instance()._repos.append(repo)
+        if statements:
+            cls._get_instance()._add_statements(statements, repo_paths=(repo_file,))
+
+        return len(statements)
+
+    @classmethod
+    def load_repos(cls, repo_files: List[str], parallel: Optional[bool] = None) -> int:
+        """
+        Loads several RDF triplet repos.
+
+        The repos are parsed in a process pool if parallel loading is enabled,
+        and are added in the order given, as if load_repo() was called for
+        each of them. Repos whose files don't exist are skipped.
+
+        :param repo_files: The paths to the RDF triplet repos
+        :param parallel: True to parse the repos in a process pool, False to
+                         parse them in this process, or None to use the
+                         setting of set_parallel_loading()
+        :return: The number of triplets loaded
+        """
+        if parallel is None:
+            parallel = cls._parallel_loading
+
+        repo_cache = cls._repo_cache
+        read_statements = repo_cache.read_statements if repo_cache is not None else OntologyReader.read_statements
+
+        repo_statements: List[Optional[List[Statement]]]
+
+        if parallel:
+            repo_statements = OntologyReader.read_statements_parallel(repo_files, cls._max_workers, read_statements)
+        else:
+            repo_statements = list()
+            for repo_file in repo_files:
+                try:
+                    repo_statements.append(read_statements(repo_file))
+                except FileNotFoundError:
+                    repo_statements.append(None)
+
+        statements: List[Statement] = list()
+        repo_paths: List[str] = list()
+        for (repo_file, repo_statement_list) in zip(repo_files, repo_statements):
+            if repo_statement_list is not None:
+                statements.extend(repo_statement_list)
+                repo_paths.append(repo_file)
+
+        # Store the results
+        if statements:
+            cls._get_instance()._add_statements(statements, repo_paths=tuple(repo_paths))
 
-        # Return the number of triplets read into the graph
-        return len(repo)
+        return len(statements)
+
+    @classmethod
+    def get_generation(cls) -> int:
+        """
+        Get the number of times repositories were loaded with load_repo() or
+        load_repos().
+
+        Units may change whenever the generation changes, so caches of units
+        outside the factory can use it to detect stale entries.
+
+        :return: The generation, starting at 0 for the bundled repositories
+        """
+        return cls._get_instance()._snapshot.generation
 
     @classmethod
     def get_unit(cls, resource_iri: str) -> Unit:
         """
         Get a unit by its resource IRI.
 
-        :param resource_iri: The unit's resource IRI
+        :param resource_iri: The unit's resource IRI, or a compact IRI such as
+                             'unit:Kelvin', see expand_curie()
         :return: The unit, or None on error
         """
         return cls._get_instance()._get_unit(resource_iri)
@@ -126,112 +557,735 @@ class UnitFactory(object):
         """
         Internal implementation of get_unit().
         """
-        unit = Unit(
-            resource_iri=resource_iri,
-        )
+        snapshot = self._snapshot
 
-        statements: List[Statement] = self._get_statements(
-            self._repos,
-            lambda subj, pred, obj: str(subj) == resource_iri,
-        )
+        return self._resolve_unit(snapshot, snapshot.prefix_map.expand(resource_iri))
+
+    @classmethod
+    def expand_curie(cls, curie: str) -> str:
+        """
+        Expand a compact IRI (CURIE), e.g. 'unit:Kelvin' to
+        'http://qudt.org/vocab/unit#Kelvin'.
+
+        The prefixes are the namespaces registered with OntologyUtils and
+        those declared in the @context of the loaded JSON-LD repositories.
+        Expansions are memoized.
+
+        :param curie: The compact IRI
+        :return: The expanded IRI, or the value unchanged if it isn't a compact
+                 IRI with a known prefix, such as an absolute IRI
+        """
+        return cls._get_instance()._snapshot.prefix_map.expand(curie)
+
+    @classmethod
+    def compact_iri(cls, iri: str) -> str:
+        """
+        Compact an IRI with the prefix of its longest matching namespace, e.g.
+        'http://qudt.org/vocab/unit#Kelvin' to 'unit:Kelvin'.
 
-        for (subject, predicate, obj) in statements:
+        :param iri: The IRI
+        :return: The compact IRI, or the IRI unchanged if no namespace matches
+        """
+        return cls._get_instance()._snapshot.prefix_map.compact(iri)
+
+    def _resolve_unit(self, snapshot: _Snapshot, resource_iri: str) -> Unit:
+        """
+        Get a unit from the given snapshot, using its unit cache.
+
+        Units of IRIs that nothing is known about aren't cached, so that
+        resolving arbitrary IRIs doesn't grow the cache.
+
+        :param snapshot: The snapshot of the loaded repositories
+        :param resource_iri: The unit's resource IRI
+        :return: The unit
+        """
+        unit: Optional[Unit] = snapshot.unit_cache.get(resource_iri)
+
+        if unit is None:
+            index = snapshot.index
+            if isinstance(index, CompactUnitTable):
+                unit = index.get_unit(resource_iri) or Unit(resource_iri=resource_iri)
+            else:
+                unit = self._create_unit(index, resource_iri)
+
+            if unit != Unit(resource_iri=resource_iri):
+                snapshot.unit_cache.put(resource_iri, unit)
+
+        return unit
+
+    @classmethod
+    def _create_unit(cls, index: OntologyIndex, resource_iri: str) -> Unit:
+        """
+        Create a unit from the indexed statements about its resource IRI.
+
+        :param index: The index of the loaded repositories
+        :param resource_iri: The unit's resource IRI
+        :return: The unit
+        """
+        # Use the record of the memory-mapped catalog, unless statements
+        # about the unit were loaded on top of it
+        if index.base is not None and not index.has_own_properties(resource_iri):
+            unit = index.base.get_unit(resource_iri)
+            if unit is not None:
+                return unit
+
+        label = ''
+        abbreviation = ''
+        symbol = ''
+        type_iri = ''
+        type_iris: List[str] = list()
+        offset = 0.0
+        multiplier = 1.0
+        dimension_vector: Optional[DimensionVector] = None
+
+        for (predicate, obj) in index.get_properties(resource_iri):
             if predicate == QUDT.SYMBOL:
-                unit.symbol = str(obj)
+                symbol = obj
             elif predicate == QUDT.ABBREVIATION:
-                unit.abbreviation = str(obj)
+                abbreviation = obj
             elif predicate == QUDT.CONVERSION_OFFSET:
-                unit.multiplier.offset = float(obj)
+                offset = float(obj)
             elif predicate == QUDT.CONVERSION_MULTIPLIER:
-                unit.multiplier.multiplier = float(obj)
+                multiplier = float(obj)
             elif predicate == RDFS.LABEL:
-                unit.label = str(obj)
+                label = obj
             elif predicate == RDF.TYPE:
-                type_iri = str(obj)
-                if not self._should_be_ignored(type_iri):
-                    unit.type_iri = type_iri
+                type_iris.append(obj)
+                if not cls._should_be_ignored(obj):
+                    type_iri = obj
+            elif predicate == QUDT.HAS_DIMENSION_VECTOR:
+                dimension_vector = cls._parse_dimension_vector(obj) or dimension_vector
 
-        return unit
+        # Without a dimension of its own, the unit has the dimension of its
+        # type, or else of the first of its other types that has one
+        if dimension_vector is None:
+            for candidate_iri in [type_iri] + type_iris:
+                dimension_vector = cls._get_dimension_vector(index, candidate_iri)
+                if dimension_vector is not None:
+                    break
+
+        return Unit(
+            resource_iri=resource_iri,
+            label=label,
+            abbreviation=abbreviation,
+            symbol=symbol,
+            type_iri=type_iri,
+            multiplier=Multiplier(
+                offset=offset,
+                multiplier=multiplier,
+            ),
+            dimension_vector=dimension_vector,
+        )
+
+    @classmethod
+    def _get_dimension_vector(cls, index: OntologyIndex, subject: str) -> Optional[DimensionVector]:
+        """
+        Helper function to get the dimension vector of a unit type.
+
+        :param index: The index of the loaded repositories
+        :param subject: The IRI of the unit type
+        :return: The last valid dimension vector of the type, or None if it
+                 has none
+        """
+        dimension_vector: Optional[DimensionVector] = None
+
+        if subject:
+            for (predicate, obj) in index.get_properties(subject):
+                if predicate == QUDT.HAS_DIMENSION_VECTOR:
+                    dimension_vector = cls._parse_dimension_vector(obj) or dimension_vector
+
+        return dimension_vector
+
+    @staticmethod
+    def _parse_dimension_vector(iri: str) -> Optional[DimensionVector]:
+        """
+        Helper function to parse a dimension vector IRI.
+
+        :param iri: The IRI of the dimension vector
+        :return: The dimension vector, or None if it isn't a vector of integer
+                 exponents
+        """
+        try:
+            return DimensionVector.from_iri(iri)
+        except ValueError:
+            return None
+
+    @classmethod
+    def set_unit_cache_size(cls, maxsize: Optional[int]) -> None:
+        """
+        Set the maximum number of units kept by get_unit().
+
+        Units are cached by resource IRI, so repeated lookups return the same
+        object. IRIs that nothing is known about aren't cached. When the cache
+        is full, the least recently used unit is evicted.
+
+        :param maxsize: The maximum number of units, or None for no limit
+        """
+        factory = cls._get_instance()
+
+        with factory._update_lock:
+            factory._unit_cache_size = maxsize
+            factory._snapshot.unit_cache.resize(maxsize)
+            factory._snapshot.prefixed_unit_cache.resize(maxsize)
 
     @classmethod
-    def find_units(cls, abbreviation: str) -> List[Unit]:
+    def get_unit_cache_info(cls) -> CacheInfo:
+        """
+        Get the statistics of the unit cache.
+
+        :return: The hits, misses, maximum size and current size of the cache
+        """
+        return cls._get_instance()._snapshot.unit_cache.info()
+
+    @classmethod
+    def clear_unit_cache(cls) -> None:
+        """
+        Remove all units from the unit cache.
+        """
+        snapshot = cls._get_instance()._snapshot
+
+        snapshot.unit_cache.clear()
+        snapshot.prefixed_unit_cache.clear()
+
+    @classmethod
+    def find_units(
+            cls,
+            abbreviation: str,
+            ignore_case: bool = False,
+            normalize_whitespace: bool = False,
+            prefixes: bool = False,
+    ) -> List[Unit]:
         """
         Get units by their abbreviation.
 
         :param abbreviation: The unit abbreviation, e.g. 'nM'
+        :param ignore_case: True to match the abbreviation case-insensitively
+        :param normalize_whitespace: True to ignore leading, trailing and
+                                     repeated whitespace
+        :param prefixes: True to synthesize prefixed units if no units match,
+                         e.g. aM from atto and M, see get_prefixed_unit()
         :return: The list of units, or empty if no units matched the abbreviation
         """
-        return cls._get_instance()._find_units(abbreviation)
+        return cls._get_instance()._find_units(QUDT.ABBREVIATION, abbreviation, ignore_case, normalize_whitespace, prefixes)
 
-    def _find_units(self, abbreviation: str) -> List[Unit]:
+    @classmethod
+    def find_units_by_symbol(
+            cls,
+            symbol: str,
+            ignore_case: bool = False,
+            normalize_whitespace: bool = False,
+            prefixes: bool = False,
+    ) -> List[Unit]:
         """
-        Internal implementation of find_units()
+        Get units by their symbol.
+
+        :param symbol: The unit symbol, e.g. 'nmol/dm^3'
+        :param ignore_case: True to match the symbol case-insensitively
+        :param normalize_whitespace: True to ignore leading, trailing and
+                                     repeated whitespace
+        :param prefixes: True to synthesize prefixed units if no units match,
+                         e.g. amol/dm^3 from atto and mol/dm^3
+        :return: The list of units, or empty if no units matched the symbol
         """
-        found_units: List[Unit] = list()
+        return cls._get_instance()._find_units(QUDT.SYMBOL, symbol, ignore_case, normalize_whitespace, prefixes)
 
-        statements: List[Statement] = self._get_statements(
-            self._repos,
-            lambda subj, pred, o: str(pred) == QUDT.ABBREVIATION and str(o) == abbreviation,
-        )
+    @classmethod
+    def find_units_by_label(
+            cls,
+            label: str,
+            ignore_case: bool = False,
+            normalize_whitespace: bool = False,
+            prefixes: bool = False,
+    ) -> List[Unit]:
+        """
+        Get units by their label.
+
+        :param label: The unit label, e.g. 'Nanomolar'
+        :param ignore_case: True to match the label case-insensitively
+        :param normalize_whitespace: True to ignore leading, trailing and
+                                     repeated whitespace
+        :param prefixes: True to synthesize prefixed units if no units match,
+                         e.g. Attomolar from Atto and Molar
+        :return: The list of units, or empty if no units matched the label
+        """
+        return cls._get_instance()._find_units(RDFS.LABEL, label, ignore_case, normalize_whitespace, prefixes)
+
+    @classmethod
+    def find_units_many(
+            cls,
+            names: Iterable[str],
+            ignore_case: bool = False,
+            normalize_whitespace: bool = False,
+            predicate: str = QUDT.ABBREVIATION,
+            prefixes: bool = False,
+    ) -> List[List[Unit]]:
+        """
+        Get units for each of a sequence of names, e.g. a column of
+        abbreviations.
+
+        Each distinct name is only looked up once, and equal names share the
+        same list of units.
 
-        for (subject, predicate, obj) in statements:
-            type_iri = subject
-            found_units.append(self._get_unit(type_iri))
+        :param names: The names to look up
+        :param ignore_case: True to match the names case-insensitively
+        :param normalize_whitespace: True to ignore leading, trailing and
+                                     repeated whitespace
+        :param predicate: The IRI of the names' predicate, one of
+                          QUDT.ABBREVIATION, QUDT.SYMBOL or RDFS.LABEL
+        :param prefixes: True to synthesize prefixed units for names that
+                         don't match any units
+        :return: The list of units for each name, in the order of the names
+        """
+        factory = cls._get_instance()
+
+        resolved: Dict[str, List[Unit]] = dict()
+        found_units: List[List[Unit]] = list()
+
+        for name in names:
+            units = resolved.get(name)
+            if units is None:
+                units = factory._find_units(predicate, name, ignore_case, normalize_whitespace, prefixes)
+                resolved[name] = units
+            found_units.append(units)
 
         return found_units
 
+    def _find_units(
+            self,
+            predicate: str,
+            name: str,
+            ignore_case: bool,
+            normalize_whitespace: bool,
+            prefixes: bool = False,
+    ) -> List[Unit]:
+        """
+        Internal implementation of find_units() and friends.
+        """
+        snapshot = self._snapshot
+
+        units = [
+            self._resolve_unit(snapshot, subject)
+            for subject in snapshot.index.get_subjects_by_name(predicate, name, ignore_case, normalize_whitespace)
+        ]
+
+        if not units and prefixes:
+            units = self._find_prefixed_units(snapshot, predicate, name, ignore_case, normalize_whitespace)
+
+        return units
+
+    def _find_prefixed_units(
+            self,
+            snapshot: _Snapshot,
+            predicate: str,
+            name: str,
+            ignore_case: bool,
+            normalize_whitespace: bool,
+    ) -> List[Unit]:
+        """
+        Helper function to split a name into a prefix and the name of units,
+        and to get the prefixed units.
+
+        Prefixes are matched by label for labels, and by symbol otherwise.
+        The longest prefix followed by the name of any units that can be
+        prefixed wins.
+
+        :param snapshot: The snapshot of the loaded repositories
+        :param predicate: The IRI of the name's predicate
+        :param name: The name, e.g. 'aM' or 'Attomolar'
+        :param ignore_case: True to match the name case-insensitively
+        :param normalize_whitespace: True to ignore leading, trailing and
+                                     repeated whitespace
+        :return: The list of prefixed units, or empty if the name doesn't
+                 start with a prefix or the rest of it matches no units
+        """
+        prefix_units = self._get_prefixes(snapshot)
+
+        if predicate == RDFS.LABEL:
+            prefix_units = {prefix.label: prefix for prefix in prefix_units.values() if prefix.label}
+
+        if normalize_whitespace:
+            name = name.lstrip()
+
+        for prefix_name in sorted(prefix_units, key=len, reverse=True):
+            if ignore_case:
+                matches = name.lower().startswith(prefix_name.lower())
+            else:
+                matches = name.startswith(prefix_name)
+
+            base_name = name[len(prefix_name):]
+            if not matches or not base_name:
+                continue
+
+            # Labels of prefixed units are written as one word, e.g.
+            # Attomolar
+            if predicate == RDFS.LABEL:
+                base_name = base_name[:1].upper() + base_name[1:]
+
+            units = [
+                self._get_prefixed_unit(snapshot, prefix_units[prefix_name], unit)
+                for unit in self._find_units(predicate, base_name, ignore_case, normalize_whitespace)
+                if self._can_be_prefixed(unit)
+            ]
+
+            if units:
+                return units
+
+        return []
+
+    @classmethod
+    def get_prefixed_unit(cls, prefix: str, resource_iri: str) -> Unit:
+        """
+        Get a unit with an SI or binary prefix, e.g. attomolar from atto and
+        molar, whether or not the ontology defines it.
+
+        The unit is derived from the unit and the prefix factor, and is cached
+        like the units of get_unit().
+
+        :param prefix: The symbol or label of the prefix, e.g. 'a' or 'Atto'
+        :param resource_iri: The resource IRI or compact IRI of the unit to
+                             prefix
+        :return: The prefixed unit
+        :raises ValueError: If the prefix is unknown, or the unit is a prefix
+                            or has an offset
+        """
+        factory = cls._get_instance()
+        snapshot = factory._snapshot
+
+        prefix_units = factory._get_prefixes(snapshot)
+
+        prefix_unit = prefix_units.get(prefix)
+        if prefix_unit is None:
+            for candidate in prefix_units.values():
+                if candidate.label == prefix:
+                    prefix_unit = candidate
+                    break
+            else:
+                raise ValueError(f'Unknown prefix: {prefix}')
+
+        unit = factory._resolve_unit(snapshot, snapshot.prefix_map.expand(resource_iri))
+        if not cls._can_be_prefixed(unit):
+            raise ValueError(f'Unit cannot be prefixed: {resource_iri}')
+
+        return factory._get_prefixed_unit(snapshot, prefix_unit, unit)
+
+    @staticmethod
+    def _get_prefixed_unit(snapshot: _Snapshot, prefix: Unit, unit: Unit) -> Unit:
+        """
+        Helper function to get a prefixed unit from the given snapshot, using
+        its prefixed unit cache.
+
+        :param snapshot: The snapshot of the loaded repositories
+        :param prefix: The prefix unit
+        :param unit: The unit to prefix
+        :return: The prefixed unit
+        """
+        key = (prefix.resource_iri, unit.resource_iri)
+
+        prefixed_unit: Optional[Unit] = snapshot.prefixed_unit_cache.get(key)
+
+        if prefixed_unit is None:
+            prefixed_unit = UnitAlgebra.prefix(prefix, unit)
+            snapshot.prefixed_unit_cache.put(key, prefixed_unit)
+
+        return prefixed_unit
+
+    @staticmethod
+    def _can_be_prefixed(unit: Unit) -> bool:
+        """
+        Helper function to check if a unit can be prefixed, which excludes
+        prefixes and units with an offset, like degrees Celsius.
+        """
+        return (
+            unit.type_iri not in (QUDT.DECIMAL_PREFIX_UNIT, QUDT.BINARY_PREFIX_UNIT)
+            and not unit.multiplier.offset
+        )
+
+    @classmethod
+    def parse_unit(cls, expression: str) -> Unit:
+        """
+        Get the unit of a composite unit expression, such as 'mg/dL',
+        'umol/(L*min)' or 'kg.m-2', see UnitExpressionParser.
+
+        Names in the expression are matched by abbreviation, then by symbol,
+        and then as a prefix symbol followed by the name of a unit, e.g. dL.
+        Units that aren't in the ontology are derived from the units that
+        are, and parsed expressions are cached.
+
+        :param expression: The unit expression
+        :return: The unit
+        :raises ValueError: If the expression is invalid or contains an
+                            unknown unit name
+        """
+        return cls._get_instance()._parse_unit(expression)
+
+    def _parse_unit(self, expression: str) -> Unit:
+        """
+        Internal implementation of parse_unit().
+        """
+        snapshot = self._snapshot
+
+        unit: Optional[Unit] = snapshot.expression_cache.get(expression)
+
+        if unit is None:
+            parser = UnitExpressionParser(functools.partial(self._resolve_name, snapshot))
+            unit = parser.parse(expression)
+            snapshot.expression_cache.put(expression, unit)
+
+        return unit
+
+    @classmethod
+    def set_expression_cache_size(cls, maxsize: Optional[int]) -> None:
+        """
+        Set the maximum number of unit expressions kept by parse_unit().
+
+        :param maxsize: The maximum number of expressions, or None for no limit
+        """
+        factory = cls._get_instance()
+
+        with factory._update_lock:
+            factory._expression_cache_size = maxsize
+            factory._snapshot.expression_cache.resize(maxsize)
+
+    @classmethod
+    def get_expression_cache_info(cls) -> CacheInfo:
+        """
+        Get the statistics of the unit expression cache.
+
+        :return: The hits, misses, maximum size and current size of the cache
+        """
+        return cls._get_instance()._snapshot.expression_cache.info()
+
+    def _resolve_name(self, snapshot: _Snapshot, name: str) -> Optional[Unit]:
+        """
+        Helper function to resolve a unit name in a unit expression.
+
+        :param snapshot: The snapshot of the loaded repositories
+        :param name: The name, e.g. 'mg' or 'dL'
+        :return: The unit, or None if the name is unknown
+        """
+        unit = self._find_named_unit(snapshot, name)
+
+        if unit is None:
+            # Try the longest prefix symbol first, e.g. deca before deci
+            prefixes = self._get_prefixes(snapshot)
+            for symbol in sorted(prefixes, key=len, reverse=True):
+                if name.startswith(symbol) and len(name) > len(symbol):
+                    base_unit = self._find_named_unit(snapshot, name[len(symbol):])
+                    if base_unit is not None and self._can_be_prefixed(base_unit):
+                        return self._get_prefixed_unit(snapshot, prefixes[symbol], base_unit)
+
+        return unit
+
+    def _find_named_unit(self, snapshot: _Snapshot, name: str) -> Optional[Unit]:
+        """
+        Helper function to get the first unit with the given name, which
+        isn't a prefix.
+        """
+        alias_iri = UNIT_ALIASES.get(name)
+        if alias_iri is not None:
+            return self._resolve_unit(snapshot, alias_iri)
+
+        for predicate in (QUDT.ABBREVIATION, QUDT.SYMBOL):
+            for subject in snapshot.index.get_subjects_by_name(predicate, name):
+                unit = self._resolve_unit(snapshot, subject)
+                if unit.type_iri not in (QUDT.DECIMAL_PREFIX_UNIT, QUDT.BINARY_PREFIX_UNIT):
+                    return unit
+
+        return None
+
+    def _get_prefixes(self, snapshot: _Snapshot) -> Dict[str, Unit]:
+        """
+        Helper function to get the prefix units of a snapshot by symbol.
+        """
+        prefixes = snapshot.prefixes
+
+        if prefixes is None:
+            with snapshot.build_lock:
+                prefixes = snapshot.prefixes
+                if prefixes is None:
+                    prefixes = dict()
+
+                    for type_iri in (QUDT.DECIMAL_PREFIX_UNIT, QUDT.BINARY_PREFIX_UNIT):
+                        for subject in snapshot.index.get_subjects_by_type(type_iri):
+                            unit = self._resolve_unit(snapshot, subject)
+                            if unit.symbol:
+                                prefixes[unit.symbol] = unit
+
+                    for (alias, symbol) in PREFIX_ALIASES.items():
+                        if symbol in prefixes:
+                            prefixes[alias] = prefixes[symbol]
+
+                    snapshot.publish('prefixes', prefixes)
+
+        return prefixes
+
     @classmethod
-    def get_iris(cls, type_iri: str) -> List[str]:
+    def get_iris(cls, type_iri: str, include_subtypes: bool = False) -> List[str]:
         """
         Return a list of unit IRIs with the given unit type.
 
         :param type_iri: The IRI of the unit type, e.g. 'http://qudt.org/schema/qudt#TemperatureUnit'
+                         or 'qudt:TemperatureUnit'
+        :param include_subtypes: True to include the units of the subclasses
+                                 of the type, recursively
         :return: The list of units, or empty if none match the specified type
         """
-        return cls._get_instance()._get_iris(type_iri)
+        return cls._get_instance()._get_iris(type_iri, include_subtypes)
 
-    def _get_iris(self, type_iri: str) -> List[str]:
+    def _get_iris(self, type_iri: str, include_subtypes: bool = False) -> List[str]:
         """
         Internal implementation of get_iris()
         """
-        statements: List[Statement] = self._get_statements(
-            self._repos,
-            lambda subj, pred, o: str(o) == type_iri,
-        )
+        snapshot = self._snapshot
 
-        return [subj for (subj, pred, o) in statements]
+        return self._get_subjects_by_type(snapshot, snapshot.prefix_map.expand(type_iri), include_subtypes)
 
-    def _read_repo(self, file_name: str) -> rdflib.Graph:
+    @classmethod
+    def get_units(cls, type_iri: str, include_subtypes: bool = False) -> List[Unit]:
         """
-        Helper function to load the RDF triplet repository.
+        Get the units of the given unit type, e.g. to list the choices for
+        a quantity.
+
+        The units of each type are looked up once, and are cached until
+        another repository is loaded.
 
-        :param file_name: The path to the repo
-        :return: The loaded graph object
+        :param type_iri: The IRI of the unit type, e.g. 'http://qudt.org/schema/qudt#TemperatureUnit'
+                         or 'qudt:TemperatureUnit'
+        :param include_subtypes: True to include the units of the subclasses
+                                 of the type, recursively, e.g. the molar
+                                 concentration units of concentration
+        :return: The list of units, or empty if none match the specified type
+        """
+        return cls._get_instance()._get_units(type_iri, include_subtypes)
+
+    def _get_units(self, type_iri: str, include_subtypes: bool) -> List[Unit]:
+        """
+        Internal implementation of get_units().
         """
-        repo_path = os.path.join(self._repo_path, file_name)
+        snapshot = self._snapshot
 
-        return OntologyReader.read(repo_path)
+        type_iri = snapshot.prefix_map.expand(type_iri)
+
+        key = (type_iri, include_subtypes)
+
+        units = snapshot.type_units.get(key)
+
+        if units is None:
+            with snapshot.build_lock:
+                units = snapshot.type_units.get(key)
+                if units is None:
+                    units = tuple(
+                        self._resolve_unit(snapshot, subject)
+                        for subject in self._get_subjects_by_type(snapshot, type_iri, include_subtypes)
+                    )
+
+                    # Publish a new table instead of adding to the one that
+                    # other threads may be reading
+                    type_units = dict(snapshot.type_units)
+                    type_units[key] = units
+                    snapshot.publish('type_units', type_units)
+
+        return list(units)
 
     @staticmethod
-    def _get_statements(
-            repos: List[rdflib.Graph],
-            triplet_test: Predicate
-    ) -> List[Statement]:
+    def _get_subjects_by_type(snapshot: _Snapshot, type_iri: str, include_subtypes: bool) -> List[str]:
         """
-        Get the statements of the given repos that satisfy the provided lambda.
+        Helper function to get the subjects of a type, and optionally of its
+        subtypes.
 
-        :param repos: The ontology repositories
-        :param triplet_test: The lambda to invoke per statement
-        :return: The matching statements
+        :param snapshot: The snapshot of the loaded repositories
+        :param type_iri: The IRI of the type
+        :param include_subtypes: True to include the subjects of the
+                                 subclasses of the type, recursively
+        :return: The list of subject IRIs, without duplicates, with those of
+                 the type first
         """
-        statements: List[Statement] = list()
+        index = snapshot.index
 
-        for repo in repos:
-            for (subject, predicate, obj) in repo:
-                if triplet_test(subject, predicate, obj):
-                    statements.append((str(subject), str(predicate), obj))
+        if not include_subtypes:
+            return list(index.get_subjects_by_type(type_iri))
+
+        # Visit the type hierarchy breadth-first, tolerating cycles
+        type_iris = [type_iri]
+        visited = {type_iri}
+        for current_iri in type_iris:
+            for subclass_iri in index.get_subclasses(current_iri):
+                if subclass_iri not in visited:
+                    visited.add(subclass_iri)
+                    type_iris.append(subclass_iri)
+
+        subjects: Dict[str, None] = dict()
+        for current_iri in type_iris:
+            subjects.update(dict.fromkeys(index.get_subjects_by_type(current_iri)))
+
+        return list(subjects)
+
+    def _add_statements(
+            self,
+            statements: List[Statement],
+            repo_paths: Tuple[str, ...] = (),
+    ) -> None:
+        """
+        Helper function to index the statements of loaded repositories.
+
+        The current snapshot is copied, extended and then swapped in, so that
+        lookups in progress aren't affected.
+
+        :param statements: The statements to index
+        :param repo_paths: The paths to the repositories, whose namespace
+                           prefixes are added for compact IRIs
+        """
+        with self._update_lock:
+            snapshot = self._snapshot
+
+            index = snapshot.index.copy()
+            index.add_statements(statements)
+
+            # The new statements may change any cached unit, so the new
+            # snapshot starts with empty caches
+            self._snapshot = _Snapshot(
+                index=index,
+                unit_cache=LRUCache(self._unit_cache_size),
+                expression_cache=LRUCache(self._expression_cache_size),
+                prefixed_unit_cache=LRUCache(self._unit_cache_size),
+                prefix_map=snapshot.prefix_map.extend(repo_paths) if repo_paths else snapshot.prefix_map,
+                generation=snapshot.generation + 1,
+            )
+
+            # Converters and derived units of the old snapshot's units are
+            # cached outside of it
+            ConverterRegistry.clear_cache()
+            UnitAlgebra.clear_cache()
+
+            # Unit constants resolved from the old snapshot are restored, so
+            # that they're resolved again. Imported here to avoid importing
+            # the unit modules
+            from qudt.units.lazy_unit import LazyUnit
+
+            LazyUnit.reset_all()
+
+    @staticmethod
+    def _get_bundled_repo_dir() -> str:
+        """
+        Get the directory containing the bundled repositories.
+
+        :return: The path to the bundled repository directory
+        """
+        # Get the path to this package
+        package_path = os.path.dirname(os.path.realpath(__file__))
+
+        return os.path.join(package_path, REPO_PACKAGE_NAME)
+
+    @classmethod
+    def _get_bundled_repo_paths(cls) -> List[str]:
+        """
+        Get the paths to the bundled repositories.
+
+        :return: The paths, in the order the repositories are loaded
+        """
+        repo_dir = cls._get_bundled_repo_dir()
 
-        return statements
+        return [os.path.join(repo_dir, repo_file) for repo_file in REPO_FILES]
 
     @staticmethod
     def _should_be_ignored(type_iri: str) -> bool:
@@ -11,9 +11,17 @@
 #
 ################################################################################
 
+from qudt.converter import ConverterRegistry
 from qudt.unit import Unit
+from qudt.unit_algebra import ADD
+from qudt.unit_algebra import DIVIDE
+from qudt.unit_algebra import MULTIPLY
+from qudt.unit_algebra import POWER
+from qudt.unit_algebra import SUBTRACT
+from qudt.unit_algebra import UnitAlgebra
 
 import dataclasses
+from typing import Any
 from typing import Optional
 
 
@@ -21,6 +29,11 @@ from typing import Optional
 class Quantity(object):
     """
     A quantity with a value and a unit.
+
+    Quantities support arithmetic. Sums and differences are in the unit of
+    the left operand, and products, quotients and powers are in a unit
+    derived from the operands' units, see UnitAlgebra. Quantities can also be
+    multiplied and divided by plain numbers.
     """
     value: float
     unit: Optional[Unit]
@@ -38,29 +51,102 @@ class Quantity(object):
         if not self.unit:
             raise ValueError('This measurement does not have units defined')
 
-        if self.unit == unit:
+        if self.unit is unit or self.unit == unit:
             # Nothing to be done
             return self
 
-        if self.unit.type_iri != unit.type_iri:
-            raise ValueError(
-                f'The new unit does not have the same parent type '
-                f'(source: {self.unit.type_iri}; target: {unit.type_iri})'
-            )
-
-        # Convert to the base unit
-        base_unit_value = self.value * self.unit.multiplier.multiplier + self.unit.multiplier.offset
-
-        # Convert the base unit to the new unit
-        new_value = (base_unit_value - unit.multiplier.offset) / unit.multiplier.multiplier
+        # Get the precomputed conversion between the units
+        converter = ConverterRegistry.get_converter(self.unit, unit)
 
         new_measurement = Quantity(
             unit=unit,
-            value=new_value,
+            value=converter(self.value),
         )
 
         return new_measurement
 
+    def __add__(self, other: Any) -> 'Quantity':
+        return self._combine(ADD, other)
+
+    def __sub__(self, other: Any) -> 'Quantity':
+        return self._combine(SUBTRACT, other)
+
+    def __mul__(self, other: Any) -> 'Quantity':
+        if isinstance(other, (int, float)):
+            return Quantity(value=self.value * other, unit=self.unit)
+
+        return self._combine(MULTIPLY, other)
+
+    def __rmul__(self, other: Any) -> 'Quantity':
+        if isinstance(other, (int, float)):
+            return Quantity(value=other * self.value, unit=self.unit)
+
+        return NotImplemented
+
+    def __truediv__(self, other: Any) -> 'Quantity':
+        if isinstance(other, (int, float)):
+            return Quantity(value=self.value / other, unit=self.unit)
+
+        return self._combine(DIVIDE, other)
+
+    def __rtruediv__(self, other: Any) -> 'Quantity':
+        if isinstance(other, (int, float)):
+            operation = UnitAlgebra.get_operation(POWER, self._get_unit(), -1)
+            return Quantity(value=other / self.value, unit=operation.unit)
+
+        return NotImplemented
+
+    def __pow__(self, exponent: Any) -> 'Quantity':
+        if not isinstance(exponent, int):
+            return NotImplemented
+
+        operation = UnitAlgebra.get_operation(POWER, self._get_unit(), exponent)
+
+        return Quantity(value=self.value ** exponent, unit=operation.unit)
+
+    def __neg__(self) -> 'Quantity':
+        return Quantity(value=-self.value, unit=self.unit)
+
+    def _combine(self, operator: str, other: Any) -> 'Quantity':
+        """
+        Helper function to apply an operator to two quantities.
+        """
+        if not isinstance(other, Quantity):
+            return NotImplemented
+
+        unit = self._get_unit()
+        other_unit = other._get_unit()
+
+        # Quantities of the same unit are added and subtracted as is
+        if operator in (ADD, SUBTRACT) and (unit is other_unit or unit == other_unit):
+            value = self.value + other.value if operator == ADD else self.value - other.value
+            return Quantity(value=value, unit=unit)
+
+        # Get the precomputed result of the operator for the units
+        operation = UnitAlgebra.get_operation(operator, unit, other_unit)
+
+        other_value = other.value * operation.scale
+
+        if operator == ADD:
+            value = self.value + other_value
+        elif operator == SUBTRACT:
+            value = self.value - other_value
+        elif operator == MULTIPLY:
+            value = self.value * other_value
+        else:
+            value = self.value / other_value
+
+        return Quantity(value=value, unit=operation.unit)
+
+    def _get_unit(self) -> Unit:
+        """
+        Helper function to get the unit of an operand.
+        """
+        if not self.unit:
+            raise ValueError('This measurement does not have units defined')
+
+        return self.unit
+
     def __repr__(self) -> str:
         """
         Return a string representation of the quantity.
@@ -0,0 +1,121 @@
+################################################################################
+#
+#  Copyright (C) 2019 Garrett Brown
+#  This file is part of pyqudt - https://github.com/eigendude/pyqudt
+#
+#  pyqudt is derived from jQUDT
+#  Copyright (C) 2012-2013  Egon Willighagen <egonw@users.sf.net>
+#
+#  SPDX-License-Identifier: BSD-3-Clause
+#  See the file LICENSE for more information.
+#
+################################################################################
+
+#
+# Vectorized conversions of arrays of values.
+#
+# This module requires NumPy, which can be installed with the "numpy" extra:
+#
+#   pip3 install pyqudt[numpy]
+#
+
+from qudt.converter import ConverterRegistry
+from qudt.quantity import Quantity
+from qudt.unit import Unit
+
+import dataclasses
+import numpy
+from typing import Any
+from typing import Optional
+
+
+def convert_array(
+        values: Any,
+        from_unit: Unit,
+        to_unit: Unit,
+        out: Optional[numpy.ndarray] = None,
+) -> numpy.ndarray:
+    """
+    Converts an array of values from one unit of measurement to another.
+
+    The units are checked once for the whole array, and the conversion is
+    applied as a single vectorized affine transform.
+
+    :param values: The values to convert, as an array or sequence of numbers
+    :param from_unit: The unit of the values
+    :param to_unit: The target unit
+    :param out: Optional array to store the result in. This may be the input
+                array itself to convert it in place.
+    :return: The converted values, which is `out` if specified
+    """
+    if not from_unit:
+        raise ValueError('Source unit cannot be null')
+
+    if not to_unit:
+        raise ValueError('Target unit cannot be null')
+
+    values = numpy.asarray(values, dtype=float) if out is None else numpy.asarray(values)
+
+    if from_unit is to_unit or from_unit == to_unit:
+        # Nothing to be done
+        if out is None:
+            return values.copy()
+        if out is not values:
+            numpy.copyto(out, values)
+        return out
+
+    # Get the precomputed conversion between the units
+    converter = ConverterRegistry.get_converter(from_unit, to_unit)
+
+    result: numpy.ndarray = numpy.multiply(values, converter.scale, out=out)
+    if converter.shift:
+        numpy.add(result, converter.shift, out=result)
+
+    return result
+
+
+@dataclasses.dataclass
+class QuantityArray(object):
+    """
+    An array of values sharing a unit.
+    """
+    values: numpy.ndarray
+    unit: Optional[Unit]
+
+    def convert_to(self, unit: Unit, out: Optional[numpy.ndarray] = None) -> 'QuantityArray':
+        """
+        Converts the values to the specified unit of measurement.
+
+        :param unit: The target unit
+        :param out: Optional array to store the converted values in. This may
+                    be the array's own values to convert it in place.
+        :return: The converted quantity array
+        """
+        if not unit:
+            raise ValueError('Target unit cannot be null')
+
+        if not self.unit:
+            raise ValueError('This measurement does not have units defined')
+
+        return QuantityArray(
+            values=convert_array(self.values, self.unit, unit, out=out),
+            unit=unit,
+        )
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, index: int) -> Quantity:
+        """
+        Get a single value of the array as a quantity.
+        """
+        return Quantity(
+            value=float(self.values[index]),
+            unit=self.unit,
+        )
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the quantity array.
+        """
+        return f'{self.values} {self.unit}'
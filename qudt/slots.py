@@ -0,0 +1,66 @@
+################################################################################
+#
+#  Copyright (C) 2019 Garrett Brown
+#  This file is part of pyqudt - https://github.com/eigendude/pyqudt
+#
+#  pyqudt is derived from jQUDT
+#  Copyright (C) 2012-2013  Egon Willighagen <egonw@users.sf.net>
+#
+#  SPDX-License-Identifier: BSD-3-Clause
+#  See the file LICENSE for more information.
+#
+################################################################################
+
+import dataclasses
+from typing import Any
+from typing import Dict
+from typing import Type
+from typing import TypeVar
+
+
+# Type definitions
+T = TypeVar('T')
+
+
+def add_slots(cls: Type[T]) -> Type[T]:
+    """
+    Class decorator that gives a dataclass __slots__ for its fields.
+
+    This is the equivalent of dataclass(slots=True), which requires Python
+    3.10. It must be applied on top of the dataclass decorator.
+
+    :param cls: The dataclass
+    :return: A copy of the dataclass that uses __slots__
+    """
+    field_names = tuple(field.name for field in dataclasses.fields(cls))  # type: ignore
+
+    # Field defaults are stored in the generated __init__(), so the class
+    # attributes can be replaced by slots
+    cls_dict: Dict[str, Any] = dict(cls.__dict__)
+    cls_dict['__slots__'] = field_names
+    for field_name in field_names:
+        cls_dict.pop(field_name, None)
+    cls_dict.pop('__dict__', None)
+    cls_dict.pop('__weakref__', None)
+
+    slotted_cls: Type[T] = type(cls.__name__, cls.__bases__, cls_dict)
+    slotted_cls.__qualname__ = cls.__qualname__
+
+    # Frozen dataclasses can't be unpickled with setattr()
+    if getattr(cls, '__dataclass_params__').frozen:
+        setattr(slotted_cls, '__getstate__', _get_state)
+        setattr(slotted_cls, '__setstate__', _set_state)
+
+    return slotted_cls
+
+
+def _get_state(self: Any) -> Dict[str, Any]:
+    return {
+        field.name: getattr(self, field.name)
+        for field in dataclasses.fields(self)
+    }
+
+
+def _set_state(self: Any, state: Dict[str, Any]) -> None:
+    for name, value in state.items():
+        object.__setattr__(self, name, value)
@@ -11,15 +11,26 @@
 #
 ################################################################################
 
+from qudt.dimension_vector import DimensionVector
 from qudt.multiplier import Multiplier
+from qudt.slots import add_slots
 
 import dataclasses
+from typing import Optional
 
 
-@dataclasses.dataclass
+@add_slots
+@dataclasses.dataclass(frozen=True)
 class Unit(object):
     """
     A unit of measurement.
+
+    Units are immutable and hashable, so they can be shared and used as
+    dictionary keys.
+
+    The dimension vector is derived from the unit's types when the unit is
+    created. It isn't part of the unit's identity, and is None if none of the
+    types have a known dimension.
     """
     resource_iri: str
     label: str = dataclasses.field(default_factory=str)
@@ -27,6 +38,7 @@ class Unit(object):
     symbol: str = dataclasses.field(default_factory=str)
     type_iri: str = dataclasses.field(default_factory=str)
     multiplier: Multiplier = dataclasses.field(default_factory=Multiplier)
+    dimension_vector: Optional[DimensionVector] = dataclasses.field(default=None, compare=False)
 
     def __repr__(self) -> str:
         return str(self.abbreviation)
@@ -0,0 +1,304 @@
+################################################################################
+#
+#  Copyright (C) 2019 Garrett Brown
+#  This file is part of pyqudt - https://github.com/eigendude/pyqudt
+#
+#  pyqudt is derived from jQUDT
+#  Copyright (C) 2012-2013  Egon Willighagen <egonw@users.sf.net>
+#
+#  SPDX-License-Identifier: BSD-3-Clause
+#  See the file LICENSE for more information.
+#
+################################################################################
+
+from qudt.converter import ConverterRegistry
+from qudt.dimension_vector import DimensionVector
+from qudt.lru_cache import CacheInfo
+from qudt.lru_cache import LRUCache
+from qudt.multiplier import Multiplier
+from qudt.slots import add_slots
+from qudt.unit import Unit
+
+import dataclasses
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+
+# The namespace of the resource IRIs of derived units
+DERIVED_UNIT_NAMESPACE = 'urn:pyqudt:unit:'
+
+# The operators of unit algebra
+ADD = '+'
+SUBTRACT = '-'
+MULTIPLY = '*'
+DIVIDE = '/'
+POWER = '**'
+
+# The default maximum number of cached operations, or None for no limit
+DEFAULT_OPERATION_CACHE_SIZE: Optional[int] = 1024
+
+
+@add_slots
+@dataclasses.dataclass(frozen=True)
+class Operation(object):
+    """
+    The result of an operator applied to quantities of two units: the unit of
+    the result, and the scale applied to the value of the right operand
+    before the values are combined.
+    """
+    unit: Unit
+    scale: float = dataclasses.field(default=1.0)
+
+
+class UnitAlgebra(object):
+    """
+    The units of sums, differences, products, quotients and powers of
+    quantities.
+
+    Products, quotients and powers are derived units, whose multiplier and
+    dimension vector are computed from their operands. A derived unit's type
+    is its dimension vector, so it can be converted to any unit with the same
+    dimension.
+
+    The result of each operator and pair of units is computed once, and is
+    cached for later operations.
+    """
+
+    _operations: LRUCache[Tuple[str, Unit, Union[Unit, int]], Operation] = LRUCache(DEFAULT_OPERATION_CACHE_SIZE)
+
+    @classmethod
+    def get_operation(cls, operator: str, left: Unit, right: Union[Unit, int]) -> Operation:
+        """
+        Get the result of an operator applied to quantities of two units.
+
+        :param operator: One of ADD, SUBTRACT, MULTIPLY, DIVIDE or POWER
+        :param left: The unit of the left operand
+        :param right: The unit of the right operand, or the integer exponent
+                      for POWER
+        :return: The operation
+        :raises ValueError: If the units can't be combined with the operator
+        """
+        key = (operator, left, right)
+
+        operation: Optional[Operation] = cls._operations.get(key)
+
+        if operation is None:
+            operation = cls._create_operation(operator, left, right)
+            cls._operations.put(key, operation)
+
+        return operation
+
+    @classmethod
+    def set_cache_size(cls, maxsize: Optional[int]) -> None:
+        """
+        Set the maximum number of cached operations.
+
+        :param maxsize: The maximum number of operations, or None for no limit
+        """
+        cls._operations.resize(maxsize)
+
+    @classmethod
+    def get_cache_info(cls) -> CacheInfo:
+        """
+        Get the statistics of the operation cache.
+
+        :return: The hits, misses, maximum size and current size of the cache
+        """
+        return cls._operations.info()
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """
+        Remove all operations from the cache.
+        """
+        cls._operations.clear()
+
+    @classmethod
+    def multiply(cls, left: Unit, right: Unit) -> Unit:
+        """
+        Derive the product of two units.
+
+        :param left: The left unit
+        :param right: The right unit
+        :return: The derived unit, e.g. N*m
+        :raises ValueError: If either unit has an offset
+        """
+        _check_no_offset(left, right)
+
+        return cls._create_unit(
+            resource_iri=f'{_wrap_iri(left)}*{_wrap_iri(right)}',
+            label=_join(left.label, ' ', right.label),
+            abbreviation=_join(left.abbreviation, '*', _wrap(right.abbreviation)),
+            symbol=_join(left.symbol, '*', _wrap(right.symbol)),
+            multiplier=left.multiplier.multiplier * right.multiplier.multiplier,
+            dimension_vector=(
+                left.dimension_vector * right.dimension_vector
+                if left.dimension_vector is not None and right.dimension_vector is not None else None
+            ),
+        )
+
+    @classmethod
+    def divide(cls, left: Unit, right: Unit) -> Unit:
+        """
+        Derive the quotient of two units.
+
+        :param left: The dividend unit
+        :param right: The divisor unit
+        :return: The derived unit, e.g. m/s
+        :raises ValueError: If either unit has an offset
+        """
+        _check_no_offset(left, right)
+
+        return cls._create_unit(
+            resource_iri=f'{_wrap_iri(left)}/{_wrap_iri(right)}',
+            label=_join(left.label, ' per ', right.label),
+            abbreviation=_join(left.abbreviation, '/', _wrap(right.abbreviation)),
+            symbol=_join(left.symbol, '/', _wrap(right.symbol)),
+            multiplier=left.multiplier.multiplier / right.multiplier.multiplier,
+            dimension_vector=(
+                left.dimension_vector / right.dimension_vector
+                if left.dimension_vector is not None and right.dimension_vector is not None else None
+            ),
+        )
+
+    @classmethod
+    def power(cls, unit: Unit, exponent: int) -> Unit:
+        """
+        Derive an integer power of a unit.
+
+        :param unit: The unit
+        :param exponent: The exponent
+        :return: The derived unit, e.g. m^2
+        :raises ValueError: If the unit has an offset
+        """
+        _check_no_offset(unit)
+
+        return cls._create_unit(
+            resource_iri=f'{_wrap_iri(unit)}^{exponent}',
+            label=_join(_wrap(unit.label, ' '), '^', str(exponent)),
+            abbreviation=_join(_wrap(unit.abbreviation, '*/^'), '^', str(exponent)),
+            symbol=_join(_wrap(unit.symbol, '*/^'), '^', str(exponent)),
+            multiplier=unit.multiplier.multiplier ** exponent,
+            dimension_vector=unit.dimension_vector ** exponent if unit.dimension_vector is not None else None,
+        )
+
+    @classmethod
+    def prefix(cls, prefix: Unit, unit: Unit) -> Unit:
+        """
+        Derive a prefixed unit, e.g. deciliters from deci and liters.
+
+        Unlike products, prefixed units keep the type of the unit, so they
+        can be converted to any unit of that type.
+
+        :param prefix: The prefix, as a unit whose symbol is the prefix symbol
+                       and whose multiplier is the prefix factor
+        :param unit: The unit
+        :return: The derived unit, e.g. dL
+        :raises ValueError: If the unit has an offset
+        """
+        _check_no_offset(unit)
+
+        resource_iri = DERIVED_UNIT_NAMESPACE + f'{_wrap_iri(prefix)}{_wrap_iri(unit)}'
+
+        return Unit(
+            resource_iri=resource_iri,
+            label=_join(prefix.label, '', unit.label[:1].lower() + unit.label[1:]),
+            abbreviation=_join(prefix.symbol, '', unit.abbreviation),
+            symbol=_join(prefix.symbol, '', unit.symbol),
+            type_iri=unit.type_iri or resource_iri,
+            multiplier=Multiplier(multiplier=prefix.multiplier.multiplier * unit.multiplier.multiplier),
+            dimension_vector=unit.dimension_vector,
+        )
+
+    @classmethod
+    def _create_operation(cls, operator: str, left: Unit, right: Union[Unit, int]) -> Operation:
+        """
+        Helper function to validate the operands of an operator and create
+        its operation.
+        """
+        if operator == POWER:
+            if not isinstance(right, int):
+                raise ValueError(f'Exponent must be an integer: {right}')
+            return Operation(unit=cls.power(left, right))
+
+        if not isinstance(right, Unit):
+            raise ValueError(f'Operand must be a unit: {right}')
+
+        if operator in (ADD, SUBTRACT):
+            if left is right or left == right:
+                return Operation(unit=left)
+
+            # The right operand is converted to the unit of the left operand.
+            # Differences of units with offsets, such as degrees Celsius and
+            # kelvins, are ambiguous.
+            converter = ConverterRegistry.get_converter(right, left)
+            if converter.shift:
+                raise ValueError(
+                    f'Quantities of units with different offsets cannot be added or subtracted '
+                    f'(left: {left.resource_iri}; right: {right.resource_iri})'
+                )
+
+            return Operation(unit=left, scale=converter.scale)
+
+        if operator == MULTIPLY:
+            return Operation(unit=cls.multiply(left, right))
+
+        if operator == DIVIDE:
+            return Operation(unit=cls.divide(left, right))
+
+        raise ValueError(f'Unknown operator: {operator}')
+
+    @staticmethod
+    def _create_unit(
+            resource_iri: str,
+            label: str,
+            abbreviation: str,
+            symbol: str,
+            multiplier: float,
+            dimension_vector: Optional[DimensionVector],
+    ) -> Unit:
+        """
+        Helper function to create a derived unit.
+        """
+        resource_iri = DERIVED_UNIT_NAMESPACE + resource_iri
+
+        return Unit(
+            resource_iri=resource_iri,
+            label=label,
+            abbreviation=abbreviation,
+            symbol=symbol,
+            # Without a dimension, a derived unit is only convertible to
+            # itself. So are dimensionless ones, like other dimensionless
+            # units, whose types tell e.g. ratios and counts apart.
+            type_iri=(
+                dimension_vector.iri
+                if dimension_vector is not None and not dimension_vector.is_dimensionless()
+                else resource_iri
+            ),
+            multiplier=Multiplier(multiplier=multiplier),
+            dimension_vector=dimension_vector,
+        )
+
+
+def _check_no_offset(*units: Unit) -> None:
+    for unit in units:
+        if unit.multiplier.offset:
+            raise ValueError(f'Units with an offset cannot be multiplied, divided, prefixed or raised to a power: {unit}')
+
+
+def _join(left: str, separator: str, right: str) -> str:
+    # A derived name is only known if the names of both operands are
+    return left + separator + right if left and right else ''
+
+
+def _wrap(name: str, operators: str = '*/') -> str:
+    # Composite names are parenthesized, so that m/(m*s) isn't read as m/m*s
+    return f'({name})' if any(operator in name for operator in operators) else name
+
+
+def _wrap_iri(unit: Unit) -> str:
+    resource_iri = unit.resource_iri
+    if resource_iri.startswith(DERIVED_UNIT_NAMESPACE):
+        return f'({resource_iri[len(DERIVED_UNIT_NAMESPACE):]})'
+    return f'<{resource_iri}>'
@@ -12,11 +12,11 @@
 ################################################################################
 
 from qudt.unit import Unit
-from qudt.ontology.unit_factory import UnitFactory
+from qudt.units.lazy_unit import LazyUnit
 
 
 class AreaUnit(object):
     """
     """
-    SQUARE_METER: Unit = UnitFactory.get_unit('http://qudt.org/vocab/unit#SquareMeter')
-    SQUARE_ANGSTROM: Unit = UnitFactory.get_unit('http://www.openphacts.org/units/SquareAngstrom')
+    SQUARE_METER: LazyUnit[Unit] = LazyUnit('http://qudt.org/vocab/unit#SquareMeter')
+    SQUARE_ANGSTROM: LazyUnit[Unit] = LazyUnit('http://www.openphacts.org/units/SquareAngstrom')
@@ -12,10 +12,10 @@
 ################################################################################
 
 from qudt.unit import Unit
-from qudt.ontology.unit_factory import UnitFactory
+from qudt.units.lazy_unit import LazyUnit
 
 
 class EnergyUnit(object):
     """
     """
-    EV: Unit = UnitFactory.get_unit('http://qudt.org/vocab/unit#ElectronVolt')
+    EV: LazyUnit[Unit] = LazyUnit('http://qudt.org/vocab/unit#ElectronVolt')
@@ -12,13 +12,13 @@
 ################################################################################
 
 from qudt.unit import Unit
-from qudt.ontology.unit_factory import UnitFactory
+from qudt.units.lazy_unit import LazyUnit
 
 
 class InformationUnit(object):
     """
     """
-    BYTE: Unit = UnitFactory.get_unit('http://qudt.org/vocab/unit#Byte')
-    KILOBYTE: Unit = UnitFactory.get_unit('http://aclima.io/schema/1.0/Kilobyte')
-    MEGABYTE: Unit = UnitFactory.get_unit('http://aclima.io/schema/1.0/Megabyte')
-    GIGABYTE: Unit = UnitFactory.get_unit('http://aclima.io/schema/1.0/Gigabyte')
+    BYTE: LazyUnit[Unit] = LazyUnit('http://qudt.org/vocab/unit#Byte')
+    KILOBYTE: LazyUnit[Unit] = LazyUnit('http://aclima.io/schema/1.0/Kilobyte')
+    MEGABYTE: LazyUnit[Unit] = LazyUnit('http://aclima.io/schema/1.0/Megabyte')
+    GIGABYTE: LazyUnit[Unit] = LazyUnit('http://aclima.io/schema/1.0/Gigabyte')
@@ -0,0 +1,119 @@
+################################################################################
+#
+#  Copyright (C) 2019 Garrett Brown
+#  This file is part of pyqudt - https://github.com/eigendude/pyqudt
+#
+#  pyqudt is derived from jQUDT
+#  Copyright (C) 2012-2013  Egon Willighagen <egonw@users.sf.net>
+#
+#  SPDX-License-Identifier: BSD-3-Clause
+#  See the file LICENSE for more information.
+#
+################################################################################
+
+from qudt.unit import Unit
+
+import importlib
+import inspect
+import pkgutil
+import threading
+from typing import Any
+from typing import Generic
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import TypeVar
+from typing import cast
+
+
+# Type definitions
+U = TypeVar('U', bound=Unit)
+
+
+class LazyUnit(Generic[U]):
+    """
+    A unit constant that is resolved by its resource IRI on first access.
+
+    Constants are declared as e.g. KELVIN: LazyUnit[Unit], so that type
+    checkers see the resolved unit when the constant is accessed.
+
+    Resolving a unit loads the ontology, so deferring it until the constant
+    is used keeps importing the unit modules cheap.
+
+    The resolved unit replaces the constant on its class until a repository
+    is loaded, when reset_all() restores the constant so that it's resolved
+    again with the new definitions.
+    """
+
+    # Lock guarding the resolved constants, so that a constant resolved while
+    # a repository is loaded can't outlive the reset
+    _lock = threading.Lock()
+
+    # The resolved constants, as (class, name, descriptor)
+    _resolved: List[Tuple[type, str, 'LazyUnit[Any]']] = list()
+
+    def __init__(self, resource_iri: str):
+        """
+        Create a lazily-resolved unit constant.
+
+        :param resource_iri: The unit's resource IRI
+        """
+        self.resource_iri = resource_iri
+        self._name: Optional[str] = None
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = name
+
+    def __get__(self, instance: Optional[object], owner: type) -> U:
+        # Imported here so that importing the unit modules doesn't import
+        # the RDF libraries
+        from qudt.ontology.unit_factory import UnitFactory
+
+        with LazyUnit._lock:
+            unit = UnitFactory.get_unit(self.resource_iri)
+
+            # Replace the descriptor with the resolved unit, so that later
+            # accesses are plain attribute lookups
+            if self._name is not None:
+                setattr(owner, self._name, unit)
+                LazyUnit._resolved.append((owner, self._name, self))
+
+        return cast(U, unit)
+
+    @staticmethod
+    def reset_all() -> None:
+        """
+        Restore the resolved unit constants, so that they are resolved again
+        on next access. Called when a repository is loaded.
+        """
+        with LazyUnit._lock:
+            for (owner, name, descriptor) in LazyUnit._resolved:
+                setattr(owner, name, descriptor)
+
+            LazyUnit._resolved.clear()
+
+    @staticmethod
+    def resolve_all() -> int:
+        """
+        Resolve the unit constants of all modules in the qudt.units package,
+        e.g. to load them before a service starts taking requests.
+
+        :return: The number of constants resolved
+        """
+        import qudt.units
+
+        count = 0
+
+        for module_info in pkgutil.iter_modules(qudt.units.__path__):
+            module = importlib.import_module(f'{qudt.units.__name__}.{module_info.name}')
+
+            for (_, owner) in inspect.getmembers(module, inspect.isclass):
+                if owner.__module__ != module.__name__:
+                    continue
+
+                for (name, value) in list(vars(owner).items()):
+                    if isinstance(value, LazyUnit):
+                        getattr(owner, name)
+                        count += 1
+
+        return count
@@ -12,10 +12,10 @@
 ################################################################################
 
 from qudt.unit import Unit
-from qudt.ontology.unit_factory import UnitFactory
+from qudt.units.lazy_unit import LazyUnit
 
 
 class LengthUnit(object):
     """
     """
-    NM: Unit = UnitFactory.get_unit('http://www.openphacts.org/units/Nanometer')
+    NM: LazyUnit[Unit] = LazyUnit('http://www.openphacts.org/units/Nanometer')
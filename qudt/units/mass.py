@@ -12,16 +12,16 @@
 ################################################################################
 
 from qudt.unit import Unit
-from qudt.ontology.unit_factory import UnitFactory
+from qudt.units.lazy_unit import LazyUnit
 
 
 class MassUnit(object):
     """
     """
-    KILOGRAM: Unit = UnitFactory.get_unit('http://qudt.org/vocab/unit#Kilogram')
-    GRAM: Unit = UnitFactory.get_unit('http://qudt.org/vocab/unit#Gram')
-    MILLIGRAM: Unit = UnitFactory.get_unit('http://www.openphacts.org/units/Milligram')
-    MICROGRAM: Unit = UnitFactory.get_unit('http://www.openphacts.org/units/Microgram')
-    NANOGRAM: Unit = UnitFactory.get_unit('http://www.openphacts.org/units/Nanogram')
-    PICOGRAM: Unit = UnitFactory.get_unit('http://www.openphacts.org/units/Picogram')
-    FEMTOGRAM: Unit = UnitFactory.get_unit('http://www.openphacts.org/units/Femtogram')
+    KILOGRAM: LazyUnit[Unit] = LazyUnit('http://qudt.org/vocab/unit#Kilogram')
+    GRAM: LazyUnit[Unit] = LazyUnit('http://qudt.org/vocab/unit#Gram')
+    MILLIGRAM: LazyUnit[Unit] = LazyUnit('http://www.openphacts.org/units/Milligram')
+    MICROGRAM: LazyUnit[Unit] = LazyUnit('http://www.openphacts.org/units/Microgram')
+    NANOGRAM: LazyUnit[Unit] = LazyUnit('http://www.openphacts.org/units/Nanogram')
+    PICOGRAM: LazyUnit[Unit] = LazyUnit('http://www.openphacts.org/units/Picogram')
+    FEMTOGRAM: LazyUnit[Unit] = LazyUnit('http://www.openphacts.org/units/Femtogram')
@@ -12,12 +12,12 @@
 ################################################################################
 
 from qudt.unit import Unit
-from qudt.ontology.unit_factory import UnitFactory
+from qudt.units.lazy_unit import LazyUnit
 
 
 class TemperatureUnit(object):
     """
     """
-    KELVIN: Unit = UnitFactory.get_unit('http://qudt.org/vocab/unit#Kelvin')
-    CELSIUS: Unit = UnitFactory.get_unit('http://qudt.org/vocab/unit#DegreeCelsius')
-    FAHRENHEIT: Unit = UnitFactory.get_unit('http://qudt.org/vocab/unit#DegreeFahrenheit')
+    KELVIN: LazyUnit[Unit] = LazyUnit('http://qudt.org/vocab/unit#Kelvin')
+    CELSIUS: LazyUnit[Unit] = LazyUnit('http://qudt.org/vocab/unit#DegreeCelsius')
+    FAHRENHEIT: LazyUnit[Unit] = LazyUnit('http://qudt.org/vocab/unit#DegreeFahrenheit')
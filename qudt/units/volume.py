@@ -12,12 +12,12 @@
 ################################################################################
 
 from qudt.unit import Unit
-from qudt.ontology.unit_factory import UnitFactory
+from qudt.units.lazy_unit import LazyUnit
 
 
 class VolumeUnit(object):
     """
     """
-    LITER: Unit = UnitFactory.get_unit('http://qudt.org/vocab/unit#Liter')
-    MICROLITER: Unit = UnitFactory.get_unit('http://www.openphacts.org/units/Microliter')
-    MILLILITER: Unit = UnitFactory.get_unit('http://www.openphacts.org/units/Milliliter')
+    LITER: LazyUnit[Unit] = LazyUnit('http://qudt.org/vocab/unit#Liter')
+    MICROLITER: LazyUnit[Unit] = LazyUnit('http://www.openphacts.org/units/Microliter')
+    MILLILITER: LazyUnit[Unit] = LazyUnit('http://www.openphacts.org/units/Milliliter')
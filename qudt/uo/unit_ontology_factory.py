@@ -11,113 +11,324 @@
 #
 ################################################################################
 
+from qudt.lru_cache import CacheInfo
+from qudt.lru_cache import LRUCache
 from qudt.unit import Unit
 from qudt.ontology.unit_factory import UnitFactory
+from qudt.uo.unit_ontology_mapping import UnitOntologyMapping
 
+import os
+import threading
 from typing import Dict
+from typing import Iterable
 from typing import List
+from typing import Mapping
 from typing import Optional
+from typing import Tuple
+
+
+# The package containing the mapping repositories
+MAPPING_PACKAGE_NAME = 'resources'
+
+# The mapping repositories to load
+MAPPING_FILES = [
+    'uo.jsonld',
+]
+
+# The default maximum number of cached units, or None for no limit
+DEFAULT_UNIT_CACHE_SIZE: Optional[int] = 1024
 
 
 def long_iri(shortened_iri: str) -> str:
-    if shortened_iri.startswith('uo:'):
-        return 'http://purl.obolibrary.org/obo/' + shortened_iri[3:]
-    elif shortened_iri.startswith('ops:'):
-        return 'http://www.openphacts.org/units/' + shortened_iri[4:]
-    elif shortened_iri.startswith('qudt:'):
-        return 'http://qudt.org/schema/qudt#' + shortened_iri[5:]
+    """
+    Expand a compact IRI, see UnitOntologyFactory.expand_curie().
+
+    :param shortened_iri: The compact IRI, e.g. 'uo:UO_0000065'
+    :return: The expanded IRI
+    :raises ValueError: If the IRI's prefix is unknown
+    """
+    resource_iri = UnitOntologyFactory.expand_curie(shortened_iri)
 
-    raise ValueError(f'Invalid shortened IRI: {shortened_iri}')
+    if resource_iri == shortened_iri:
+        raise ValueError(f'Invalid shortened IRI: {shortened_iri}')
+
+    return resource_iri
+
+
+class _MappingView(object):
+    """
+    A read-only view of the current mapping in one direction, which keeps the
+    uo_to_qudt and qudt_to_uo class attributes of earlier versions working.
+    """
+
+    def __init__(self, reverse: bool):
+        """
+        Create a view of the mapping.
+
+        :param reverse: False for the QUDT IRIs by Unit Ontology IRI, or True
+                        for the Unit Ontology IRIs by QUDT IRI
+        """
+        self._reverse = reverse
+
+    def __get__(self, instance: Optional[object], owner: type) -> Mapping[str, str]:
+        mapping = UnitOntologyFactory._get_mapping()
+
+        return mapping.get_qudt_to_uo() if self._reverse else mapping.get_uo_to_qudt()
 
 
 class UnitOntologyFactory(object):
     """
     A class for creating units from the Unit Ontology.
+
+    The mapping between Unit Ontology terms and QUDT units is read from the
+    bundled mapping repositories on first use, and can be extended with
+    load_mapping(). Resolved units are cached until repositories are loaded
+    into the UnitFactory.
     """
-    uo_to_qudt: Dict[str, str] = {
-        long_iri('uo:EFO_0004374'): long_iri('ops:MilligramPerDeciliter'),
-        long_iri('uo:EFO_0004385'): long_iri('ops:PicogramPerMilliliter'),
-        long_iri('uo:UO_0000009'): long_iri('qudt:Kilogram'),
-        long_iri('uo:UO_0000010'): long_iri('qudt:SecondTime'),
-        long_iri('uo:UO_0000015'): long_iri('qudt:Centimeter'),
-        long_iri('uo:UO_0000016'): long_iri('qudt:Millimeter'),
-        long_iri('uo:UO_0000017'): long_iri('qudt:Micrometer'),
-        long_iri('uo:UO_0000018'): long_iri('ops:Nanometer'),
-        long_iri('uo:UO_0000021'): long_iri('qudt:Gram'),
-        long_iri('uo:UO_0000022'): long_iri('ops:Milligram'),
-        long_iri('uo:UO_0000023'): long_iri('ops:Microgram'),
-        long_iri('uo:UO_0000024'): long_iri('ops:Nanogram'),
-        long_iri('uo:UO_0000025'): long_iri('ops:Picogram'),
-        long_iri('uo:UO_0000026'): long_iri('ops:Femtogram'),
-        long_iri('uo:UO_0000027'): long_iri('qudt:DegreeCelsius'),
-        long_iri('uo:UO_0000028'): long_iri('qudt:Millisecond'),
-        long_iri('uo:UO_0000031'): long_iri('qudt:MinuteTime'),
-        long_iri('uo:UO_0000032'): long_iri('qudt:Hour'),
-        long_iri('uo:UO_0000033'): long_iri('qudt:Day'),
-        long_iri('uo:UO_0000039'): long_iri('qudt:Micromole'),
-        long_iri('uo:UO_0000040'): long_iri('qudt:Millimole'),
-        long_iri('uo:UO_0000041'): long_iri('qudt:Nanomole'),
-        long_iri('uo:UO_0000042'): long_iri('qudt:Picomole'),
-        long_iri('uo:UO_0000043'): long_iri('qudt:Femtomole'),
-        long_iri('uo:UO_0000062'): long_iri('ops:Molar'),
-        long_iri('uo:UO_0000063'): long_iri('ops:Millimolar'),
-        long_iri('uo:UO_0000064'): long_iri('ops:Micromolar'),
-        long_iri('uo:UO_0000065'): long_iri('ops:Nanomolar'),
-        long_iri('uo:UO_0000066'): long_iri('ops:Picomolar'),
-        long_iri('uo:UO_0000073'): long_iri('ops:Femtomolar'),
-        long_iri('uo:UO_0000098'): long_iri('ops:Milliliter'),
-        long_iri('uo:UO_0000099'): long_iri('qudt:Liter'),
-        long_iri('uo:UO_0000101'): long_iri('ops:Microliter'),
-        long_iri('uo:UO_0000169'): long_iri('ops:PartsPerMillion'),
-        long_iri('uo:UO_0000173'): long_iri('ops:GramPerMilliliter'),
-        long_iri('uo:UO_0000175'): long_iri('ops:GramPerLiter'),
-        long_iri('uo:UO_0000176'): long_iri('ops:MilligramPerMilliliter'),
-        long_iri('uo:UO_0000187'): long_iri('qudt:Percent'),
-        long_iri('uo:UO_0000197'): long_iri('ops:LiterPerKilogram'),
-        long_iri('uo:UO_0000198'): long_iri('ops:MilliliterPerKilogram'),
-        long_iri('uo:UO_0000271'): long_iri('ops:MicroliterPerMinute'),
-        long_iri('uo:UO_0000272'): long_iri('qudt:MillimeterOfMercury'),
-        long_iri('uo:UO_0000274'): long_iri('ops:MicrogramPerMilliliter'),
-        long_iri('uo:UO_0000275'): long_iri('ops:NanogramPerMilliliter'),
-        long_iri('uo:UO_0000308'): long_iri('ops:MilligramPerKilogram'),
-        #long_iri('uo:UO_0000311'), longIRI(''),
-    }
-
-    # Reverse the lookup table
-    qudt_to_uo: Dict[str, str] = {
-        v: k for k, v in uo_to_qudt.items()
-    }
+
+    # Read-only views of the mapping, for compatibility
+    uo_to_qudt = _MappingView(reverse=False)
+    qudt_to_uo = _MappingView(reverse=True)
+
+    # The mapping, loaded on first use
+    _mapping: Optional[UnitOntologyMapping] = None
+
+    # Lock serializing changes to the mapping
+    _mapping_lock = threading.Lock()
+
+    # Resolved units, by UnitFactory generation and Unit Ontology IRI
+    _units: LRUCache[Tuple[int, str], Unit] = LRUCache(DEFAULT_UNIT_CACHE_SIZE)
 
     @classmethod
     def get_unit(cls, resource_iri: str) -> Optional[Unit]:
         """
         Get a unit from a Unit Ontology resource IRI.
 
-        :param resource_iri: The IRI of a resource in the Unit Ontology
+        :param resource_iri: The IRI or compact IRI of a resource in the Unit
+                             Ontology, e.g. 'uo:UO_0000065'
         :return: The resolved unit, or None on error
         """
-        mapped_iri: Optional[str] = cls.uo_to_qudt.get(resource_iri)
+        mapping = cls._get_mapping()
 
-        if mapped_iri:
-            return UnitFactory.get_unit(mapped_iri)
+        return cls._get_unit(mapping, UnitFactory.get_generation(), cls._expand_curie(mapping, resource_iri))
 
-        return None
+    @classmethod
+    def get_units(cls, resource_iris: Iterable[str]) -> List[Optional[Unit]]:
+        """
+        Get the units of a sequence of Unit Ontology resource IRIs, e.g. a
+        column of annotations.
+
+        :param resource_iris: The IRIs or compact IRIs of resources in the Unit
+                              Ontology
+        :return: The resolved unit of each IRI, or None for IRIs that aren't
+                 mapped, in the order of the IRIs
+        """
+        mapping = cls._get_mapping()
+        generation = UnitFactory.get_generation()
+
+        resolved: Dict[str, Optional[Unit]] = dict()
+        units: List[Optional[Unit]] = list()
+
+        for resource_iri in resource_iris:
+            if resource_iri in resolved:
+                unit = resolved[resource_iri]
+            else:
+                unit = resolved[resource_iri] = cls._get_unit(
+                    mapping,
+                    generation,
+                    cls._expand_curie(mapping, resource_iri),
+                )
+            units.append(unit)
+
+        return units
+
+    @classmethod
+    def get_qudt_iri(cls, resource_iri: str) -> Optional[str]:
+        """
+        Get the IRI of the QUDT unit of a Unit Ontology resource.
+
+        :param resource_iri: The IRI or compact IRI of a resource in the Unit
+                             Ontology
+        :return: The IRI of the QUDT unit, or None if the resource isn't mapped
+        """
+        mapping = cls._get_mapping()
+
+        return mapping.get_qudt_iri(cls._expand_curie(mapping, resource_iri))
+
+    @classmethod
+    def get_uo_iri(cls, qudt_iri: str) -> Optional[str]:
+        """
+        Get the IRI of the Unit Ontology resource of a QUDT unit.
+
+        :param qudt_iri: The IRI or compact IRI of the QUDT unit, e.g.
+                         'unit:Kelvin'
+        :return: The IRI of the Unit Ontology resource, or None if the unit
+                 isn't mapped
+        """
+        mapping = cls._get_mapping()
+
+        return mapping.get_uo_iri(cls._expand_curie(mapping, qudt_iri))
+
+    @classmethod
+    def expand_curie(cls, curie: str) -> str:
+        """
+        Expand a compact IRI, e.g. 'uo:UO_0000065' to
+        'http://purl.obolibrary.org/obo/UO_0000065'.
+
+        The prefixes declared by the mapping repositories are tried first,
+        then those of the UnitFactory, see UnitFactory.expand_curie().
+
+        :param curie: The compact IRI
+        :return: The expanded IRI, or the value unchanged if it isn't a compact
+                 IRI with a known prefix, such as an absolute IRI
+        """
+        return cls._expand_curie(cls._get_mapping(), curie)
 
     @classmethod
-    def get_iris(cls, type_iri: str) -> List[str]:
+    def get_iris(cls, type_iri: str, include_subtypes: bool = False) -> List[str]:
         """
         Return a list of unit IRIs with the given unit type.
 
         :param type_iri: The IRI of the unit type, e.g. 'http://qudt.org/schema/qudt#MolarConcentrationUnit'
+        :param include_subtypes: True to include the units of the subclasses
+                                 of the type, recursively
         :return: The list of IRIs, or empty if no units match the specified type
         """
-        iris: List[str] = list()
+        mapping = cls._get_mapping()
 
-        qudt_iris: List[str] = UnitFactory.get_iris(type_iri)
+        iris: List[str] = list()
 
-        for qudt_iri in qudt_iris:
-            uo_iri = cls.qudt_to_uo.get(qudt_iri)
+        for qudt_iri in UnitFactory.get_iris(type_iri, include_subtypes):
+            uo_iri = mapping.get_uo_iri(qudt_iri)
             if uo_iri:
                 iris.append(uo_iri)
 
         return iris
+
+    @classmethod
+    def load_mapping(cls, repo_file: str) -> int:
+        """
+        Load the skos:exactMatch statements of an RDF triplet repository,
+        whose subjects are Unit Ontology resources and whose objects are
+        QUDT units. Terms and units that are already mapped keep their
+        mapping.
+
+        :param repo_file: The path to the RDF triplet repository
+        :return: The number of statements read, or 0 if the file doesn't exist
+        """
+        # Load the bundled mappings first, so that they come first
+        cls._get_mapping()
+
+        with cls._mapping_lock:
+            mapping = cls._mapping
+            assert mapping is not None
+
+            # The mapping is copied and swapped in, so that lookups in
+            # progress aren't affected
+            new_mapping = mapping.copy()
+            try:
+                statement_count = new_mapping.add_repo(repo_file)
+            except FileNotFoundError:
+                return 0
+
+            cls._mapping = new_mapping
+            cls._units.clear()
+
+        return statement_count
+
+    @classmethod
+    def set_cache_size(cls, maxsize: Optional[int]) -> None:
+        """
+        Set the maximum number of cached units.
+
+        :param maxsize: The maximum number of units, or None for no limit
+        """
+        cls._units.resize(maxsize)
+
+    @classmethod
+    def get_cache_info(cls) -> CacheInfo:
+        """
+        Get the statistics of the unit cache.
+
+        :return: The hits, misses, maximum size and current size of the cache
+        """
+        return cls._units.info()
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """
+        Remove all units from the cache.
+        """
+        cls._units.clear()
+
+    @staticmethod
+    def _expand_curie(mapping: UnitOntologyMapping, curie: str) -> str:
+        """
+        Helper function to expand a compact IRI with the prefixes of a
+        mapping, falling back to those of the UnitFactory.
+        """
+        resource_iri = mapping.expand_curie(curie)
+
+        if resource_iri == curie:
+            resource_iri = UnitFactory.expand_curie(curie)
+
+        return resource_iri
+
+    @classmethod
+    def _get_unit(cls, mapping: UnitOntologyMapping, generation: int, resource_iri: str) -> Optional[Unit]:
+        """
+        Helper function to resolve a Unit Ontology resource, using the unit
+        cache.
+
+        Units are cached by the generation of the UnitFactory, so units
+        resolved before repositories were loaded are never returned after.
+        """
+        key = (generation, resource_iri)
+
+        unit: Optional[Unit] = cls._units.get(key)
+
+        if unit is None:
+            qudt_iri = mapping.get_qudt_iri(resource_iri)
+            if not qudt_iri:
+                return None
+
+            unit = UnitFactory.get_unit(qudt_iri)
+            cls._units.put(key, unit)
+
+        return unit
+
+    @classmethod
+    def _get_mapping(cls) -> UnitOntologyMapping:
+        """
+        Get the mapping, loading the bundled mapping repositories exactly
+        once.
+        """
+        mapping = cls._mapping
+
+        if mapping is None:
+            with cls._mapping_lock:
+                mapping = cls._mapping
+                if mapping is None:
+                    mapping = UnitOntologyMapping()
+                    for repo_path in cls._get_bundled_mapping_paths():
+                        try:
+                            mapping.add_repo(repo_path)
+                        except FileNotFoundError:
+                            continue
+                    cls._mapping = mapping
+
+        return mapping
+
+    @staticmethod
+    def _get_bundled_mapping_paths() -> List[str]:
+        """
+        Get the paths to the bundled mapping repositories.
+
+        :return: The paths, in the order the repositories are loaded
+        """
+        # Get the path to this package
+        package_path = os.path.dirname(os.path.realpath(__file__))
+
+        return [
+            os.path.join(package_path, MAPPING_PACKAGE_NAME, mapping_file) for mapping_file in MAPPING_FILES
+        ]
@@ -0,0 +1,145 @@
+################################################################################
+#
+#  Copyright (C) 2019 Garrett Brown
+#  This file is part of pyqudt - https://github.com/eigendude/pyqudt
+#
+#  pyqudt is derived from jQUDT
+#  Copyright (C) 2012-2013  Egon Willighagen <egonw@users.sf.net>
+#
+#  SPDX-License-Identifier: BSD-3-Clause
+#  See the file LICENSE for more information.
+#
+################################################################################
+
+from qudt.ontology.ontology_index import Statement
+from qudt.ontology.ontology_reader import OntologyReader
+from qudt.ontology.prefix_map import PrefixMap
+from qudt.ontology.skos import SKOS
+
+import types
+from typing import Dict
+from typing import Iterable
+from typing import Mapping
+from typing import Optional
+
+
+class UnitOntologyMapping(object):
+    """
+    A mapping between the terms of the Unit Ontology and QUDT units.
+
+    The mapping is read from skos:exactMatch statements whose subject is a
+    Unit Ontology term and whose object is a QUDT unit, and is compiled into
+    a forward and a reverse table. The first match of a term or unit wins.
+
+    The prefixes declared by the repositories, e.g. 'uo:', are kept to
+    expand compact IRIs.
+    """
+
+    def __init__(self):
+        """
+        Create an empty mapping.
+        """
+        # Unit Ontology IRI -> QUDT IRI
+        self._uo_to_qudt: Dict[str, str] = dict()
+
+        # QUDT IRI -> Unit Ontology IRI
+        self._qudt_to_uo: Dict[str, str] = dict()
+
+        # Namespace prefixes of the repositories
+        self._prefix_map = PrefixMap()
+
+    def __len__(self) -> int:
+        """
+        Get the number of mapped Unit Ontology terms.
+        """
+        return len(self._uo_to_qudt)
+
+    def copy(self) -> 'UnitOntologyMapping':
+        """
+        Create a copy of the mapping that can be extended without affecting
+        this mapping.
+
+        :return: The copy
+        """
+        mapping = UnitOntologyMapping()
+
+        mapping._uo_to_qudt = dict(self._uo_to_qudt)
+        mapping._qudt_to_uo = dict(self._qudt_to_uo)
+
+        # Prefix maps are never modified, so the copy can share it
+        mapping._prefix_map = self._prefix_map
+
+        return mapping
+
+    def add_repo(self, repo_path: str) -> int:
+        """
+        Add the mappings of an RDF triplet repository.
+
+        :param repo_path: The path to the repository
+        :return: The number of statements read
+        :raises FileNotFoundError: If the repository doesn't exist
+        """
+        statements = OntologyReader.read_statements(repo_path)
+
+        self.add_statements(statements)
+        self._prefix_map = self._prefix_map.extend([repo_path])
+
+        return len(statements)
+
+    def add_statements(self, statements: Iterable[Statement]) -> None:
+        """
+        Add the mappings of a sequence of statements. Statements that aren't
+        mappings are ignored.
+
+        :param statements: The statements
+        """
+        for (subject, predicate, obj) in statements:
+            if predicate == SKOS.EXACT_MATCH:
+                self._uo_to_qudt.setdefault(subject, obj)
+                self._qudt_to_uo.setdefault(obj, subject)
+
+    def get_qudt_iri(self, uo_iri: str) -> Optional[str]:
+        """
+        Get the QUDT unit of a Unit Ontology term.
+
+        :param uo_iri: The IRI of the Unit Ontology term
+        :return: The IRI of the QUDT unit, or None if the term isn't mapped
+        """
+        return self._uo_to_qudt.get(uo_iri)
+
+    def get_uo_iri(self, qudt_iri: str) -> Optional[str]:
+        """
+        Get the Unit Ontology term of a QUDT unit.
+
+        :param qudt_iri: The IRI of the QUDT unit
+        :return: The IRI of the Unit Ontology term, or None if the unit isn't
+                 mapped
+        """
+        return self._qudt_to_uo.get(qudt_iri)
+
+    def get_uo_to_qudt(self) -> Mapping[str, str]:
+        """
+        Get the QUDT units of all mapped Unit Ontology terms.
+
+        :return: A read-only view of the QUDT IRIs by Unit Ontology IRI
+        """
+        return types.MappingProxyType(self._uo_to_qudt)
+
+    def get_qudt_to_uo(self) -> Mapping[str, str]:
+        """
+        Get the Unit Ontology terms of all mapped QUDT units.
+
+        :return: A read-only view of the Unit Ontology IRIs by QUDT IRI
+        """
+        return types.MappingProxyType(self._qudt_to_uo)
+
+    def expand_curie(self, curie: str) -> str:
+        """
+        Expand a compact IRI with the prefixes of the mapping's repositories,
+        e.g. 'uo:UO_0000065' to 'http://purl.obolibrary.org/obo/UO_0000065'.
+
+        :param curie: The compact IRI
+        :return: The expanded IRI, or the value unchanged if it isn't a compact
+                 IRI with a known prefix
+        """
+        return self._prefix_map.expand(curie)
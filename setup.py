@@ -12,12 +12,38 @@
 ################################################################################
 
 import setuptools
+import setuptools.command.build_py
+import subprocess
+import sys
 
 
 with open('README.md') as file:
     long_description = file.read()
 
 
+class BuildPyCommand(setuptools.command.build_py.build_py):
+    """
+    Build command that also compiles the unit catalogs.
+
+    Compiling the catalogs needs the runtime dependencies, which are declared
+    as build requirements in pyproject.toml. The build fails if the catalogs
+    can't be compiled, so that packages are never shipped without them.
+    """
+    def run(self):
+        super().run()
+
+        if self.dry_run:
+            return
+
+        result = subprocess.call(
+            [sys.executable, '-m', 'qudt.ontology.build_catalog'],
+            cwd=self.build_lib,
+        )
+
+        if result != 0:
+            raise RuntimeError('Failed to compile the unit catalogs')
+
+
 setuptools.setup(
     name='pyqudt',
     version='1.1.0',
@@ -40,14 +66,28 @@ setuptools.setup(
         'Topic :: Scientific/Engineering :: Chemistry',
         'Topic :: Scientific/Engineering :: Physics',
     ],
-    packages=setuptools.find_packages(exclude=['test', 'test.*']),
+    packages=setuptools.find_packages(exclude=['benchmark', 'benchmark.*', 'test', 'test.*']),
     package_data={
         'qudt.ontology.resources': ['*'],
+        'qudt.uo.resources': ['*'],
         'qudt': ['py.typed'],
     },
+    cmdclass={
+        'build_py': BuildPyCommand,
+    },
     install_requires=[
         'PyLD',
         'rdflib',
         'rdflib-jsonld',
     ],
+    entry_points={
+        'console_scripts': [
+            'qudt-convert-csv=qudt.csv_converter:main',
+        ],
+    },
+    extras_require={
+        'numpy': [
+            'numpy',
+        ],
+    },
 )
@@ -11,6 +11,13 @@
 #
 ################################################################################
 
+from .benchmark_test import BenchmarkTest
+from .converter_test import ConverterTest
+from .csv_converter_test import CsvConverterTest
+from .dimension_vector_test import DimensionVectorTest
+from .lru_cache_test import LRUCacheTest
 from .multiplier_test import MultiplierTest
+from .quantity_array_test import QuantityArrayTest
 from .quantity_test import QuantityTest
+from .unit_algebra_test import UnitAlgebraTest
 from .unit_test import UnitTest
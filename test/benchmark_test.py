@@ -0,0 +1,78 @@
+################################################################################
+#
+#  Copyright (C) 2019 Garrett Brown
+#  This file is part of pyqudt - https://github.com/eigendude/pyqudt
+#
+#  pyqudt is derived from jQUDT
+#  Copyright (C) 2012-2013  Egon Willighagen <egonw@users.sf.net>
+#
+#  SPDX-License-Identifier: BSD-3-Clause
+#  See the file LICENSE for more information.
+#
+################################################################################
+
+
+from benchmark.__main__ import RESULTS_VERSION
+from benchmark.__main__ import _compare_results
+from benchmark.__main__ import main
+from benchmark.benchmarks import BenchmarkResult
+
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+import unittest.mock
+from typing import Any
+from typing import Dict
+
+
+class BenchmarkTest(unittest.TestCase):
+    @staticmethod
+    def _result(seconds: float) -> BenchmarkResult:
+        return BenchmarkResult(number=1, repeat=1, min=seconds, median=seconds, mean=seconds)
+
+    def test_compare_results(self) -> None:
+        results = {
+            'faster': self._result(0.5),
+            'slower': self._result(2.0),
+            'unchanged': self._result(1.0),
+            'new': self._result(1.0),
+            'untimed': self._result(1.0),
+        }
+        baseline = {
+            'faster': {'min': 1.0},
+            'slower': {'min': 1.0},
+            'unchanged': {'min': 1.0},
+            'untimed': {'min': 0.0},
+        }
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertEqual(['slower'], _compare_results(results, baseline, 0.25))
+            self.assertEqual([], _compare_results(results, baseline, 1.5))
+
+    def test_exit_status(self) -> None:
+        results = {'lookup': self._result(2.0)}
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            baseline_path = os.path.join(temp_dir, 'baseline.json')
+
+            def compare(baseline: Dict[str, Any]) -> int:
+                with open(baseline_path, 'w') as file:
+                    json.dump(baseline, file)
+
+                with unittest.mock.patch('benchmark.__main__.run_benchmarks', return_value=results):
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        return main(['--compare', baseline_path])
+
+            self.assertEqual(1, compare({'version': RESULTS_VERSION, 'results': {'lookup': {'min': 1.0}}}))
+            self.assertEqual(0, compare({'version': RESULTS_VERSION, 'results': {'lookup': {'min': 2.0}}}))
+
+            with contextlib.redirect_stderr(io.StringIO()):
+                with self.assertRaises(SystemExit):
+                    compare({'version': RESULTS_VERSION + 1, 'results': {}})
+
+
+if __name__ == '__main__':
+    unittest.main()
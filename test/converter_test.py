@@ -0,0 +1,118 @@
+################################################################################
+#
+#  Copyright (C) 2019 Garrett Brown
+#  This file is part of pyqudt - https://github.com/eigendude/pyqudt
+#
+#  pyqudt is derived from jQUDT
+#  Copyright (C) 2012-2013  Egon Willighagen <egonw@users.sf.net>
+#
+#  SPDX-License-Identifier: BSD-3-Clause
+#  See the file LICENSE for more information.
+#
+################################################################################
+
+from qudt.converter import Converter
+from qudt.converter import ConverterRegistry
+from qudt.converter import is_convertible
+from qudt.ontology.unit_factory import UnitFactory
+from qudt.quantity import Quantity
+from qudt.unit import Unit
+from qudt.units.concentration import ConcentrationUnit
+from qudt.units.dimensionless import DimensionlessUnit
+from qudt.units.energy import EnergyUnit
+from qudt.units.information import InformationUnit
+from qudt.units.temperature import TemperatureUnit
+
+import unittest
+
+
+class ConverterTest(unittest.TestCase):
+    def test_converter(self) -> None:
+        converter = Converter(scale=1.8, shift=32.0)
+
+        self.assertAlmostEqual(212.0, converter(100.0))
+
+    def test_convert_values(self) -> None:
+        converter = Converter(scale=1.8, shift=32.0)
+
+        self.assertEqual([converter(0.0), converter(100.0)], converter.convert_values([0.0, 100.0]))
+        self.assertEqual([2.0, 4.0], Converter(scale=2.0).convert_values([1.0, 2.0]))
+
+    def test_get_converter(self) -> None:
+        converter = ConverterRegistry.get_converter(TemperatureUnit.CELSIUS, TemperatureUnit.KELVIN)
+
+        self.assertEqual(1.0, converter.scale)
+        self.assertAlmostEqual(273.15, converter.shift)
+        self.assertAlmostEqual(293.15, converter(20.0))
+
+    def test_fused_scale(self) -> None:
+        converter = ConverterRegistry.get_converter(ConcentrationUnit.MICROMOLAR, ConcentrationUnit.NANOMOLAR)
+
+        self.assertEqual(1000.0, converter.scale)
+        self.assertEqual(100.0, converter(0.1))
+
+    def test_same_unit(self) -> None:
+        converter = ConverterRegistry.get_converter(TemperatureUnit.KELVIN, TemperatureUnit.KELVIN)
+
+        self.assertEqual(Converter(), converter)
+
+    def test_cached(self) -> None:
+        converter = ConverterRegistry.get_converter(TemperatureUnit.KELVIN, TemperatureUnit.CELSIUS)
+
+        hits = ConverterRegistry.get_cache_info().hits
+
+        self.assertIs(converter, ConverterRegistry.get_converter(TemperatureUnit.KELVIN, TemperatureUnit.CELSIUS))
+        self.assertEqual(hits + 1, ConverterRegistry.get_cache_info().hits)
+
+    def test_incompatible_units(self) -> None:
+        with self.assertRaises(ValueError):
+            ConverterRegistry.get_converter(TemperatureUnit.KELVIN, ConcentrationUnit.MOLAR)
+
+    def test_same_dimension(self) -> None:
+        # Electronvolts are energy and work units, joules are thermal energy
+        # units
+        joule = UnitFactory.get_unit('http://qudt.org/vocab/unit#Joule')
+
+        self.assertNotEqual(EnergyUnit.EV.type_iri, joule.type_iri)
+
+        converter = ConverterRegistry.get_converter(EnergyUnit.EV, joule)
+
+        self.assertEqual(1.6021765314e-19, converter.scale)
+        self.assertTrue(is_convertible(joule, EnergyUnit.EV))
+
+    def test_dimensionless_units(self) -> None:
+        dimension_vector = InformationUnit.BYTE.dimension_vector
+        assert dimension_vector is not None
+
+        self.assertTrue(dimension_vector.is_dimensionless())
+        self.assertFalse(is_convertible(InformationUnit.BYTE, DimensionlessUnit.UNITLESS))
+
+        with self.assertRaises(ValueError):
+            ConverterRegistry.get_converter(InformationUnit.BYTE, DimensionlessUnit.UNITLESS)
+
+    def test_isolated_types(self) -> None:
+        def get_unit(name: str) -> Unit:
+            return UnitFactory.get_unit(f'http://qudt.org/vocab/unit#{name}')
+
+        # Units of the same dimension, but of different kinds of quantities,
+        # aren't convertible
+        for (source, target) in (
+            ('Becquerel', 'Hertz'),
+            ('Gray', 'Sievert'),
+            ('Gray', 'JoulePerKilogram'),
+            ('Sievert', 'JoulePerKilogram'),
+        ):
+            self.assertEqual(get_unit(source).dimension_vector, get_unit(target).dimension_vector)
+            self.assertFalse(is_convertible(get_unit(source), get_unit(target)))
+            self.assertFalse(is_convertible(get_unit(target), get_unit(source)))
+
+        with self.assertRaises(ValueError):
+            Quantity(1.0, get_unit('Becquerel')).convert_to(get_unit('Hertz'))
+
+        # They are still convertible within their type
+        self.assertTrue(is_convertible(get_unit('Becquerel'), get_unit('Curie')))
+        self.assertAlmostEqual(0.01, ConverterRegistry.get_converter(get_unit('Rad'), get_unit('Gray')).scale)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,173 @@
+################################################################################
+#
+#  Copyright (C) 2019 Garrett Brown
+#  This file is part of pyqudt - https://github.com/eigendude/pyqudt
+#
+#  pyqudt is derived from jQUDT
+#  Copyright (C) 2012-2013  Egon Willighagen <egonw@users.sf.net>
+#
+#  SPDX-License-Identifier: BSD-3-Clause
+#  See the file LICENSE for more information.
+#
+################################################################################
+
+from qudt.converter import Converter
+from qudt.csv_converter import CsvConverter
+from qudt.csv_converter import main
+from qudt.units.concentration import ConcentrationUnit
+
+import io
+import os
+import tempfile
+import unittest
+import unittest.mock
+
+
+INPUT_CSV = (
+    'id,value,unit\r\n'
+    '1,0.1,μM\r\n'
+    '2,1,nM\r\n'
+    '3,,mM\r\n'
+    '4,2, μM \r\n'
+)
+
+
+class CsvConverterTest(unittest.TestCase):
+    def test_convert_rows(self) -> None:
+        converter = CsvConverter(ConcentrationUnit.NANOMOLAR, 'value', 'unit', chunk_size=2)
+
+        rows = converter.convert_rows([
+            {'value': '0.1', 'unit': 'μM'},
+            {'value': '1', 'unit': 'nM'},
+            {'value': '1', 'unit': 'mM'},
+        ])
+
+        self.assertEqual([
+            {'value': '100.0', 'unit': 'nM'},
+            {'value': '1.0', 'unit': 'nM'},
+            {'value': '1000000.0', 'unit': 'nM'},
+        ], list(rows))
+
+    def test_convert_rows_lazily(self) -> None:
+        converter = CsvConverter(ConcentrationUnit.NANOMOLAR, 'value', 'unit', chunk_size=1)
+
+        def rows():
+            yield {'value': '1', 'unit': 'nM'}
+            raise AssertionError('Read too many rows')
+
+        self.assertEqual({'value': '1.0', 'unit': 'nM'}, next(converter.convert_rows(rows())))
+
+    def test_invalid_unit(self) -> None:
+        converter = CsvConverter(ConcentrationUnit.NANOMOLAR, 'value', 'unit')
+
+        with self.assertRaises(ValueError):
+            list(converter.convert_rows([{'value': '1', 'unit': 'K'}]))
+
+    def test_skip_invalid(self) -> None:
+        converter = CsvConverter(ConcentrationUnit.NANOMOLAR, 'value', 'unit', skip_invalid=True)
+
+        rows = converter.convert_rows([
+            {'value': '1', 'unit': 'K'},
+            {'value': 'one', 'unit': 'nM'},
+            {'value': '2', 'unit': 'nM'},
+        ])
+
+        self.assertEqual([{'value': '2.0', 'unit': 'nM'}], list(rows))
+
+    def test_short_rows(self) -> None:
+        converter = CsvConverter(ConcentrationUnit.NANOMOLAR, 'value', 'unit')
+
+        with self.assertRaises(ValueError) as context:
+            converter.convert_file(io.StringIO('id,value,unit\r\n1,2\r\n'), io.StringIO())
+
+        self.assertIn('Row 1', str(context.exception))
+        self.assertIsInstance(context.exception.__cause__, ValueError)
+
+        converter = CsvConverter(ConcentrationUnit.NANOMOLAR, 'value', 'unit', skip_invalid=True)
+        output_file = io.StringIO()
+
+        self.assertEqual(1, converter.convert_file(io.StringIO('id,value,unit\r\n1,2\r\n2,3,nM\r\n'), output_file))
+        self.assertEqual('id,value,unit\r\n2,3.0,nM\r\n', output_file.getvalue())
+
+    def test_long_rows(self) -> None:
+        converter = CsvConverter(ConcentrationUnit.NANOMOLAR, 'value', 'unit')
+
+        with self.assertRaises(ValueError) as context:
+            converter.convert_file(io.StringIO('id,value,unit\r\n1,2,nM\r\n2,3,nM,extra\r\n'), io.StringIO())
+
+        self.assertIn('Row 2', str(context.exception))
+
+        converter = CsvConverter(ConcentrationUnit.NANOMOLAR, 'value', 'unit', skip_invalid=True)
+        output_file = io.StringIO()
+
+        self.assertEqual(1, converter.convert_file(io.StringIO('id,value,unit\r\n1,2,nM,extra\r\n2,3,nM\r\n'), output_file))
+        self.assertEqual('id,value,unit\r\n2,3.0,nM\r\n', output_file.getvalue())
+
+    def test_empty_value_with_invalid_unit(self) -> None:
+        converter = CsvConverter(ConcentrationUnit.NANOMOLAR, 'value', 'unit')
+
+        rows = converter.convert_rows([
+            {'value': '', 'unit': 'pyqudt-unknown'},
+            {'value': ' ', 'unit': 'K'},
+        ])
+
+        self.assertEqual(['', ' '], [row['value'] for row in rows])
+
+    def test_convert_chunk_by_unit(self) -> None:
+        converter = CsvConverter(ConcentrationUnit.NANOMOLAR, 'value', 'unit', chunk_size=4)
+
+        rows = [
+            {'value': '1', 'unit': 'μM'},
+            {'value': '2', 'unit': 'nM'},
+            {'value': '3', 'unit': 'μM'},
+            {'value': '', 'unit': 'μM'},
+        ]
+
+        with unittest.mock.patch.object(Converter, 'convert_values', autospec=True, side_effect=Converter.convert_values) as convert_values:
+            converted_rows = list(converter.convert_rows(rows))
+
+        # One call per unit
+        self.assertEqual(2, convert_values.call_count)
+        self.assertEqual(['1000.0', '2.0', '3000.0', ''], [row['value'] for row in converted_rows])
+
+    def test_convert_file(self) -> None:
+        converter = CsvConverter(ConcentrationUnit.NANOMOLAR, 'value', 'unit', normalize_whitespace=True)
+
+        output_file = io.StringIO()
+
+        row_count = converter.convert_file(io.StringIO(INPUT_CSV), output_file)
+
+        self.assertEqual(4, row_count)
+        self.assertEqual(
+            'id,value,unit\r\n'
+            '1,100.0,nM\r\n'
+            '2,1.0,nM\r\n'
+            '3,,nM\r\n'
+            '4,2000.0,nM\r\n',
+            output_file.getvalue(),
+        )
+
+    def test_missing_column(self) -> None:
+        converter = CsvConverter(ConcentrationUnit.NANOMOLAR, 'concentration', 'unit')
+
+        with self.assertRaises(ValueError):
+            converter.convert_file(io.StringIO(INPUT_CSV), io.StringIO())
+
+    def test_main(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_path = os.path.join(temp_dir, 'input.tsv')
+            output_path = os.path.join(temp_dir, 'output.tsv')
+
+            with open(input_path, 'w', newline='', encoding='utf-8') as file:
+                file.write(INPUT_CSV.replace(',', '\t'))
+
+            self.assertEqual(0, main(['--to', 'μM', '--tsv', input_path, output_path]))
+
+            with open(output_path, newline='', encoding='utf-8') as file:
+                lines = file.read().splitlines()
+
+        self.assertEqual(['id\tvalue\tunit', '1\t0.1\tμM', '2\t0.001\tμM', '3\t\tμM', '4\t2.0\tμM'], lines)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+################################################################################
+#
+#  Copyright (C) 2019 Garrett Brown
+#  This file is part of pyqudt - https://github.com/eigendude/pyqudt
+#
+#  pyqudt is derived from jQUDT
+#  Copyright (C) 2012-2013  Egon Willighagen <egonw@users.sf.net>
+#
+#  SPDX-License-Identifier: BSD-3-Clause
+#  See the file LICENSE for more information.
+#
+################################################################################
+
+from qudt.dimension_vector import DIMENSIONLESS
+from qudt.dimension_vector import DimensionVector
+from qudt.units.mass import MassUnit
+from qudt.units.temperature import TemperatureUnit
+
+import unittest
+
+LENGTH = DimensionVector(length=1)
+MASS = DimensionVector(mass=1)
+TIME = DimensionVector(time=1)
+
+
+class DimensionVectorTest(unittest.TestCase):
+    def test_from_iri(self) -> None:
+        force = DimensionVector.from_iri('http://qudt.org/vocab/dimensionvector/A0E0L1I0M1H0T-2D0')
+
+        self.assertEqual(DimensionVector(length=1, mass=1, time=-2), force)
+        self.assertEqual('http://qudt.org/vocab/dimensionvector/A0E0L1I0M1H0T-2D0', force.iri)
+        self.assertEqual('http://qudt.org/vocab/dimensionvector/A0E0L0I0M0H0T0D1', DIMENSIONLESS.iri)
+
+    def test_invalid_iri(self) -> None:
+        for iri in (
+            'http://qudt.org/vocab/dimensionvector/A0E0L0.5I0M0H0T0D0',
+            'http://qudt.org/vocab/unit#Kelvin',
+            '',
+        ):
+            with self.assertRaises(ValueError):
+                DimensionVector.from_iri(iri)
+
+    def test_arithmetic(self) -> None:
+        acceleration = LENGTH / TIME ** 2
+
+        self.assertEqual(DimensionVector(length=1, time=-2), acceleration)
+        self.assertEqual(DimensionVector(length=1, mass=1, time=-2), MASS * acceleration)
+        self.assertEqual(DIMENSIONLESS, LENGTH / LENGTH)
+        self.assertEqual(LENGTH ** -1, DIMENSIONLESS / LENGTH)
+
+    def test_dimensionless(self) -> None:
+        self.assertTrue(DIMENSIONLESS.is_dimensionless())
+        self.assertTrue((MASS / MASS).is_dimensionless())
+        self.assertFalse(MASS.is_dimensionless())
+
+    def test_units(self) -> None:
+        self.assertEqual(MASS, MassUnit.KILOGRAM.dimension_vector)
+        self.assertEqual(MASS, MassUnit.NANOGRAM.dimension_vector)
+        self.assertEqual(DimensionVector(temperature=1), TemperatureUnit.CELSIUS.dimension_vector)
+
+
+if __name__ == '__main__':
+    unittest.main()
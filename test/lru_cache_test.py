@@ -0,0 +1,119 @@
+################################################################################
+#
+#  Copyright (C) 2019 Garrett Brown
+#  This file is part of pyqudt - https://github.com/eigendude/pyqudt
+#
+#  pyqudt is derived from jQUDT
+#  Copyright (C) 2012-2013  Egon Willighagen <egonw@users.sf.net>
+#
+#  SPDX-License-Identifier: BSD-3-Clause
+#  See the file LICENSE for more information.
+#
+################################################################################
+
+from qudt.lru_cache import CacheInfo
+from qudt.lru_cache import LRUCache
+
+import threading
+import unittest
+from typing import List
+from typing import Optional
+
+
+class LRUCacheTest(unittest.TestCase):
+    def test_get_put(self) -> None:
+        cache: LRUCache[str, int] = LRUCache(2)
+
+        self.assertIsNone(cache.get('a'))
+
+        cache.put('a', 1)
+
+        self.assertEqual(1, cache.get('a'))
+        self.assertEqual(CacheInfo(hits=1, misses=1, maxsize=2, currsize=1), cache.info())
+
+    def test_evict_least_recently_used(self) -> None:
+        cache: LRUCache[str, int] = LRUCache(2)
+
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+
+        self.assertEqual(1, cache.get('a'))
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(3, cache.get('c'))
+
+    def test_unbounded(self) -> None:
+        cache: LRUCache[int, int] = LRUCache(None)
+
+        for i in range(1000):
+            cache.put(i, i)
+
+        self.assertEqual(1000, len(cache))
+
+    def test_resize(self) -> None:
+        cache: LRUCache[int, int] = LRUCache(None)
+
+        for i in range(10):
+            cache.put(i, i)
+
+        cache.resize(3)
+
+        self.assertEqual(3, len(cache))
+        self.assertEqual(9, cache.get(9))
+        self.assertIsNone(cache.get(0))
+
+    def test_clear(self) -> None:
+        cache: LRUCache[str, int] = LRUCache()
+
+        cache.put('a', 1)
+        cache.get('a')
+        cache.clear()
+
+        self.assertEqual(0, len(cache))
+        self.assertEqual(1, cache.info().hits)
+
+    def test_get_without_lock(self) -> None:
+        cache: LRUCache[str, int] = LRUCache()
+
+        cache.put('a', 1)
+
+        results: List[Optional[int]] = list()
+
+        # Hits are served while another thread holds the lock
+        with cache._lock:
+            thread = threading.Thread(target=lambda: results.append(cache.get('a')))
+            thread.start()
+            thread.join(timeout=10)
+
+        self.assertEqual([1], results)
+
+    def test_concurrent_get_put(self) -> None:
+        cache: LRUCache[int, int] = LRUCache(64)
+
+        errors: List[BaseException] = list()
+
+        def run(offset: int) -> None:
+            try:
+                for i in range(2000):
+                    key = (i * 7 + offset) % 200
+                    value = cache.get(key)
+                    if value is None:
+                        cache.put(key, key)
+                    elif value != key:
+                        raise AssertionError(f'{key} cached as {value}')
+            except BaseException as error:
+                errors.append(error)
+
+        threads = [threading.Thread(target=run, args=(offset,)) for offset in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([], errors)
+        self.assertLessEqual(len(cache), 64)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -23,6 +23,10 @@ class MultiplierTest(unittest.TestCase):
         self.assertAlmostEqual(0.1, multiplier.offset)
         self.assertAlmostEqual(0.2, multiplier.multiplier)
 
+    def test_hash(self) -> None:
+        self.assertEqual(hash(Multiplier(0.1, 0.2)), hash(Multiplier(0.1, 0.2)))
+        self.assertNotEqual(Multiplier(0.1, 0.2), Multiplier(0.2, 0.1))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -11,7 +11,19 @@
 #
 ################################################################################
 
+from .async_unit_factory_test import AsyncUnitFactoryTest
+from .atomic_file_test import AtomicFileTest
+from .code_stamp_test import CodeStampTest
+from .compact_unit_table_test import CompactUnitTableTest
+from .json_ld_reader_test import JsonLdReaderTest
+from .mapped_catalog_test import MappedCatalogTest
+from .ontology_index_test import OntologyIndexTest
 from .ontology_reader_test import OntologyReaderTest
 from .ontology_utils_test import OntologyUtilsTest
+from .prefix_map_test import PrefixMapTest
 from .qudt_test import QUDTTest
+from .repo_cache_test import RepoCacheTest
+from .unit_catalog_test import UnitCatalogTest
+from .unit_expression_parser_test import UnitExpressionParserTest
+from .unit_factory_concurrency_test import UnitFactoryConcurrencyTest
 from .unit_factory_test import UnitFactoryTest
@@ -0,0 +1,130 @@
+################################################################################
+#
+#  Copyright (C) 2019 Garrett Brown
+#  This file is part of pyqudt - https://github.com/eigendude/pyqudt
+#
+#  pyqudt is derived from jQUDT
+#  Copyright (C) 2012-2013  Egon Willighagen <egonw@users.sf.net>
+#
+#  SPDX-License-Identifier: BSD-3-Clause
+#  See the file LICENSE for more information.
+#
+################################################################################
+
+
+from qudt.ontology.async_unit_factory import AsyncUnitFactory
+from qudt.ontology.unit_factory import UnitFactory
+
+import asyncio
+import json
+import os
+import tempfile
+import time
+import unittest
+import unittest.mock
+from typing import Any
+from typing import Awaitable
+from typing import List
+
+WAITER_COUNT = 8
+
+
+def _run(awaitable: Awaitable[Any]) -> Any:
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(awaitable)
+    finally:
+        loop.close()
+
+
+class AsyncUnitFactoryTest(unittest.TestCase):
+    def test_ready_loads_once(self) -> None:
+        UnitFactory._get_instance()
+
+        original_instance = UnitFactory._instance
+        original_warm_up_future = UnitFactory._warm_up_future
+        original_init = UnitFactory.__init__
+
+        def slow_init(factory: UnitFactory) -> None:
+            time.sleep(0.2)
+            original_init(factory)
+
+        ticks: List[float] = list()
+
+        async def tick() -> None:
+            while UnitFactory._instance is None:
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.01)
+
+        async def wait_ready() -> None:
+            await asyncio.gather(tick(), *[AsyncUnitFactory.ready() for _ in range(WAITER_COUNT)])
+
+        try:
+            UnitFactory._instance = None
+            UnitFactory._warm_up_future = None
+            AsyncUnitFactory._ready_future = None
+
+            with unittest.mock.patch.object(UnitFactory, '__init__', autospec=True, side_effect=slow_init) as init:
+                _run(wait_ready())
+
+                self.assertEqual(1, init.call_count)
+                self.assertTrue(UnitFactory.is_ready())
+        finally:
+            UnitFactory._instance = original_instance
+            UnitFactory._warm_up_future = original_warm_up_future
+
+        # The event loop kept running while the factory was loaded
+        self.assertGreater(len(ticks), 1)
+
+    def test_lookups(self) -> None:
+        async def look_up() -> None:
+            unit = await AsyncUnitFactory.get_unit('unit:Kelvin')
+
+            self.assertIs(UnitFactory.get_unit('http://qudt.org/vocab/unit#Kelvin'), unit)
+            self.assertIn(unit, await AsyncUnitFactory.get_units('qudt:TemperatureUnit'))
+            self.assertIn(unit.resource_iri, await AsyncUnitFactory.get_iris('qudt:TemperatureUnit'))
+            self.assertEqual([unit], await AsyncUnitFactory.find_units_by_label('Kelvin'))
+            self.assertEqual(UnitFactory.find_units('nM'), await AsyncUnitFactory.find_units('nM'))
+            self.assertEqual(UnitFactory.find_units_by_symbol('K'), await AsyncUnitFactory.find_units_by_symbol('K'))
+            self.assertIs(UnitFactory.parse_unit('mg/dL'), await AsyncUnitFactory.parse_unit('mg/dL'))
+            self.assertIs(
+                UnitFactory.get_prefixed_unit('k', 'unit:Byte'),
+                await AsyncUnitFactory.get_prefixed_unit('k', 'unit:Byte'),
+            )
+
+        _run(look_up())
+
+    def test_load_repo_async(self) -> None:
+        repo = {
+            '@context': {
+                'qudt': 'http://qudt.org/schema/qudt#',
+            },
+            '@graph': [
+                {
+                    '@id': 'urn:pyqudt:test:League',
+                    '@type': 'urn:pyqudt:test:DistanceUnit',
+                    'qudt:abbreviation': 'pyqudt-lea',
+                    'qudt:conversionMultiplier': 4828.032,
+                },
+            ],
+        }
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            repo_path = os.path.join(temp_dir, 'league.jsonld')
+            with open(repo_path, 'w') as file:
+                json.dump(repo, file)
+
+            self.assertEqual(3, _run(AsyncUnitFactory.load_repo_async(repo_path)))
+
+            # The tables of the new snapshot were built in the executor
+            self.assertIsNotNone(UnitFactory._get_instance()._snapshot.prefixes)
+
+            self.assertEqual(0, _run(AsyncUnitFactory.load_repos_async([os.path.join(temp_dir, 'missing.jsonld')])))
+
+        unit = _run(AsyncUnitFactory.get_unit('urn:pyqudt:test:League'))
+
+        self.assertAlmostEqual(4828.032, unit.multiplier.multiplier)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,38 @@
+################################################################################
+#
+#  Copyright (C) 2019 Garrett Brown
+#  This file is part of pyqudt - https://github.com/eigendude/pyqudt
+#
+#  pyqudt is derived from jQUDT
+#  Copyright (C) 2012-2013  Egon Willighagen <egonw@users.sf.net>
+#
+#  SPDX-License-Identifier: BSD-3-Clause
+#  See the file LICENSE for more information.
+#
+################################################################################
+
+
+from qudt.ontology.atomic_file import AtomicFile
+
+import os
+import tempfile
+import unittest
+
+
+class AtomicFileTest(unittest.TestCase):
+    def test_write(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'data.bin')
+
+            AtomicFile.write(b'first', path)
+            AtomicFile.write(b'second', path)
+
+            with open(path, 'rb') as file:
+                self.assertEqual(b'second', file.read())
+
+            # No temporary files are left behind
+            self.assertEqual(['data.bin'], os.listdir(temp_dir))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,35 @@
+################################################################################
+#
+#  Copyright (C) 2019 Garrett Brown
+#  This file is part of pyqudt - https://github.com/eigendude/pyqudt
+#
+#  pyqudt is derived from jQUDT
+#  Copyright (C) 2012-2013  Egon Willighagen <egonw@users.sf.net>
+#
+#  SPDX-License-Identifier: BSD-3-Clause
+#  See the file LICENSE for more information.
+#
+################################################################################
+
+from qudt.ontology.code_stamp import CodeStamp
+
+import unittest
+
+
+class CodeStampTest(unittest.TestCase):
+    def test_get_digest(self) -> None:
+        digest = CodeStamp.get_digest(('qudt.ontology.ontology_reader',))
+
+        self.assertEqual(32, len(digest))
+        self.assertEqual(digest, CodeStamp.get_digest(('qudt.ontology.ontology_reader',)))
+        self.assertNotEqual(digest, CodeStamp.get_digest(('qudt.ontology.json_ld_reader',)))
+
+    def test_missing_module(self) -> None:
+        self.assertNotEqual(
+            CodeStamp.get_digest(('pyqudt_missing_module',)),
+            CodeStamp.get_digest(('pyqudt_other_missing_module',)),
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+################################################################################
+#
+#  Copyright (C) 2019 Garrett Brown
+#  This file is part of pyqudt - https://github.com/eigendude/pyqudt
+#
+#  pyqudt is derived from jQUDT
+#  Copyright (C) 2012-2013  Egon Willighagen <egonw@users.sf.net>
+#
+#  SPDX-License-Identifier: BSD-3-Clause
+#  See the file LICENSE for more information.
+#
+################################################################################
+
+from qudt.ontology.compact_unit_table import CompactUnitTable
+from qudt.ontology.ontology_index import OntologyIndex
+from qudt.ontology.qudt import QUDT
+from qudt.ontology.rdf import RDF
+from qudt.ontology.rdfs import RDFS
+from qudt.ontology.unit_factory import UnitFactory
+from qudt.dimension_vector import DimensionVector
+from qudt.multiplier import Multiplier
+from qudt.unit import Unit
+
+import unittest
+
+FURLONG_IRI = 'urn:pyqudt:test:Furlong'
+CHAIN_IRI = 'urn:pyqudt:test:Chain'
+LENGTH_UNIT_IRI = 'urn:pyqudt:test:LengthUnit'
+LENGTH_VECTOR_IRI = 'http://qudt.org/vocab/dimensionvector/A0E0L1I0M0H0T0D0'
+AREA_VECTOR_IRI = 'http://qudt.org/vocab/dimensionvector/A0E0L2I0M0H0T0D0'
+
+STATEMENTS = [
+    (FURLONG_IRI, RDF.TYPE, LENGTH_UNIT_IRI),
+    (FURLONG_IRI, RDF.TYPE, QUDT.DERIVED_UNIT),
+    (FURLONG_IRI, RDFS.LABEL, 'Furlong'),
+    (FURLONG_IRI, QUDT.ABBREVIATION, 'fur'),
+    (FURLONG_IRI, QUDT.CONVERSION_MULTIPLIER, '201.168'),
+    (FURLONG_IRI, 'http://qudt.org/schema/qudt#description', 'An eighth of a mile'),
+    (CHAIN_IRI, RDF.TYPE, LENGTH_UNIT_IRI),
+    (CHAIN_IRI, QUDT.ABBREVIATION, 'FUR'),
+    (CHAIN_IRI, QUDT.CONVERSION_MULTIPLIER, 'invalid'),
+]
+
+
+class CompactUnitTableTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.table = CompactUnitTable(UnitFactory._should_be_ignored)
+        self.table.add_statements(STATEMENTS)
+
+        # The index that the table is compared against
+        self.index = OntologyIndex()
+        self.index.add_statements(STATEMENTS)
+
+    def test_get_unit(self) -> None:
+        unit = self.table.get_unit(FURLONG_IRI)
+        assert unit is not None
+
+        self.assertEqual(UnitFactory._create_unit(self.index, FURLONG_IRI), unit)
+        self.assertEqual(LENGTH_UNIT_IRI, unit.type_iri)
+
+        # Invalid multipliers are ignored
+        chain = self.table.get_unit(CHAIN_IRI)
+        assert chain is not None
+
+        self.assertEqual(Multiplier(), chain.multiplier)
+
+        self.assertIsNone(self.table.get_unit('urn:pyqudt:test:Missing'))
+
+    def test_later_values_replace_earlier_ones(self) -> None:
+        self.table.add_statement(FURLONG_IRI, RDFS.LABEL, 'Furlong (survey)')
+
+        unit = self.table.get_unit(FURLONG_IRI)
+        assert unit is not None
+
+        self.assertEqual('Furlong (survey)', unit.label)
+
+    def test_dimension_vector(self) -> None:
+        unit = self.table.get_unit(FURLONG_IRI)
+        assert unit is not None
+
+        self.assertIsNone(unit.dimension_vector)
+
+        # Units have the dimension of their type, unless they have their own
+        self.table.add_statement(LENGTH_UNIT_IRI, QUDT.HAS_DIMENSION_VECTOR, LENGTH_VECTOR_IRI)
+        self.table.add_statement(CHAIN_IRI, QUDT.HAS_DIMENSION_VECTOR, AREA_VECTOR_IRI)
+        self.table.add_statement(FURLONG_IRI, QUDT.HAS_DIMENSION_VECTOR, 'invalid')
+        self.index.add_statement(LENGTH_UNIT_IRI, QUDT.HAS_DIMENSION_VECTOR, LENGTH_VECTOR_IRI)
+        self.index.add_statement(FURLONG_IRI, QUDT.HAS_DIMENSION_VECTOR, 'invalid')
+
+        unit = self.table.get_unit(FURLONG_IRI)
+        assert unit is not None
+
+        self.assertEqual(DimensionVector(length=1), unit.dimension_vector)
+        self.assertEqual(unit.dimension_vector, UnitFactory._create_unit(self.index, FURLONG_IRI).dimension_vector)
+
+        chain = self.table.get_unit(CHAIN_IRI)
+        assert chain is not None
+
+        self.assertEqual(DimensionVector(length=2), chain.dimension_vector)
+
+    def test_get_subjects(self) -> None:
+        self.assertEqual([FURLONG_IRI], self.table.get_subjects_by_name(QUDT.ABBREVIATION, 'fur'))
+        self.assertEqual(
+            [FURLONG_IRI, CHAIN_IRI],
+            self.table.get_subjects_by_name(QUDT.ABBREVIATION, 'fur', ignore_case=True),
+        )
+        self.assertEqual(
+            [FURLONG_IRI, CHAIN_IRI],
+            self.table.get_subjects_by_name(QUDT.ABBREVIATION, ' FUR ', ignore_case=True, normalize_whitespace=True),
+        )
+        self.assertEqual([FURLONG_IRI, CHAIN_IRI], self.table.get_subjects_by_type(LENGTH_UNIT_IRI))
+        self.assertEqual([], self.table.get_subjects_by_type('urn:pyqudt:test:Missing'))
+
+    def test_get_subclasses(self) -> None:
+        self.table.add_statement(LENGTH_UNIT_IRI, RDFS.SUB_CLASS_OF, 'urn:pyqudt:test:SpaceAndTimeUnit')
+
+        self.assertEqual([LENGTH_UNIT_IRI], self.table.get_subclasses('urn:pyqudt:test:SpaceAndTimeUnit'))
+        self.assertEqual([], self.table.get_subclasses(LENGTH_UNIT_IRI))
+
+    def test_copy(self) -> None:
+        table = self.table.copy()
+        table.add_statement(FURLONG_IRI, QUDT.SYMBOL, 'fur')
+        table.add_statement('urn:pyqudt:test:Rod', RDF.TYPE, LENGTH_UNIT_IRI)
+
+        unit = self.table.get_unit(FURLONG_IRI)
+        assert unit is not None
+
+        self.assertEqual('', unit.symbol)
+        self.assertEqual(2, len(self.table))
+        self.assertEqual(3, len(table))
+
+    def test_unit_factory(self) -> None:
+        UnitFactory.set_compact_mode(True)
+        try:
+            factory = UnitFactory()
+        finally:
+            UnitFactory.set_compact_mode(False)
+
+        self.assertIsInstance(factory._snapshot.index, CompactUnitTable)
+
+        factory._add_statements(STATEMENTS)
+
+        micromolar = factory._get_unit('http://www.openphacts.org/units/Micromolar')
+
+        self.assertEqual(UnitFactory.get_unit('http://www.openphacts.org/units/Micromolar'), micromolar)
+        self.assertEqual([micromolar], factory._find_units(QUDT.ABBREVIATION, 'μM', False, False))
+        self.assertEqual([FURLONG_IRI, CHAIN_IRI], factory._get_iris(LENGTH_UNIT_IRI))
+        self.assertEqual(Unit(resource_iri='urn:pyqudt:test:Missing'), factory._get_unit('urn:pyqudt:test:Missing'))
+
+
+if __name__ == '__main__':
+    unittest.main()
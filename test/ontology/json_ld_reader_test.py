@@ -0,0 +1,107 @@
+################################################################################
+#
+#  Copyright (C) 2019 Garrett Brown
+#  This file is part of pyqudt - https://github.com/eigendude/pyqudt
+#
+#  pyqudt is derived from jQUDT
+#  Copyright (C) 2012-2013  Egon Willighagen <egonw@users.sf.net>
+#
+#  SPDX-License-Identifier: BSD-3-Clause
+#  See the file LICENSE for more information.
+#
+################################################################################
+
+from qudt.ontology.json_ld_reader import JsonLdReader
+from qudt.ontology.ontology_reader import OntologyReader
+from qudt.ontology.unit_factory import REPO_FILES
+from qudt.ontology.unit_factory import UnitFactory
+
+import json
+import os
+import pyld.jsonld
+import rdflib
+import tempfile
+import unittest
+
+
+class JsonLdReaderTest(unittest.TestCase):
+    def test_read_bundled_repos(self) -> None:
+        repo_dir = UnitFactory.get_repo_dir()
+
+        for repo_file in REPO_FILES:
+            with open(os.path.join(repo_dir, repo_file), 'r') as file:
+                document = json.load(file)
+
+            triples = JsonLdReader.read_triples(document)
+            self.assertIsNotNone(triples, repo_file)
+
+            # Compare against the triples of the expanded document
+            expanded = rdflib.Graph()
+            expanded.parse(data=json.dumps(pyld.jsonld.expand(document)), format='json-ld')
+
+            self.assertEqual(set(expanded), set(triples or []), repo_file)
+
+    def test_read_term_aliases(self) -> None:
+        document = {
+            '@context': {
+                'qudt': 'http://qudt.org/schema/qudt#',
+                'xsd': 'http://www.w3.org/2001/XMLSchema#',
+                'abbreviation': 'qudt:abbreviation',
+                'multiplier': 'qudt:conversionMultiplier',
+            },
+            '@graph': [
+                {
+                    '@id': 'urn:pyqudt:test:Furlong',
+                    '@type': ['qudt:LengthUnit'],
+                    'abbreviation': 'fur',
+                    'multiplier': {'@type': 'xsd:double', '@value': '201.168'},
+                    'qudt:symbol': None,
+                },
+            ],
+        }
+
+        triples = JsonLdReader.read_triples(document)
+
+        subject = rdflib.URIRef('urn:pyqudt:test:Furlong')
+        self.assertEqual(
+            {
+                (subject, rdflib.RDF.type, rdflib.URIRef('http://qudt.org/schema/qudt#LengthUnit')),
+                (subject, rdflib.URIRef('http://qudt.org/schema/qudt#abbreviation'), rdflib.Literal('fur')),
+                (
+                    subject,
+                    rdflib.URIRef('http://qudt.org/schema/qudt#conversionMultiplier'),
+                    rdflib.Literal('201.168', datatype=rdflib.XSD.double),
+                ),
+            },
+            set(triples or []),
+        )
+
+    def test_read_unsupported(self) -> None:
+        document = {
+            '@context': {
+                'qudt': 'http://qudt.org/schema/qudt#',
+            },
+            '@graph': [
+                {
+                    '@id': '_:furlong',
+                    'qudt:abbreviation': 'fur',
+                },
+            ],
+        }
+
+        self.assertIsNone(JsonLdReader.read_triples(document))
+
+        # The reader falls back to expanding the document
+        with tempfile.TemporaryDirectory() as temp_dir:
+            repo_path = os.path.join(temp_dir, 'furlong.jsonld')
+            with open(repo_path, 'w') as file:
+                json.dump(document, file)
+
+            statements = OntologyReader.read_statements(repo_path)
+
+        self.assertEqual(1, len(statements))
+        self.assertEqual(('http://qudt.org/schema/qudt#abbreviation', 'fur'), statements[0][1:])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,165 @@
+################################################################################
+#
+#  Copyright (C) 2019 Garrett Brown
+#  This file is part of pyqudt - https://github.com/eigendude/pyqudt
+#
+#  pyqudt is derived from jQUDT
+#  Copyright (C) 2012-2013  Egon Willighagen <egonw@users.sf.net>
+#
+#  SPDX-License-Identifier: BSD-3-Clause
+#  See the file LICENSE for more information.
+#
+################################################################################
+
+from qudt.ontology import mapped_catalog
+from qudt.ontology.mapped_catalog import MappedCatalog
+from qudt.ontology.ontology_index import OntologyIndex
+from qudt.ontology.ontology_reader import OntologyReader
+from qudt.ontology.qudt import QUDT
+from qudt.ontology.rdfs import RDFS
+from qudt.ontology.unit_factory import UnitFactory
+from qudt.dimension_vector import DimensionVector
+
+import os
+import shutil
+import tempfile
+import unittest
+import unittest.mock
+
+ONTOLOGY_FILES = ['openphacts.jsonld', 'contrib.jsonld', 'dimensionvector.jsonld', 'unittype.jsonld']
+
+MICROMOLAR_IRI = 'http://www.openphacts.org/units/Micromolar'
+KILOBYTE_IRI = 'http://aclima.io/schema/1.0/Kilobyte'
+
+
+class MappedCatalogTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+
+        self.repo_paths = list()
+        for repo_file in ONTOLOGY_FILES:
+            repo_path = os.path.join(self.temp_dir, repo_file)
+            shutil.copy(os.path.join(UnitFactory.get_repo_dir(), repo_file), repo_path)
+            self.repo_paths.append(repo_path)
+
+        self.catalog_path = os.path.join(self.temp_dir, 'units.mapped')
+
+        # The index that the catalog is compared against
+        self.index = OntologyIndex()
+        for repo_path in self.repo_paths:
+            self.index.add_statements(OntologyReader.read_statements(repo_path))
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir)
+
+    def _open_catalog(self) -> MappedCatalog:
+        MappedCatalog.build(self.catalog_path, self.repo_paths, UnitFactory._create_unit)
+
+        catalog = MappedCatalog.open(self.catalog_path, self.repo_paths)
+        assert catalog is not None
+
+        self.addCleanup(catalog.close)
+
+        return catalog
+
+    def test_get_unit(self) -> None:
+        catalog = self._open_catalog()
+
+        self.assertEqual(len(self.index), len(catalog))
+
+        for iri in (MICROMOLAR_IRI, KILOBYTE_IRI):
+            self.assertTrue(catalog.has_subject(iri))
+            unit = catalog.get_unit(iri)
+            assert unit is not None
+
+            self.assertEqual(UnitFactory._create_unit(self.index, iri), unit)
+            self.assertEqual(UnitFactory._create_unit(self.index, iri).dimension_vector, unit.dimension_vector)
+            self.assertEqual(self.index.get_properties(iri), catalog.get_properties(iri))
+
+        micromolar = catalog.get_unit(MICROMOLAR_IRI)
+        assert micromolar is not None
+
+        self.assertEqual(DimensionVector(amount_of_substance=1, length=-3), micromolar.dimension_vector)
+
+        self.assertFalse(catalog.has_subject('urn:pyqudt:test:Missing'))
+        self.assertIsNone(catalog.get_unit('urn:pyqudt:test:Missing'))
+        self.assertEqual([], catalog.get_properties('urn:pyqudt:test:Missing'))
+
+    def test_get_subjects(self) -> None:
+        catalog = self._open_catalog()
+
+        self.assertEqual([MICROMOLAR_IRI], catalog.get_subjects_by_name(QUDT.ABBREVIATION, 'μM'))
+        self.assertEqual([KILOBYTE_IRI], catalog.get_subjects_by_name(RDFS.LABEL, 'Kilobyte'))
+        self.assertEqual([], catalog.get_subjects_by_name(QUDT.SYMBOL, 'missing'))
+
+        for type_iri in ('http://qudt.org/schema/qudt#DerivedUnit', 'http://qudt.org/schema/qudt#QuantityKind'):
+            self.assertEqual(self.index.get_subjects_by_type(type_iri), catalog.get_subjects_by_type(type_iri))
+
+        for type_iri in ('http://qudt.org/schema/qudt#ConcentrationUnit', 'http://qudt.org/schema/qudt#MassUnit'):
+            self.assertEqual(self.index.get_subclasses(type_iri), catalog.get_subclasses(type_iri))
+
+        self.assertEqual(self.index._names[QUDT.ABBREVIATION], catalog.get_names(QUDT.ABBREVIATION))
+
+    def test_layered_index(self) -> None:
+        index = OntologyIndex(self._open_catalog())
+
+        index.add_statement('urn:pyqudt:test:Micromole', QUDT.ABBREVIATION, 'μM')
+        index.add_statement(MICROMOLAR_IRI, RDFS.LABEL, 'Micromolar (overridden)')
+
+        self.assertEqual(['μM'], [
+            obj for (predicate, obj) in index.get_properties('urn:pyqudt:test:Micromole')
+        ])
+        self.assertEqual('Micromolar (overridden)', UnitFactory._create_unit(index, MICROMOLAR_IRI).label)
+        self.assertEqual(
+            [MICROMOLAR_IRI, 'urn:pyqudt:test:Micromole'],
+            index.get_subjects_by_name(QUDT.ABBREVIATION, 'μM'),
+        )
+        self.assertEqual(
+            [MICROMOLAR_IRI, 'urn:pyqudt:test:Micromole'],
+            index.get_subjects_by_name(QUDT.ABBREVIATION, 'μm', ignore_case=True),
+        )
+        self.assertEqual(len(self.index) + 1, len(index))
+
+    def test_missing_catalog(self) -> None:
+        self.assertIsNone(MappedCatalog.open(self.catalog_path, self.repo_paths))
+
+    def test_stale_catalog(self) -> None:
+        MappedCatalog.build(self.catalog_path, self.repo_paths, UnitFactory._create_unit)
+
+        with open(self.repo_paths[0], 'a') as file:
+            file.write('\n')
+
+        self.assertIsNone(MappedCatalog.open(self.catalog_path, self.repo_paths))
+
+    def test_stale_code(self) -> None:
+        MappedCatalog.build(self.catalog_path, self.repo_paths, UnitFactory._create_unit)
+
+        self.assertIsNotNone(self._open_catalog())
+
+        # A catalog built by other code is stale, even if the repositories
+        # and the version are unchanged
+        with unittest.mock.patch.object(mapped_catalog, '_get_code_stamp', return_value=b'other code'):
+            self.assertIsNone(MappedCatalog.open(self.catalog_path, self.repo_paths))
+
+    def test_unit_factory(self) -> None:
+        catalog_path = os.path.join(self.temp_dir, 'bundled.mapped')
+
+        UnitFactory.build_mapped_catalog(catalog_path)
+
+        UnitFactory.set_mapped_catalog(True, catalog_path)
+        try:
+            factory = UnitFactory()
+        finally:
+            UnitFactory.set_mapped_catalog(False)
+
+        self.assertIsNotNone(factory._snapshot.index.base)
+
+        unit = factory._get_unit(MICROMOLAR_IRI)
+
+        self.assertEqual('μM', unit.abbreviation)
+        self.assertEqual([unit], factory._find_units(QUDT.ABBREVIATION, 'μM', False, False))
+        self.assertIn(KILOBYTE_IRI, factory._get_iris('http://qudt.org/schema/qudt#InformationEntropyUnit'))
+
+
+if __name__ == '__main__':
+    unittest.main()
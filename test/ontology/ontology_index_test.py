@@ -0,0 +1,89 @@
+################################################################################
+#
+#  Copyright (C) 2019 Garrett Brown
+#  This file is part of pyqudt - https://github.com/eigendude/pyqudt
+#
+#  pyqudt is derived from jQUDT
+#  Copyright (C) 2012-2013  Egon Willighagen <egonw@users.sf.net>
+#
+#  SPDX-License-Identifier: BSD-3-Clause
+#  See the file LICENSE for more information.
+#
+################################################################################
+
+from qudt.ontology.ontology_index import OntologyIndex
+from qudt.ontology.qudt import QUDT
+from qudt.ontology.rdf import RDF
+from qudt.ontology.rdfs import RDFS
+
+import unittest
+
+
+class OntologyIndexTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.index = OntologyIndex()
+        self.index.add_statement('urn:test:Kelvin', RDF.TYPE, 'urn:test:TemperatureUnit')
+        self.index.add_statement('urn:test:Kelvin', QUDT.ABBREVIATION, 'K')
+        self.index.add_statement('urn:test:Kelvin', RDFS.LABEL, 'Kelvin')
+        self.index.add_statement('urn:test:KiloByte', QUDT.ABBREVIATION, 'k')
+        self.index.add_statement('urn:test:KiloByte', RDFS.LABEL, 'Kilo  Byte')
+
+    def test_get_properties(self) -> None:
+        properties = self.index.get_properties('urn:test:Kelvin')
+
+        self.assertEqual([
+            (RDF.TYPE, 'urn:test:TemperatureUnit'),
+            (QUDT.ABBREVIATION, 'K'),
+            (RDFS.LABEL, 'Kelvin'),
+        ], properties)
+        self.assertEqual([], self.index.get_properties('urn:test:Unknown'))
+
+    def test_get_subjects_by_abbreviation(self) -> None:
+        self.assertEqual(['urn:test:Kelvin'], self.index.get_subjects_by_abbreviation('K'))
+        self.assertEqual([], self.index.get_subjects_by_abbreviation('Kelvin'))
+
+    def test_get_subjects_by_name(self) -> None:
+        self.assertEqual(['urn:test:Kelvin'], self.index.get_subjects_by_name(RDFS.LABEL, 'Kelvin'))
+        self.assertEqual([], self.index.get_subjects_by_name(RDFS.LABEL, 'kelvin'))
+        self.assertEqual([], self.index.get_subjects_by_name(QUDT.SYMBOL, 'K'))
+
+    def test_get_subjects_ignore_case(self) -> None:
+        self.assertEqual(['urn:test:Kelvin'], self.index.get_subjects_by_name(RDFS.LABEL, 'KELVIN', ignore_case=True))
+
+        # Exact matches come first
+        self.assertEqual(
+            ['urn:test:KiloByte', 'urn:test:Kelvin'],
+            self.index.get_subjects_by_name(QUDT.ABBREVIATION, 'k', ignore_case=True),
+        )
+        self.assertEqual(
+            ['urn:test:Kelvin', 'urn:test:KiloByte'],
+            self.index.get_subjects_by_name(QUDT.ABBREVIATION, 'K', ignore_case=True),
+        )
+
+    def test_get_subjects_normalize_whitespace(self) -> None:
+        self.assertEqual(
+            ['urn:test:KiloByte'],
+            self.index.get_subjects_by_name(RDFS.LABEL, ' Kilo Byte\t', normalize_whitespace=True),
+        )
+        self.assertEqual([], self.index.get_subjects_by_name(RDFS.LABEL, ' Kilo Byte\t'))
+
+    def test_normalized_names_updated(self) -> None:
+        self.assertEqual([], self.index.get_subjects_by_name(RDFS.LABEL, 'celsius', ignore_case=True))
+
+        self.index.add_statement('urn:test:Celsius', RDFS.LABEL, 'Celsius')
+
+        self.assertEqual(['urn:test:Celsius'], self.index.get_subjects_by_name(RDFS.LABEL, 'celsius', ignore_case=True))
+
+    def test_get_subjects_by_type(self) -> None:
+        self.assertEqual(['urn:test:Kelvin'], self.index.get_subjects_by_type('urn:test:TemperatureUnit'))
+        self.assertEqual([], self.index.get_subjects_by_type('K'))
+
+    def test_get_subclasses(self) -> None:
+        self.index.add_statement('urn:test:TemperatureUnit', RDFS.SUB_CLASS_OF, 'urn:test:ThermodynamicsUnit')
+
+        self.assertEqual(['urn:test:TemperatureUnit'], self.index.get_subclasses('urn:test:ThermodynamicsUnit'))
+        self.assertEqual([], self.index.get_subclasses('urn:test:TemperatureUnit'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -18,6 +18,7 @@ import os
 import unittest
 
 ONTOLOGY_FILE = 'openphacts.ttl'
+ONTOLOGY_FILES = ['openphacts.ttl', 'contrib.jsonld']
 
 
 class OntologyReaderTest(unittest.TestCase):
@@ -30,6 +31,30 @@ class OntologyReaderTest(unittest.TestCase):
 
         self.assertGreaterEqual(len(repos), 1)
 
+    def test_read_namespaces(self) -> None:
+        schema_path = UnitFactory.get_repo_dir()
+
+        namespaces = OntologyReader.read_namespaces(os.path.join(schema_path, 'contrib.jsonld'))
+
+        self.assertEqual('http://qudt.org/schema/qudt#', namespaces['qudt'])
+        self.assertNotIn('label', namespaces)
+        self.assertEqual({}, OntologyReader.read_namespaces(os.path.join(schema_path, ONTOLOGY_FILE)))
+
+    def test_read_statements_parallel(self) -> None:
+        schema_path = UnitFactory.get_repo_dir()
+
+        repo_paths = [os.path.join(schema_path, repo_file) for repo_file in ONTOLOGY_FILES]
+        repo_paths.append(os.path.join(schema_path, 'nonexistent.ttl'))
+
+        repo_statements = OntologyReader.read_statements_parallel(repo_paths, max_workers=2)
+
+        self.assertEqual(3, len(repo_statements))
+        self.assertIsNone(repo_statements[2])
+
+        for (repo_path, statements) in zip(repo_paths, repo_statements):
+            if statements is not None:
+                self.assertCountEqual(OntologyReader.read_statements(repo_path), statements)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,94 @@
+################################################################################
+#
+#  Copyright (C) 2019 Garrett Brown
+#  This file is part of pyqudt - https://github.com/eigendude/pyqudt
+#
+#  pyqudt is derived from jQUDT
+#  Copyright (C) 2012-2013  Egon Willighagen <egonw@users.sf.net>
+#
+#  SPDX-License-Identifier: BSD-3-Clause
+#  See the file LICENSE for more information.
+#
+################################################################################
+
+
+from qudt.ontology.prefix_map import PrefixMap
+
+import json
+import os
+import tempfile
+import unittest
+
+
+class PrefixMapTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self._temp_dir.cleanup()
+
+    def _write_repo(self, file_name: str, context: dict) -> str:
+        repo_path = os.path.join(self._temp_dir.name, file_name)
+        with open(repo_path, 'w') as file:
+            json.dump({'@context': context, '@graph': []}, file)
+        return repo_path
+
+    def test_expand(self) -> None:
+        repo_path = self._write_repo('repo.jsonld', {
+            'unit': 'http://qudt.org/vocab/unit#',
+            'label': 'rdfs:label',
+        })
+
+        prefix_map = PrefixMap([repo_path])
+
+        self.assertEqual('http://qudt.org/vocab/unit#Kelvin', prefix_map.expand('unit:Kelvin'))
+        self.assertEqual('http://qudt.org/schema/qudt#symbol', prefix_map.expand('qudt:symbol'))
+        self.assertEqual('http://qudt.org/vocab/unit#Kelvin', prefix_map.expand('http://qudt.org/vocab/unit#Kelvin'))
+        self.assertEqual('unknown:Kelvin', prefix_map.expand('unknown:Kelvin'))
+        self.assertEqual('Kelvin', prefix_map.expand('Kelvin'))
+
+        # Terms that aren't prefixes aren't expanded
+        self.assertEqual('label:x', prefix_map.expand('label:x'))
+
+    def test_compact(self) -> None:
+        repo_path = self._write_repo('repo.jsonld', {
+            'ex': 'http://example.org/',
+            'exunit': 'http://example.org/unit/',
+        })
+
+        prefix_map = PrefixMap([repo_path])
+
+        # The longest namespace wins
+        self.assertEqual('exunit:Furlong', prefix_map.compact('http://example.org/unit/Furlong'))
+        self.assertEqual('ex:Furlong', prefix_map.compact('http://example.org/Furlong'))
+        self.assertEqual('http://example.com/Furlong', prefix_map.compact('http://example.com/Furlong'))
+        self.assertEqual('http://example.org/', prefix_map.compact('http://example.org/'))
+
+    def test_first_prefix_wins(self) -> None:
+        first_path = self._write_repo('first.jsonld', {'ex': 'http://example.org/first/'})
+        second_path = self._write_repo('second.jsonld', {
+            'ex': 'http://example.org/second/',
+            'ex2': 'http://example.org/first/',
+        })
+
+        prefix_map = PrefixMap([first_path, second_path])
+
+        self.assertEqual('http://example.org/first/a', prefix_map.expand('ex:a'))
+        self.assertEqual('ex:a', prefix_map.compact('http://example.org/first/a'))
+        self.assertEqual('http://example.org/first/a', prefix_map.expand('ex2:a'))
+
+    def test_extend(self) -> None:
+        base_path = self._write_repo('base.jsonld', {'ex': 'http://example.org/'})
+        extra_path = self._write_repo('extra.jsonld', {'other': 'http://example.com/'})
+
+        prefix_map = PrefixMap([base_path])
+        extended_map = prefix_map.extend([extra_path, os.path.join(self._temp_dir.name, 'missing.jsonld')])
+
+        self.assertEqual('http://example.org/a', extended_map.expand('ex:a'))
+        self.assertEqual('http://example.com/a', extended_map.expand('other:a'))
+        self.assertEqual('other:a', prefix_map.expand('other:a'))
+        self.assertEqual(len(prefix_map) + 1, len(extended_map))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,165 @@
+################################################################################
+#
+#  Copyright (C) 2019 Garrett Brown
+#  This file is part of pyqudt - https://github.com/eigendude/pyqudt
+#
+#  pyqudt is derived from jQUDT
+#  Copyright (C) 2012-2013  Egon Willighagen <egonw@users.sf.net>
+#
+#  SPDX-License-Identifier: BSD-3-Clause
+#  See the file LICENSE for more information.
+#
+################################################################################
+
+from qudt.ontology.code_stamp import CodeStamp
+from qudt.ontology.ontology_reader import OntologyReader
+from qudt.ontology.repo_cache import RepoCache
+from qudt.ontology.unit_factory import UnitFactory
+
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+
+def _write_repo(repo_path: str, name: str, multiplier: float) -> None:
+    repo = {
+        '@context': {
+            'qudt': 'http://qudt.org/schema/qudt#',
+        },
+        '@graph': [
+            {
+                '@id': f'urn:pyqudt:test:{name}',
+                '@type': 'urn:pyqudt:test:CachedUnit',
+                'qudt:conversionMultiplier': multiplier,
+            },
+        ],
+    }
+
+    with open(repo_path, 'w') as file:
+        json.dump(repo, file)
+
+
+class RepoCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self._temp_dir.name, 'cache')
+        self.repo_path = os.path.join(self._temp_dir.name, 'repo.jsonld')
+
+    def tearDown(self) -> None:
+        self._temp_dir.cleanup()
+
+    def test_read_statements(self) -> None:
+        _write_repo(self.repo_path, 'Span', 0.2286)
+
+        cache = RepoCache(self.cache_dir)
+
+        statements = cache.read_statements(self.repo_path)
+        self.assertEqual(OntologyReader.read_statements(self.repo_path), statements)
+
+        # The second read is served from the cache, even by another instance
+        with mock.patch.object(OntologyReader, 'read_statements') as read_statements:
+            self.assertEqual(statements, RepoCache(self.cache_dir).read_statements(self.repo_path))
+            read_statements.assert_not_called()
+
+        # No temporary files are left behind
+        self.assertEqual(1, len(os.listdir(self.cache_dir)))
+
+    def test_read_changed_repo(self) -> None:
+        cache = RepoCache(self.cache_dir)
+
+        _write_repo(self.repo_path, 'Span', 0.2286)
+        cache.read_statements(self.repo_path)
+
+        _write_repo(self.repo_path, 'Cubit', 0.4572)
+        statements = cache.read_statements(self.repo_path)
+
+        self.assertIn('urn:pyqudt:test:Cubit', [subject for (subject, _, _) in statements])
+
+    def test_read_with_changed_code(self) -> None:
+        _write_repo(self.repo_path, 'Span', 0.2286)
+
+        cache = RepoCache(self.cache_dir)
+        cache.read_statements(self.repo_path)
+
+        # Entries parsed by other versions of the reader aren't used
+        with mock.patch.object(CodeStamp, 'get_digest', return_value=b'other code'):
+            with mock.patch.object(OntologyReader, 'read_statements', return_value=[]) as read_statements:
+                self.assertEqual([], cache.read_statements(self.repo_path))
+                read_statements.assert_called_once_with(self.repo_path)
+
+    def test_read_missing_repo(self) -> None:
+        with self.assertRaises(FileNotFoundError):
+            RepoCache(self.cache_dir).read_statements(self.repo_path)
+
+    def test_load_invalid_entry(self) -> None:
+        _write_repo(self.repo_path, 'Span', 0.2286)
+
+        cache = RepoCache(self.cache_dir)
+        key = cache.get_key(self.repo_path)
+
+        os.makedirs(self.cache_dir)
+        with open(os.path.join(self.cache_dir, key + '.statements'), 'wb') as file:
+            file.write(b'invalid')
+
+        self.assertIsNone(cache.load(key))
+        self.assertEqual(2, len(cache.read_statements(self.repo_path)))
+        self.assertIsNotNone(cache.load(key))
+
+    def test_evict(self) -> None:
+        cache = RepoCache(self.cache_dir, max_size=None)
+
+        repo_paths = list()
+        for i in range(3):
+            repo_path = os.path.join(self._temp_dir.name, f'repo{i}.jsonld')
+            _write_repo(repo_path, f'Unit{i}', float(i))
+            cache.read_statements(repo_path)
+            repo_paths.append(repo_path)
+
+            # Order the entries by their modification time
+            key = cache.get_key(repo_path)
+            entry_path = os.path.join(self.cache_dir, key + '.statements')
+            os.utime(entry_path, (i, i))
+
+        entry_size = cache.get_size() // 3
+
+        # Keep the two most recently used entries
+        cache.max_size = 2 * entry_size + entry_size // 2
+        cache.evict()
+
+        self.assertIsNone(cache.load(cache.get_key(repo_paths[0])))
+        self.assertIsNotNone(cache.load(cache.get_key(repo_paths[1])))
+        self.assertIsNotNone(cache.load(cache.get_key(repo_paths[2])))
+
+        cache.clear()
+        self.assertEqual(0, cache.get_size())
+
+    def test_get_default_dir(self) -> None:
+        with mock.patch.dict(os.environ, {'PYQUDT_CACHE_DIR': '', 'XDG_CACHE_HOME': '/xdg/cache'}):
+            self.assertEqual(os.path.join('/xdg/cache', 'pyqudt'), RepoCache.get_default_dir())
+
+        with mock.patch.dict(os.environ, {'PYQUDT_CACHE_DIR': '/pyqudt/cache'}):
+            self.assertEqual('/pyqudt/cache', RepoCache.get_default_dir())
+
+    def test_unit_factory_load_repo(self) -> None:
+        _write_repo(self.repo_path, 'Palm', 0.0762)
+
+        UnitFactory.set_repo_cache_dir(self.cache_dir)
+        try:
+            self.assertEqual(2, UnitFactory.load_repo(self.repo_path))
+            self.assertEqual(1, len(os.listdir(self.cache_dir)))
+
+            with mock.patch.object(OntologyReader, 'read_statements') as read_statements:
+                self.assertEqual(2, UnitFactory.load_repo(self.repo_path))
+                read_statements.assert_not_called()
+        finally:
+            UnitFactory.set_repo_cache_dir(None)
+
+        unit = UnitFactory.get_unit('urn:pyqudt:test:Palm')
+
+        self.assertAlmostEqual(0.0762, unit.multiplier.multiplier)
+
+
+if __name__ == '__main__':
+    unittest.main()
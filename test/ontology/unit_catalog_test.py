@@ -0,0 +1,96 @@
+################################################################################
+#
+#  Copyright (C) 2019 Garrett Brown
+#  This file is part of pyqudt - https://github.com/eigendude/pyqudt
+#
+#  pyqudt is derived from jQUDT
+#  Copyright (C) 2012-2013  Egon Willighagen <egonw@users.sf.net>
+#
+#  SPDX-License-Identifier: BSD-3-Clause
+#  See the file LICENSE for more information.
+#
+################################################################################
+
+from qudt.ontology.code_stamp import CodeStamp
+from qudt.ontology.qudt import QUDT
+from qudt.ontology.unit_catalog import UnitCatalog
+from qudt.ontology.unit_factory import UnitFactory
+
+import os
+import shutil
+import tempfile
+import unittest
+import unittest.mock
+
+ONTOLOGY_FILE = 'contrib.jsonld'
+
+
+class UnitCatalogTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+
+        self.repo_path = os.path.join(self.temp_dir, ONTOLOGY_FILE)
+        self.catalog_path = os.path.join(self.temp_dir, 'units.catalog')
+
+        shutil.copy(os.path.join(UnitFactory.get_repo_dir(), ONTOLOGY_FILE), self.repo_path)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir)
+
+    def test_build_and_load(self) -> None:
+        statement_count = UnitCatalog.build(self.catalog_path, [self.repo_path])
+
+        statements = UnitCatalog.load(self.catalog_path, [self.repo_path])
+
+        assert statements is not None
+
+        self.assertEqual(statement_count, len(statements))
+        self.assertIn(('http://aclima.io/schema/1.0/Kilobyte', QUDT.ABBREVIATION, 'KB'), statements)
+
+    def test_missing_catalog(self) -> None:
+        self.assertIsNone(UnitCatalog.load(self.catalog_path, [self.repo_path]))
+
+    def test_stale_catalog(self) -> None:
+        UnitCatalog.build(self.catalog_path, [self.repo_path])
+
+        with open(self.repo_path, 'a') as file:
+            file.write('\n')
+
+        self.assertIsNone(UnitCatalog.load(self.catalog_path, [self.repo_path]))
+
+    def test_stale_code(self) -> None:
+        UnitCatalog.build(self.catalog_path, [self.repo_path])
+
+        # A catalog built by other code is stale
+        with unittest.mock.patch.object(CodeStamp, 'get_digest', return_value=b'other code'):
+            self.assertIsNone(UnitCatalog.load(self.catalog_path, [self.repo_path]))
+
+        self.assertIsNotNone(UnitCatalog.load(self.catalog_path, [self.repo_path]))
+
+    def test_corrupt_catalog(self) -> None:
+        UnitCatalog.build(self.catalog_path, [self.repo_path])
+
+        with open(self.catalog_path, 'rb') as file:
+            data = file.read()
+
+        for corrupt_data in (
+            data[:len(data) // 2],
+            # A reference to a class that doesn't exist
+            b'\x80\x04cqudt.ontology.unit_catalog\nMissingClass\n.',
+            b'\x80\x04cpyqudt_missing_module\nMissingClass\n.',
+        ):
+            with open(self.catalog_path, 'wb') as file:
+                file.write(corrupt_data)
+
+            self.assertIsNone(UnitCatalog.load(self.catalog_path, [self.repo_path]))
+
+    def test_different_repos(self) -> None:
+        UnitCatalog.build(self.catalog_path, [self.repo_path])
+
+        missing_path = os.path.join(self.temp_dir, 'missing.jsonld')
+
+        self.assertIsNone(UnitCatalog.load(self.catalog_path, [self.repo_path, missing_path]))
+
+
+if __name__ == '__main__':
+    unittest.main()
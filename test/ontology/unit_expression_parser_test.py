@@ -0,0 +1,83 @@
+################################################################################
+#
+#  Copyright (C) 2019 Garrett Brown
+#  This file is part of pyqudt - https://github.com/eigendude/pyqudt
+#
+#  pyqudt is derived from jQUDT
+#  Copyright (C) 2012-2013  Egon Willighagen <egonw@users.sf.net>
+#
+#  SPDX-License-Identifier: BSD-3-Clause
+#  See the file LICENSE for more information.
+#
+################################################################################
+
+from qudt.ontology.unit_expression_parser import UnitExpressionParser
+from qudt.dimension_vector import DimensionVector
+from qudt.multiplier import Multiplier
+from qudt.unit import Unit
+
+import unittest
+
+UNITS = {
+    'g': Unit(
+        resource_iri='urn:pyqudt:test:Gram',
+        abbreviation='g',
+        multiplier=Multiplier(multiplier=0.001),
+        dimension_vector=DimensionVector(mass=1),
+    ),
+    'm': Unit(
+        resource_iri='urn:pyqudt:test:Meter',
+        abbreviation='m',
+        dimension_vector=DimensionVector(length=1),
+    ),
+    's': Unit(
+        resource_iri='urn:pyqudt:test:Second',
+        abbreviation='s',
+        dimension_vector=DimensionVector(time=1),
+    ),
+    'N-m': Unit(
+        resource_iri='urn:pyqudt:test:NewtonMeter',
+        abbreviation='N-m',
+        dimension_vector=DimensionVector(length=2, mass=1, time=-2),
+    ),
+}
+
+
+class UnitExpressionParserTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.parser = UnitExpressionParser(UNITS.get)
+
+    def test_name(self) -> None:
+        self.assertIs(UNITS['g'], self.parser.parse('g'))
+        self.assertIs(UNITS['N-m'], self.parser.parse(' N-m '))
+
+    def test_operators(self) -> None:
+        for (expression, abbreviation, dimension_vector) in (
+            ('g/m^3', 'g/m^3', DimensionVector(mass=1, length=-3)),
+            ('g.m-2', 'g*m^-2', DimensionVector(mass=1, length=-2)),
+            ('g m2', 'g*m^2', DimensionVector(mass=1, length=2)),
+            ('g·m**2/s', 'g*m^2/s', DimensionVector(mass=1, length=2, time=-1)),
+            ('g/(m*s)', 'g/(m*s)', DimensionVector(mass=1, length=-1, time=-1)),
+            ('(m/s)^2', '(m/s)^2', DimensionVector(length=2, time=-2)),
+            ('m-s', 'm*s', DimensionVector(length=1, time=1)),
+            ('1/s', 's^-1', DimensionVector(time=-1)),
+            ('/s', 's^-1', DimensionVector(time=-1)),
+        ):
+            unit = self.parser.parse(expression)
+
+            self.assertEqual(abbreviation, unit.abbreviation, expression)
+            self.assertEqual(dimension_vector, unit.dimension_vector, expression)
+
+    def test_multiplier(self) -> None:
+        unit = self.parser.parse('g/m^3')
+
+        self.assertEqual(0.001, unit.multiplier.multiplier)
+
+    def test_invalid_expression(self) -> None:
+        for expression in ('', 'kg', 'g/', 'g^', '(g', 'g)', 'g*2', '2/s', 'g^s'):
+            with self.assertRaises(ValueError, msg=expression):
+                self.parser.parse(expression)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+################################################################################
+#
+#  Copyright (C) 2019 Garrett Brown
+#  This file is part of pyqudt - https://github.com/eigendude/pyqudt
+#
+#  pyqudt is derived from jQUDT
+#  Copyright (C) 2012-2013  Egon Willighagen <egonw@users.sf.net>
+#
+#  SPDX-License-Identifier: BSD-3-Clause
+#  See the file LICENSE for more information.
+#
+################################################################################
+
+from qudt.ontology.unit_factory import UnitFactory
+from qudt.unit import Unit
+
+import dataclasses
+import json
+import os
+import sys
+import tempfile
+import threading
+import unittest
+import unittest.mock
+from typing import List
+
+THREAD_COUNT = 8
+ITERATION_COUNT = 200
+REPO_COUNT = 5
+
+
+class UnitFactoryConcurrencyTest(unittest.TestCase):
+    def test_singleton_created_once(self) -> None:
+        UnitFactory._get_instance()
+
+        original_instance = UnitFactory._instance
+        original_init = UnitFactory.__init__
+
+        barrier = threading.Barrier(THREAD_COUNT)
+        instances: List[UnitFactory] = list()
+
+        def get_instance() -> None:
+            barrier.wait()
+            instances.append(UnitFactory._get_instance())
+
+        try:
+            UnitFactory._instance = None
+
+            with unittest.mock.patch.object(UnitFactory, '__init__', autospec=True, side_effect=original_init) as init:
+                threads = [threading.Thread(target=get_instance) for _ in range(THREAD_COUNT)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+
+                self.assertEqual(1, init.call_count)
+        finally:
+            UnitFactory._instance = original_instance
+
+        self.assertEqual(THREAD_COUNT, len(instances))
+        self.assertTrue(all(instance is instances[0] for instance in instances))
+
+    def test_lazy_tables_built_once(self) -> None:
+        factory = UnitFactory._get_instance()
+
+        expected_prefixes = factory._get_prefixes(factory._snapshot)
+        expected_units = UnitFactory.get_units('qudt:TemperatureUnit')
+
+        switch_interval = sys.getswitchinterval()
+
+        try:
+            sys.setswitchinterval(1e-6)
+
+            for _ in range(5):
+                # A fresh copy of the snapshot, whose tables aren't built
+                snapshot = dataclasses.replace(
+                    factory._snapshot,
+                    prefixes=None,
+                    type_units=dict(),
+                    build_lock=threading.Lock(),
+                )
+                factory._snapshot = snapshot
+
+                barrier = threading.Barrier(THREAD_COUNT)
+                prefix_counts: List[int] = list()
+                type_units: List[List[Unit]] = list()
+
+                def build() -> None:
+                    barrier.wait()
+                    prefix_counts.append(len(factory._get_prefixes(snapshot)))
+                    type_units.append(UnitFactory.get_units('qudt:TemperatureUnit'))
+
+                threads = [threading.Thread(target=build) for _ in range(THREAD_COUNT)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+
+                self.assertEqual([len(expected_prefixes)] * THREAD_COUNT, prefix_counts)
+                self.assertEqual([expected_units] * THREAD_COUNT, type_units)
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+    def test_lookups_during_load_repo(self) -> None:
+        errors: List[BaseException] = list()
+        done = threading.Event()
+
+        def look_up() -> None:
+            try:
+                for _ in range(ITERATION_COUNT):
+                    unit = UnitFactory.get_unit('http://qudt.org/vocab/unit#Kelvin')
+                    self.assertEqual('K', unit.abbreviation)
+                    self.assertTrue(UnitFactory.find_units('nM'))
+                    self.assertTrue(UnitFactory.get_iris('http://qudt.org/schema/qudt#TemperatureUnit'))
+                    if done.is_set():
+                        break
+            except BaseException as error:
+                errors.append(error)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            repo_paths = list()
+            for i in range(REPO_COUNT):
+                repo_path = os.path.join(temp_dir, f'repo{i}.jsonld')
+                with open(repo_path, 'w') as file:
+                    json.dump({
+                        '@id': f'urn:pyqudt:test:Concurrent{i}',
+                        '@type': 'urn:pyqudt:test:ConcurrentUnit',
+                        'http://qudt.org/schema/qudt#abbreviation': f'pyqudt-concurrent-{i}',
+                    }, file)
+                repo_paths.append(repo_path)
+
+            threads = [threading.Thread(target=look_up) for _ in range(THREAD_COUNT)]
+            for thread in threads:
+                thread.start()
+
+            for repo_path in repo_paths:
+                UnitFactory.load_repo(repo_path)
+
+            done.set()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual([], errors)
+        self.assertEqual(REPO_COUNT, len(UnitFactory.get_iris('urn:pyqudt:test:ConcurrentUnit')))
+        for i in range(REPO_COUNT):
+            units = UnitFactory.find_units(f'pyqudt-concurrent-{i}')
+            self.assertEqual([f'urn:pyqudt:test:Concurrent{i}'], [unit.resource_iri for unit in units])
+
+
+if __name__ == '__main__':
+    unittest.main()
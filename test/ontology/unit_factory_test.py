@@ -11,10 +11,20 @@
 #
 ################################################################################
 
+from qudt.ontology.qudt import QUDT
+from qudt.ontology.unit_catalog import UnitCatalog
 from qudt.ontology.unit_factory import UnitFactory
+from qudt.converter import ConverterRegistry
+from qudt.dimension_vector import DimensionVector
 from qudt.unit import Unit
+from qudt.units.lazy_unit import LazyUnit
+from qudt.units.temperature import TemperatureUnit
 
+import json
+import os
+import tempfile
 import unittest
+import unittest.mock
 
 
 class UnitFactoryTest(unittest.TestCase):
@@ -40,6 +50,62 @@ class UnitFactoryTest(unittest.TestCase):
         self.assertTrue(units)
         self.assertGreaterEqual(len(units), 1)
 
+    def test_get_units(self) -> None:
+        units = UnitFactory.get_units('http://qudt.org/schema/qudt#MolarConcentrationUnit')
+
+        self.assertEqual(UnitFactory.get_iris('http://qudt.org/schema/qudt#MolarConcentrationUnit'), [
+            unit.resource_iri for unit in units
+        ])
+        self.assertIn(UnitFactory.get_unit('http://www.openphacts.org/units/Nanomolar'), units)
+
+    def test_get_units_include_subtypes(self) -> None:
+        concentration_type_iri = 'http://qudt.org/schema/qudt#ConcentrationUnit'
+
+        self.assertEqual([], UnitFactory.get_units(concentration_type_iri))
+
+        units = UnitFactory.get_units(concentration_type_iri, include_subtypes=True)
+        iris = UnitFactory.get_iris(concentration_type_iri, include_subtypes=True)
+
+        self.assertEqual(iris, [unit.resource_iri for unit in units])
+        self.assertEqual(len(set(iris)), len(iris))
+        self.assertIn('http://www.openphacts.org/units/Nanomolar', iris)
+
+    def test_get_units_cached(self) -> None:
+        units = UnitFactory.get_units('http://qudt.org/schema/qudt#TemperatureUnit')
+
+        self.assertTrue(units)
+
+        # The cached units are shared, but the list can be modified
+        units.clear()
+
+        cached_units = UnitFactory.get_units('http://qudt.org/schema/qudt#TemperatureUnit')
+
+        self.assertTrue(cached_units)
+        self.assertIs(UnitFactory.get_units('http://qudt.org/schema/qudt#TemperatureUnit')[0], cached_units[0])
+
+    def test_get_unit_by_curie(self) -> None:
+        unit = UnitFactory.get_unit('unit:Kelvin')
+
+        self.assertIs(UnitFactory.get_unit('http://qudt.org/vocab/unit#Kelvin'), unit)
+        self.assertEqual(
+            UnitFactory.get_units('http://qudt.org/schema/qudt#TemperatureUnit'),
+            UnitFactory.get_units('qudt:TemperatureUnit'),
+        )
+        self.assertEqual(
+            UnitFactory.get_iris('http://qudt.org/schema/qudt#TemperatureUnit'),
+            UnitFactory.get_iris('qudt:TemperatureUnit'),
+        )
+        self.assertIs(
+            UnitFactory.get_prefixed_unit('k', 'http://qudt.org/vocab/unit#Byte'),
+            UnitFactory.get_prefixed_unit('k', 'unit:Byte'),
+        )
+
+    def test_expand_curie(self) -> None:
+        self.assertEqual('http://qudt.org/vocab/unit#Kelvin', UnitFactory.expand_curie('unit:Kelvin'))
+        self.assertEqual('urn:pyqudt:test:Furlong', UnitFactory.expand_curie('urn:pyqudt:test:Furlong'))
+        self.assertEqual('unit:Kelvin', UnitFactory.compact_iri('http://qudt.org/vocab/unit#Kelvin'))
+        self.assertEqual('qudt:TemperatureUnit', UnitFactory.compact_iri('http://qudt.org/schema/qudt#TemperatureUnit'))
+
     def test_get_open_phacts_unit(self) -> None:
         unit = UnitFactory.get_unit('http://www.openphacts.org/units/Nanomolar')
 
@@ -57,12 +123,292 @@ class UnitFactoryTest(unittest.TestCase):
         self.assertTrue(unit)
         self.assertEqual('http://qudt.org/schema/qudt#MassPerVolumeUnit', unit.type_iri)
 
+    def test_get_unit_cached(self) -> None:
+        unit = UnitFactory.get_unit('http://qudt.org/vocab/unit#Kelvin')
+
+        hits = UnitFactory.get_unit_cache_info().hits
+
+        self.assertIs(unit, UnitFactory.get_unit('http://qudt.org/vocab/unit#Kelvin'))
+        self.assertEqual(hits + 1, UnitFactory.get_unit_cache_info().hits)
+
+    def test_unknown_unit_not_cached(self) -> None:
+        size = UnitFactory.get_unit_cache_info().currsize
+
+        for i in range(100):
+            unit = UnitFactory.get_unit(f'urn:pyqudt:test:Unknown{i}')
+            self.assertEqual(Unit(resource_iri=f'urn:pyqudt:test:Unknown{i}'), unit)
+
+        self.assertEqual(size, UnitFactory.get_unit_cache_info().currsize)
+
+    def test_set_unit_cache_size(self) -> None:
+        try:
+            UnitFactory.set_unit_cache_size(1)
+
+            UnitFactory.get_unit('http://qudt.org/vocab/unit#Kelvin')
+            UnitFactory.get_unit('http://qudt.org/vocab/unit#DegreeCelsius')
+
+            cache_info = UnitFactory.get_unit_cache_info()
+
+            self.assertEqual(1, cache_info.maxsize)
+            self.assertEqual(1, cache_info.currsize)
+        finally:
+            UnitFactory.set_unit_cache_size(None)
+
     def test_find_units(self) -> None:
         units = UnitFactory.find_units('nM')
 
         self.assertTrue(units)
         self.assertGreaterEqual(len(units), 1)
         self.assertEqual('http://www.openphacts.org/units/Nanomolar', units[0].resource_iri)
+        self.assertIs(units[0], UnitFactory.get_unit('http://www.openphacts.org/units/Nanomolar'))
+
+    def test_find_units_ignore_case(self) -> None:
+        units = UnitFactory.find_units(' NM ', ignore_case=True, normalize_whitespace=True)
+
+        iris = [unit.resource_iri for unit in units]
+
+        self.assertIn('http://www.openphacts.org/units/Nanomolar', iris)
+        self.assertIn('http://www.openphacts.org/units/Nanometer', iris)
+
+    def test_find_units_by_symbol(self) -> None:
+        units = UnitFactory.find_units_by_symbol('nmol/dm^3')
+
+        self.assertEqual(['http://www.openphacts.org/units/Nanomolar'], [unit.resource_iri for unit in units])
+
+    def test_find_units_by_label(self) -> None:
+        units = UnitFactory.find_units_by_label('nanomolar', ignore_case=True)
+
+        self.assertEqual(['http://www.openphacts.org/units/Nanomolar'], [unit.resource_iri for unit in units])
+
+    def test_find_units_many(self) -> None:
+        units = UnitFactory.find_units_many(['nM', 'K', 'nM', 'no-such-unit'])
+
+        self.assertEqual(4, len(units))
+        self.assertEqual(UnitFactory.find_units('nM'), units[0])
+        self.assertEqual(UnitFactory.find_units('K'), units[1])
+        self.assertIs(units[0], units[2])
+        self.assertEqual([], units[3])
+
+    def test_find_prefixed_units(self) -> None:
+        molar = UnitFactory.get_unit('http://www.openphacts.org/units/Molar')
+
+        units = UnitFactory.find_units('aM', prefixes=True)
+
+        self.assertEqual(1, len(units))
+        self.assertEqual('Attomolar', units[0].label)
+        self.assertEqual(molar.type_iri, units[0].type_iri)
+        self.assertAlmostEqual(1e-18, units[0].multiplier.multiplier / molar.multiplier.multiplier)
+
+        self.assertEqual(units, UnitFactory.find_units_by_label('attomolar', ignore_case=True, prefixes=True))
+        self.assertEqual(units, UnitFactory.find_units_by_symbol('amol/dm^3', prefixes=True))
+
+        # Units in the ontology are preferred, and prefixes are opt-in
+        self.assertEqual(UnitFactory.find_units('nM'), UnitFactory.find_units('nM', prefixes=True))
+        self.assertEqual([], UnitFactory.find_units('aM'))
+
+    def test_get_prefixed_unit(self) -> None:
+        unit = UnitFactory.get_prefixed_unit('a', 'http://www.openphacts.org/units/Molar')
+
+        self.assertIs(unit, UnitFactory.get_prefixed_unit('Atto', 'http://www.openphacts.org/units/Molar'))
+        self.assertIs(unit, UnitFactory.find_units('aM', prefixes=True)[0])
+
+        byte = UnitFactory.get_unit('http://qudt.org/vocab/unit#Byte')
+        kibibyte = UnitFactory.get_prefixed_unit('Ki', byte.resource_iri)
+
+        self.assertEqual('KiB', kibibyte.abbreviation)
+        self.assertEqual(1024 * byte.multiplier.multiplier, kibibyte.multiplier.multiplier)
+
+        with self.assertRaises(ValueError):
+            UnitFactory.get_prefixed_unit('no-such-prefix', 'http://qudt.org/vocab/unit#Byte')
+
+        with self.assertRaises(ValueError):
+            UnitFactory.get_prefixed_unit('k', 'http://qudt.org/vocab/unit#DegreeCelsius')
+
+    def test_parse_unit(self) -> None:
+        unit = UnitFactory.parse_unit('umol/(L*min)')
+
+        self.assertEqual('µmol/(L*min)', unit.abbreviation)
+        self.assertAlmostEqual(1e-06 / (0.001 * 60.0), unit.multiplier.multiplier)
+        self.assertEqual(DimensionVector(amount_of_substance=1, length=-3, time=-1), unit.dimension_vector)
+
+        self.assertEqual(UnitFactory.get_unit('http://qudt.org/vocab/unit#Kelvin'), UnitFactory.parse_unit('K'))
+        self.assertEqual(UnitFactory.parse_unit('kg*m^-2'), UnitFactory.parse_unit('kg.m-2'))
+
+        with self.assertRaises(ValueError):
+            UnitFactory.parse_unit('no-such-unit')
+
+    def test_parse_prefixed_unit(self) -> None:
+        liter = UnitFactory.get_unit('http://qudt.org/vocab/unit#Liter')
+
+        deciliter = UnitFactory.parse_unit('dL')
+
+        self.assertEqual('dL', deciliter.abbreviation)
+        self.assertEqual('Deciliter', deciliter.label)
+        self.assertEqual(liter.type_iri, deciliter.type_iri)
+        self.assertAlmostEqual(0.1 * liter.multiplier.multiplier, deciliter.multiplier.multiplier)
+
+        # The prefix symbol for micro can also be written as u
+        self.assertEqual(UnitFactory.parse_unit('µs'), UnitFactory.parse_unit('us'))
+
+    def test_parse_unit_cached(self) -> None:
+        unit = UnitFactory.parse_unit('mg/m^3')
+
+        hits = UnitFactory.get_expression_cache_info().hits
+
+        self.assertIs(unit, UnitFactory.parse_unit('mg/m^3'))
+        self.assertEqual(hits + 1, UnitFactory.get_expression_cache_info().hits)
+
+    def test_warm_up(self) -> None:
+        original_future = UnitFactory._warm_up_future
+
+        try:
+            # Constants resolved by an earlier warm-up are restored whenever a
+            # repository is loaded, so start a new one
+            UnitFactory._warm_up_future = None
+
+            future = UnitFactory.warm_up()
+
+            info = future.result(timeout=60)
+
+            self.assertTrue(UnitFactory.is_ready())
+            self.assertGreaterEqual(info.load_time, 0)
+            self.assertGreaterEqual(info.index_time, 0)
+            self.assertNotIsInstance(TemperatureUnit.__dict__['KELVIN'], LazyUnit)
+
+            # Later warm-ups share the completed one
+            self.assertIs(future, UnitFactory.warm_up(background=False))
+        finally:
+            UnitFactory._warm_up_future = original_future
+
+    def test_warm_up_retried_after_failure(self) -> None:
+        original_future = UnitFactory._warm_up_future
+
+        try:
+            UnitFactory._warm_up_future = None
+
+            with unittest.mock.patch.object(LazyUnit, 'resolve_all', side_effect=RuntimeError('warm-up failed')):
+                with self.assertRaises(RuntimeError):
+                    UnitFactory.warm_up(background=False)
+
+            self.assertFalse(UnitFactory.is_ready())
+
+            future = UnitFactory.warm_up(background=False)
+
+            self.assertTrue(future.done())
+            self.assertTrue(UnitFactory.is_ready())
+        finally:
+            UnitFactory._warm_up_future = original_future
+
+    def test_fallback_matches_catalog(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            catalog_path = os.path.join(temp_dir, 'units.catalog')
+
+            UnitFactory.build_catalog(catalog_path)
+
+            statements = UnitCatalog.load(catalog_path, UnitFactory._get_bundled_repo_paths())
+            assert statements is not None
+
+        with unittest.mock.patch.object(UnitCatalog, 'load', return_value=statements):
+            catalog_factory = UnitFactory()
+
+        # Read the repositories without a catalog
+        with unittest.mock.patch.object(UnitCatalog, 'load', return_value=None):
+            fallback_factory = UnitFactory()
+
+        for subject in sorted({subject for (subject, _, _) in statements}):
+            self.assertEqual(catalog_factory._get_unit(subject), fallback_factory._get_unit(subject))
+
+        for abbreviation in ('min', 'J', 'K'):
+            self.assertEqual(
+                catalog_factory._find_units(QUDT.ABBREVIATION, abbreviation, False, False),
+                fallback_factory._find_units(QUDT.ABBREVIATION, abbreviation, False, False),
+            )
+
+    def test_load_repo(self) -> None:
+        repo = {
+            '@context': {
+                'qudt': 'http://qudt.org/schema/qudt#',
+                'rdfs': 'http://www.w3.org/2000/01/rdf-schema#',
+            },
+            '@graph': [
+                {
+                    '@id': 'urn:pyqudt:test:Furlong',
+                    '@type': 'urn:pyqudt:test:LengthUnit',
+                    'qudt:abbreviation': 'pyqudt-fur',
+                    'qudt:conversionMultiplier': 201.168,
+                    'rdfs:label': 'Furlong',
+                },
+            ],
+        }
+
+        # Cache the unit before it exists in a repository
+        self.assertFalse(UnitFactory.get_unit('urn:pyqudt:test:Furlong').label)
+
+        ConverterRegistry.get_converter(TemperatureUnit.KELVIN, TemperatureUnit.CELSIUS)
+
+        generation = UnitFactory.get_generation()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            repo_path = os.path.join(temp_dir, 'furlong.jsonld')
+            with open(repo_path, 'w') as file:
+                json.dump(repo, file)
+
+            self.assertGreaterEqual(UnitFactory.load_repo(repo_path), 1)
+
+        self.assertEqual(generation + 1, UnitFactory.get_generation())
+
+        # Cached converters are cleared with the old snapshot's units
+        self.assertEqual(0, ConverterRegistry.get_cache_info().currsize)
+
+        unit = UnitFactory.get_unit('urn:pyqudt:test:Furlong')
+
+        self.assertEqual('Furlong', unit.label)
+        self.assertAlmostEqual(201.168, unit.multiplier.multiplier)
+        self.assertEqual(['urn:pyqudt:test:Furlong'], UnitFactory.get_iris('urn:pyqudt:test:LengthUnit'))
+        self.assertEqual([unit], UnitFactory.find_units('pyqudt-fur'))
+
+    def test_load_missing_repo(self) -> None:
+        self.assertEqual(0, UnitFactory.load_repo('/nonexistent/repo.jsonld'))
+
+    def test_load_repos(self) -> None:
+        repos = [
+            {
+                '@context': {
+                    'qudt': 'http://qudt.org/schema/qudt#',
+                },
+                '@graph': [
+                    {
+                        '@id': f'urn:pyqudt:test:{name}',
+                        '@type': 'urn:pyqudt:test:TimeUnit',
+                        'qudt:abbreviation': f'pyqudt-{name.lower()}',
+                        'qudt:conversionMultiplier': multiplier,
+                    },
+                ],
+            }
+            for (name, multiplier) in (('Fortnight', 1209600.0), ('Microcentury', 3155.76))
+        ]
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            repo_paths = list()
+            for (i, repo) in enumerate(repos):
+                repo_path = os.path.join(temp_dir, f'repo{i}.jsonld')
+                with open(repo_path, 'w') as file:
+                    json.dump(repo, file)
+                repo_paths.append(repo_path)
+
+            repo_paths.append(os.path.join(temp_dir, 'missing.jsonld'))
+
+            self.assertEqual(6, UnitFactory.load_repos(repo_paths, parallel=True))
+
+        self.assertEqual(
+            ['urn:pyqudt:test:Fortnight', 'urn:pyqudt:test:Microcentury'],
+            UnitFactory.get_iris('urn:pyqudt:test:TimeUnit'),
+        )
+
+        unit = UnitFactory.get_unit('urn:pyqudt:test:Microcentury')
+
+        self.assertAlmostEqual(3155.76, unit.multiplier.multiplier)
+        self.assertEqual([unit], UnitFactory.find_units('pyqudt-microcentury'))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,75 @@
+################################################################################
+#
+#  Copyright (C) 2019 Garrett Brown
+#  This file is part of pyqudt - https://github.com/eigendude/pyqudt
+#
+#  pyqudt is derived from jQUDT
+#  Copyright (C) 2012-2013  Egon Willighagen <egonw@users.sf.net>
+#
+#  SPDX-License-Identifier: BSD-3-Clause
+#  See the file LICENSE for more information.
+#
+################################################################################
+
+from qudt.units.concentration import ConcentrationUnit
+from qudt.units.temperature import TemperatureUnit
+
+import unittest
+
+try:
+    import numpy
+    from qudt.quantity_array import QuantityArray
+    from qudt.quantity_array import convert_array
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+@unittest.skipUnless(HAS_NUMPY, 'NumPy is not installed')
+class QuantityArrayTest(unittest.TestCase):
+    def test_convert_array(self) -> None:
+        values = numpy.array([-273.15, 0.0, 20.0])
+
+        converted = convert_array(values, TemperatureUnit.CELSIUS, TemperatureUnit.KELVIN)
+
+        numpy.testing.assert_allclose([0.0, 273.15, 293.15], converted, atol=1e-9)
+        numpy.testing.assert_allclose([-273.15, 0.0, 20.0], values)
+
+    def test_convert_sequence(self) -> None:
+        converted = convert_array([0.1, 1], ConcentrationUnit.MICROMOLAR, ConcentrationUnit.NANOMOLAR)
+
+        numpy.testing.assert_allclose([100.0, 1000.0], converted)
+
+    def test_convert_in_place(self) -> None:
+        values = numpy.array([-40.0, 20.0])
+
+        converted = convert_array(values, TemperatureUnit.CELSIUS, TemperatureUnit.FAHRENHEIT, out=values)
+
+        self.assertIs(values, converted)
+        numpy.testing.assert_allclose([-40.0, 68.0], values, atol=0.01)
+
+    def test_convert_out(self) -> None:
+        values = numpy.array([1.0, 2.0])
+        out = numpy.empty_like(values)
+
+        convert_array(values, ConcentrationUnit.MOLAR, ConcentrationUnit.MOLAR, out=out)
+
+        numpy.testing.assert_allclose(values, out)
+
+    def test_incompatible_units(self) -> None:
+        with self.assertRaises(ValueError):
+            convert_array([1.0], TemperatureUnit.KELVIN, ConcentrationUnit.MOLAR)
+
+    def test_quantity_array(self) -> None:
+        temps = QuantityArray(numpy.array([20.0, 100.0]), TemperatureUnit.CELSIUS)
+
+        temps2 = temps.convert_to(TemperatureUnit.KELVIN)
+
+        self.assertEqual(TemperatureUnit.KELVIN, temps2.unit)
+        self.assertEqual(2, len(temps2))
+        self.assertAlmostEqual(373.15, temps2[1].value)
+        self.assertEqual(TemperatureUnit.KELVIN, temps2[1].unit)
+
+
+if __name__ == '__main__':
+    unittest.main()
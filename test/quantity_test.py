@@ -11,7 +11,9 @@
 #
 ################################################################################
 
+from qudt.ontology.unit_factory import UnitFactory
 from qudt.quantity import Quantity
+from qudt.units.area import AreaUnit
 from qudt.units.temperature import TemperatureUnit
 
 import unittest
@@ -30,6 +32,50 @@ class QuantityTest(unittest.TestCase):
         self.assertAlmostEqual(0.1, quantity.value)
         self.assertEqual(TemperatureUnit.CELSIUS, quantity.unit)
 
+    def test_add(self) -> None:
+        meter = UnitFactory.get_unit('http://qudt.org/vocab/unit#Meter')
+        kilometer = UnitFactory.get_unit('http://qudt.org/vocab/unit#Kilometer')
+
+        self.assertEqual(Quantity(3.0, meter), Quantity(1.0, meter) + Quantity(2.0, meter))
+        self.assertEqual(Quantity(1.5, kilometer), Quantity(1.0, kilometer) + Quantity(500.0, meter))
+        self.assertEqual(Quantity(0.5, kilometer), Quantity(1.0, kilometer) - Quantity(500.0, meter))
+        self.assertEqual(
+            Quantity(21.0, TemperatureUnit.CELSIUS),
+            Quantity(20.0, TemperatureUnit.CELSIUS) + Quantity(1.0, TemperatureUnit.CELSIUS),
+        )
+
+        with self.assertRaises(TypeError):
+            Quantity(1.0, meter) + 1.0
+
+    def test_multiply(self) -> None:
+        meter = UnitFactory.get_unit('http://qudt.org/vocab/unit#Meter')
+
+        area = Quantity(2.0, meter) * Quantity(3.0, meter)
+
+        self.assertEqual(6.0, area.value)
+        self.assertEqual(Quantity(6.0, AreaUnit.SQUARE_METER), area.convert_to(AreaUnit.SQUARE_METER))
+        self.assertEqual(
+            area.convert_to(AreaUnit.SQUARE_METER),
+            ((Quantity(2.0, meter) ** 2) * 1.5).convert_to(AreaUnit.SQUARE_METER),
+        )
+        self.assertEqual(Quantity(4.0, meter), 2 * Quantity(2.0, meter))
+        self.assertEqual(Quantity(-2.0, meter), -Quantity(2.0, meter))
+
+    def test_divide(self) -> None:
+        meter = UnitFactory.get_unit('http://qudt.org/vocab/unit#Meter')
+        second = UnitFactory.get_unit('http://qudt.org/vocab/unit#SecondTime')
+        meter_per_second = UnitFactory.get_unit('http://qudt.org/vocab/unit#MeterPerSecond')
+
+        speed = Quantity(3.0, meter) / Quantity(2.0, second)
+
+        self.assertEqual(Quantity(1.5, meter_per_second), speed.convert_to(meter_per_second))
+        self.assertEqual(Quantity(1.5, meter), Quantity(3.0, meter) / 2)
+        self.assertEqual('s^-1', str((1 / Quantity(2.0, second)).unit))
+
+    def test_no_units(self) -> None:
+        with self.assertRaises(ValueError):
+            Quantity(1.0, None) * Quantity(1.0, TemperatureUnit.KELVIN)
+
 
 if __name__ == '__main__':
     unittest.main()
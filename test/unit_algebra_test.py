@@ -0,0 +1,106 @@
+################################################################################
+#
+#  Copyright (C) 2019 Garrett Brown
+#  This file is part of pyqudt - https://github.com/eigendude/pyqudt
+#
+#  pyqudt is derived from jQUDT
+#  Copyright (C) 2012-2013  Egon Willighagen <egonw@users.sf.net>
+#
+#  SPDX-License-Identifier: BSD-3-Clause
+#  See the file LICENSE for more information.
+#
+################################################################################
+
+from qudt.converter import is_convertible
+from qudt.dimension_vector import DimensionVector
+from qudt.ontology.unit_factory import UnitFactory
+from qudt.unit_algebra import ADD
+from qudt.unit_algebra import DIVIDE
+from qudt.unit_algebra import MULTIPLY
+from qudt.unit_algebra import POWER
+from qudt.unit_algebra import UnitAlgebra
+from qudt.units.area import AreaUnit
+from qudt.units.temperature import TemperatureUnit
+
+import unittest
+
+METER = UnitFactory.get_unit('http://qudt.org/vocab/unit#Meter')
+KILOMETER = UnitFactory.get_unit('http://qudt.org/vocab/unit#Kilometer')
+SECOND = UnitFactory.get_unit('http://qudt.org/vocab/unit#SecondTime')
+
+
+class UnitAlgebraTest(unittest.TestCase):
+    def test_multiply(self) -> None:
+        unit = UnitAlgebra.multiply(METER, METER)
+
+        self.assertEqual('m*m', unit.abbreviation)
+        self.assertEqual(1.0, unit.multiplier.multiplier)
+        self.assertEqual(DimensionVector(length=2), unit.dimension_vector)
+        self.assertTrue(is_convertible(unit, AreaUnit.SQUARE_METER))
+
+    def test_divide(self) -> None:
+        unit = UnitAlgebra.divide(KILOMETER, UnitAlgebra.multiply(METER, SECOND))
+
+        self.assertEqual('km/(m*s)', unit.abbreviation)
+        self.assertEqual(1000.0, unit.multiplier.multiplier)
+        self.assertEqual(DimensionVector(time=-1), unit.dimension_vector)
+        self.assertEqual(unit, UnitAlgebra.divide(KILOMETER, UnitAlgebra.multiply(METER, SECOND)))
+
+    def test_dimensionless(self) -> None:
+        length_ratio = UnitAlgebra.divide(METER, METER)
+        time_ratio = UnitAlgebra.divide(SECOND, SECOND)
+        scaled_ratio = UnitAlgebra.divide(KILOMETER, METER)
+
+        self.assertEqual(DimensionVector(), length_ratio.dimension_vector)
+
+        # Dimensionless derived units are only convertible to themselves
+        self.assertTrue(is_convertible(length_ratio, UnitAlgebra.divide(METER, METER)))
+        self.assertFalse(is_convertible(length_ratio, time_ratio))
+        self.assertFalse(is_convertible(length_ratio, scaled_ratio))
+
+    def test_power(self) -> None:
+        unit = UnitAlgebra.power(UnitAlgebra.divide(METER, SECOND), 2)
+
+        self.assertEqual('(m/s)^2', unit.abbreviation)
+        self.assertEqual(DimensionVector(length=2, time=-2), unit.dimension_vector)
+
+    def test_prefix(self) -> None:
+        milli = UnitFactory.get_unit('http://qudt.org/vocab/unit#Milli')
+
+        unit = UnitAlgebra.prefix(milli, SECOND)
+
+        self.assertEqual('ms', unit.abbreviation)
+        self.assertEqual('Millisecond', unit.label)
+        self.assertEqual(SECOND.type_iri, unit.type_iri)
+        self.assertEqual(0.001, unit.multiplier.multiplier)
+
+    def test_offset(self) -> None:
+        with self.assertRaises(ValueError):
+            UnitAlgebra.multiply(TemperatureUnit.CELSIUS, METER)
+
+        with self.assertRaises(ValueError):
+            UnitAlgebra.get_operation(ADD, TemperatureUnit.CELSIUS, TemperatureUnit.KELVIN)
+
+    def test_get_operation(self) -> None:
+        operation = UnitAlgebra.get_operation(ADD, KILOMETER, METER)
+
+        self.assertEqual(KILOMETER, operation.unit)
+        self.assertEqual(0.001, operation.scale)
+
+        self.assertEqual(UnitAlgebra.multiply(METER, SECOND), UnitAlgebra.get_operation(MULTIPLY, METER, SECOND).unit)
+        self.assertEqual(UnitAlgebra.power(SECOND, -1), UnitAlgebra.get_operation(POWER, SECOND, -1).unit)
+
+        with self.assertRaises(ValueError):
+            UnitAlgebra.get_operation(ADD, METER, SECOND)
+
+    def test_cached(self) -> None:
+        operation = UnitAlgebra.get_operation(DIVIDE, METER, SECOND)
+
+        hits = UnitAlgebra.get_cache_info().hits
+
+        self.assertIs(operation, UnitAlgebra.get_operation(DIVIDE, METER, SECOND))
+        self.assertEqual(hits + 1, UnitAlgebra.get_cache_info().hits)
+
+
+if __name__ == '__main__':
+    unittest.main()
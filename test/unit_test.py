@@ -11,8 +11,11 @@
 #
 ################################################################################
 
+from qudt.multiplier import Multiplier
 from qudt.unit import Unit
 
+import dataclasses
+import pickle
 import unittest
 
 
@@ -38,7 +41,7 @@ class UnitTest(unittest.TestCase):
 
         self.assertFalse(unit.type_iri)
 
-        unit.type_iri = resource_iri
+        unit = dataclasses.replace(unit, type_iri=resource_iri)
 
         self.assertTrue(unit.type_iri)
         self.assertEqual(resource_iri, unit.type_iri)
@@ -51,7 +54,7 @@ class UnitTest(unittest.TestCase):
 
         self.assertFalse(unit.label)
 
-        unit.label = label
+        unit = dataclasses.replace(unit, label=label)
 
         self.assertTrue(unit.label)
         self.assertEqual(label, unit.label)
@@ -64,7 +67,7 @@ class UnitTest(unittest.TestCase):
 
         self.assertFalse(unit.abbreviation)
 
-        unit.abbreviation = abbreviation
+        unit = dataclasses.replace(unit, abbreviation=abbreviation)
 
         self.assertTrue(unit.abbreviation)
         self.assertEqual(abbreviation, unit.abbreviation)
@@ -77,11 +80,35 @@ class UnitTest(unittest.TestCase):
 
         self.assertFalse(unit.symbol)
 
-        unit.symbol = symbol
+        unit = dataclasses.replace(unit, symbol=symbol)
 
         self.assertTrue(unit.symbol)
         self.assertEqual(symbol, unit.symbol)
 
+    def test_immutable(self) -> None:
+        unit = Unit(resource_iri='http://qudt.org/vocab/unit#Kelvin')
+
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            unit.label = 'Kelvin'  # type: ignore
+
+        self.assertFalse(hasattr(unit, '__dict__'))
+
+    def test_hash(self) -> None:
+        unit1 = Unit(resource_iri='http://qudt.org/vocab/unit#Kelvin', multiplier=Multiplier(0.0, 1.0))
+        unit2 = Unit(resource_iri='http://qudt.org/vocab/unit#Kelvin', multiplier=Multiplier(0.0, 1.0))
+
+        self.assertEqual(hash(unit1), hash(unit2))
+        self.assertEqual(1, len({unit1, unit2}))
+
+    def test_pickle(self) -> None:
+        unit = Unit(
+            resource_iri='http://qudt.org/vocab/unit#DegreeCelsius',
+            label='Degree Celsius',
+            multiplier=Multiplier(273.15, 1.0),
+        )
+
+        self.assertEqual(unit, pickle.loads(pickle.dumps(unit)))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -12,5 +12,6 @@
 ################################################################################
 
 from .energy_unit_test import EnergyUnitTest
+from .lazy_unit_test import LazyUnitTest
 from .length_unit_test import LengthUnitTest
 from .time_unit_test import TimeUnitTest
@@ -0,0 +1,108 @@
+################################################################################
+#
+#  Copyright (C) 2019 Garrett Brown
+#  This file is part of pyqudt - https://github.com/eigendude/pyqudt
+#
+#  pyqudt is derived from jQUDT
+#  Copyright (C) 2012-2013  Egon Willighagen <egonw@users.sf.net>
+#
+#  SPDX-License-Identifier: BSD-3-Clause
+#  See the file LICENSE for more information.
+#
+################################################################################
+
+from qudt.ontology.unit_factory import UnitFactory
+from qudt.unit import Unit
+from qudt.units.lazy_unit import LazyUnit
+
+import json
+import os
+import tempfile
+import unittest
+import unittest.mock
+
+try:
+    import mypy.api
+    HAS_MYPY = True
+except ImportError:
+    HAS_MYPY = False
+
+
+class LazyUnitTest(unittest.TestCase):
+    def test_resolve(self) -> None:
+        class TestUnit(object):
+            KELVIN: LazyUnit[Unit] = LazyUnit('http://qudt.org/vocab/unit#Kelvin')
+
+        self.assertIsInstance(TestUnit.__dict__['KELVIN'], LazyUnit)
+
+        unit = TestUnit.KELVIN
+
+        self.assertTrue(isinstance(unit, Unit))
+        self.assertEqual('K', unit.abbreviation)
+
+        # The resolved unit replaces the descriptor
+        self.assertIs(unit, TestUnit.__dict__['KELVIN'])
+        self.assertIs(unit, TestUnit.KELVIN)
+
+    def test_reset_on_load(self) -> None:
+        class TestUnit(object):
+            LEAGUE: LazyUnit[Unit] = LazyUnit('urn:pyqudt:test:League')
+
+        # Resolve the constant before the unit exists in a repository
+        self.assertFalse(TestUnit.LEAGUE.label)
+        self.assertNotIsInstance(TestUnit.__dict__['LEAGUE'], LazyUnit)
+
+        repo = {
+            '@context': {
+                'qudt': 'http://qudt.org/schema/qudt#',
+                'rdfs': 'http://www.w3.org/2000/01/rdf-schema#',
+            },
+            '@graph': [
+                {
+                    '@id': 'urn:pyqudt:test:League',
+                    '@type': 'urn:pyqudt:test:TravelUnit',
+                    'qudt:abbreviation': 'pyqudt-lea',
+                    'rdfs:label': 'League',
+                },
+            ],
+        }
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            repo_path = os.path.join(temp_dir, 'league.jsonld')
+            with open(repo_path, 'w') as file:
+                json.dump(repo, file)
+
+            self.assertGreaterEqual(UnitFactory.load_repo(repo_path), 1)
+
+        # Loading a repository restores the constant
+        self.assertIsInstance(TestUnit.__dict__['LEAGUE'], LazyUnit)
+
+        unit = TestUnit.LEAGUE
+
+        self.assertEqual('League', unit.label)
+        self.assertIs(UnitFactory.get_unit('urn:pyqudt:test:League'), unit)
+
+    @unittest.skipUnless(HAS_MYPY, 'mypy is not installed')
+    def test_type_annotations(self) -> None:
+        source = (
+            'from qudt.unit import Unit\n'
+            'from qudt.units.temperature import TemperatureUnit\n'
+            'unit: Unit = TemperatureUnit.KELVIN\n'
+            'reveal_type(TemperatureUnit.KELVIN)\n'
+        )
+
+        # Type check against this source tree, with its configuration
+        root_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+        with unittest.mock.patch.dict(os.environ, {'MYPYPATH': root_dir}):
+            (stdout, stderr, exit_status) = mypy.api.run([
+                '--config-file', os.path.join(root_dir, 'mypy.ini'),
+                '-c', source,
+            ])
+
+        self.assertEqual(0, exit_status, stdout + stderr)
+        self.assertIn('Revealed type is "qudt.unit.Unit"', stdout)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -12,3 +12,4 @@
 ################################################################################
 
 from .unit_ontology_factory_test import UnitOntologyFactoryTest
+from .unit_ontology_mapping_test import UnitOntologyMappingTest
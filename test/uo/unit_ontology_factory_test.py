@@ -11,9 +11,15 @@
 #
 ################################################################################
 
+from qudt.ontology.unit_factory import UnitFactory
 from qudt.uo.unit_ontology_factory import UnitOntologyFactory
+from qudt.uo.unit_ontology_factory import long_iri
+from qudt.uo.unit_ontology_mapping import UnitOntologyMapping
 from qudt.unit import Unit
 
+import json
+import os
+import tempfile
 import unittest
 
 
@@ -36,6 +42,118 @@ class UnitOntologyFactoryTest(unittest.TestCase):
 
         self.assertTrue(units)
         self.assertGreaterEqual(len(units), 1)
+        self.assertIn('http://purl.obolibrary.org/obo/UO_0000065', units)
+
+    def test_get_qudt_unit(self) -> None:
+        unit = UnitOntologyFactory.get_unit('http://purl.obolibrary.org/obo/UO_0000009')
+
+        self.assertEqual(UnitFactory.get_unit('http://qudt.org/vocab/unit#Kilogram'), unit)
+        self.assertEqual('Kilogram', unit.label if unit is not None else None)
+
+    def test_get_units(self) -> None:
+        units = UnitOntologyFactory.get_units([
+            'http://purl.obolibrary.org/obo/UO_0000065',
+            'http://purl.obolibrary.org/obo/UO_0000027',
+            'http://purl.obolibrary.org/obo/UO_0000065',
+            'urn:pyqudt:test:Unmapped',
+        ])
+
+        self.assertEqual([
+            UnitFactory.get_unit('http://www.openphacts.org/units/Nanomolar'),
+            UnitFactory.get_unit('http://qudt.org/vocab/unit#DegreeCelsius'),
+            UnitFactory.get_unit('http://www.openphacts.org/units/Nanomolar'),
+            None,
+        ], units)
+        self.assertIs(units[0], units[2])
+        self.assertIs(units[0], UnitOntologyFactory.get_unit('http://purl.obolibrary.org/obo/UO_0000065'))
+
+    def test_get_iri(self) -> None:
+        uo_iri = UnitOntologyFactory.get_uo_iri('http://www.openphacts.org/units/Nanomolar')
+
+        assert uo_iri is not None
+
+        self.assertEqual('http://purl.obolibrary.org/obo/UO_0000065', uo_iri)
+        self.assertEqual('http://www.openphacts.org/units/Nanomolar', UnitOntologyFactory.get_qudt_iri(uo_iri))
+        self.assertIsNone(UnitOntologyFactory.get_uo_iri('urn:pyqudt:test:Unmapped'))
+
+    def test_get_unit_by_curie(self) -> None:
+        unit = UnitOntologyFactory.get_unit('uo:UO_0000065')
+
+        self.assertIsNotNone(unit)
+        self.assertIs(UnitOntologyFactory.get_unit('http://purl.obolibrary.org/obo/UO_0000065'), unit)
+        self.assertEqual([unit, None], UnitOntologyFactory.get_units(['uo:UO_0000065', 'uo:Unmapped']))
+        self.assertEqual('http://www.openphacts.org/units/Nanomolar', UnitOntologyFactory.get_qudt_iri('uo:UO_0000065'))
+        self.assertEqual('http://purl.obolibrary.org/obo/UO_0000065', UnitOntologyFactory.get_uo_iri('ops:Nanomolar'))
+        self.assertEqual('http://purl.obolibrary.org/obo/UO_0000027', UnitOntologyFactory.get_uo_iri('unit:DegreeCelsius'))
+
+    def test_mapping_views(self) -> None:
+        self.assertEqual(
+            'http://www.openphacts.org/units/Nanomolar',
+            UnitOntologyFactory.uo_to_qudt['http://purl.obolibrary.org/obo/UO_0000065'],
+        )
+        self.assertEqual(
+            'http://purl.obolibrary.org/obo/UO_0000065',
+            UnitOntologyFactory.qudt_to_uo['http://www.openphacts.org/units/Nanomolar'],
+        )
+
+        with self.assertRaises(TypeError):
+            UnitOntologyFactory.uo_to_qudt['urn:pyqudt:test:UO_Unit'] = 'urn:pyqudt:test:Unit'  # type: ignore
+
+    def test_long_iri(self) -> None:
+        self.assertEqual('http://purl.obolibrary.org/obo/UO_0000065', long_iri('uo:UO_0000065'))
+        self.assertEqual('http://www.openphacts.org/units/Nanomolar', long_iri('ops:Nanomolar'))
+        self.assertEqual('http://qudt.org/vocab/unit#Kelvin', long_iri('unit:Kelvin'))
+
+        with self.assertRaises(ValueError):
+            long_iri('unknown:Kelvin')
+
+    def test_bundled_units_exist(self) -> None:
+        mapping = UnitOntologyMapping()
+        for repo_path in UnitOntologyFactory._get_bundled_mapping_paths():
+            mapping.add_repo(repo_path)
+
+        self.assertGreaterEqual(len(mapping), 45)
+
+        for (uo_iri, qudt_iri) in mapping._uo_to_qudt.items():
+            self.assertTrue(UnitFactory.get_unit(qudt_iri).label, uo_iri)
+
+    def test_load_mapping(self) -> None:
+        repo = {
+            '@context': {
+                'qudt': 'http://qudt.org/schema/qudt#',
+                'skos': 'http://www.w3.org/2004/02/skos/core#',
+            },
+            '@graph': [
+                {
+                    '@id': 'urn:pyqudt:test:UO_Furlong',
+                    'skos:exactMatch': {'@id': 'urn:pyqudt:test:MappedFurlong'},
+                },
+                {
+                    '@id': 'urn:pyqudt:test:MappedFurlong',
+                    '@type': 'urn:pyqudt:test:LengthUnit',
+                    'qudt:abbreviation': 'pyqudt-mapped-fur',
+                },
+            ],
+        }
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            repo_path = os.path.join(temp_dir, 'furlong.jsonld')
+            with open(repo_path, 'w') as file:
+                json.dump(repo, file)
+
+            self.assertGreaterEqual(UnitOntologyFactory.load_mapping(repo_path), 1)
+
+            # The unit is resolved, but isn't defined yet
+            unit = UnitOntologyFactory.get_unit('urn:pyqudt:test:UO_Furlong')
+            self.assertEqual(Unit(resource_iri='urn:pyqudt:test:MappedFurlong'), unit)
+
+            # Loading the unit's repository replaces the cached unit
+            UnitFactory.load_repo(repo_path)
+
+        unit = UnitOntologyFactory.get_unit('urn:pyqudt:test:UO_Furlong')
+
+        self.assertEqual('pyqudt-mapped-fur', unit.abbreviation if unit is not None else None)
+        self.assertEqual(0, UnitOntologyFactory.load_mapping('/nonexistent/mapping.jsonld'))
 
 
 if __name__ == '__main__':
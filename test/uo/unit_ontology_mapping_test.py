@@ -0,0 +1,68 @@
+################################################################################
+#
+#  Copyright (C) 2019 Garrett Brown
+#  This file is part of pyqudt - https://github.com/eigendude/pyqudt
+#
+#  pyqudt is derived from jQUDT
+#  Copyright (C) 2012-2013  Egon Willighagen <egonw@users.sf.net>
+#
+#  SPDX-License-Identifier: BSD-3-Clause
+#  See the file LICENSE for more information.
+#
+################################################################################
+
+from qudt.ontology.rdfs import RDFS
+from qudt.ontology.skos import SKOS
+from qudt.uo.unit_ontology_factory import UnitOntologyFactory
+from qudt.uo.unit_ontology_mapping import UnitOntologyMapping
+
+import unittest
+
+NANOMOLAR_UO_IRI = 'http://purl.obolibrary.org/obo/UO_0000065'
+NANOMOLAR_IRI = 'http://www.openphacts.org/units/Nanomolar'
+
+
+class UnitOntologyMappingTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.mapping = UnitOntologyMapping()
+        self.mapping.add_statements([
+            (NANOMOLAR_UO_IRI, RDFS.LABEL, 'nanomolar'),
+            (NANOMOLAR_UO_IRI, SKOS.EXACT_MATCH, NANOMOLAR_IRI),
+        ])
+
+    def test_get_iris(self) -> None:
+        self.assertEqual(1, len(self.mapping))
+        self.assertEqual(NANOMOLAR_IRI, self.mapping.get_qudt_iri(NANOMOLAR_UO_IRI))
+        self.assertEqual(NANOMOLAR_UO_IRI, self.mapping.get_uo_iri(NANOMOLAR_IRI))
+        self.assertIsNone(self.mapping.get_qudt_iri(NANOMOLAR_IRI))
+        self.assertIsNone(self.mapping.get_uo_iri(NANOMOLAR_UO_IRI))
+
+    def test_first_match_wins(self) -> None:
+        self.mapping.add_statements([
+            (NANOMOLAR_UO_IRI, SKOS.EXACT_MATCH, 'urn:pyqudt:test:Nanomolar'),
+            ('urn:pyqudt:test:UO_Nanomolar', SKOS.EXACT_MATCH, NANOMOLAR_IRI),
+        ])
+
+        self.assertEqual(NANOMOLAR_IRI, self.mapping.get_qudt_iri(NANOMOLAR_UO_IRI))
+        self.assertEqual(NANOMOLAR_UO_IRI, self.mapping.get_uo_iri(NANOMOLAR_IRI))
+        self.assertEqual(NANOMOLAR_IRI, self.mapping.get_qudt_iri('urn:pyqudt:test:UO_Nanomolar'))
+
+    def test_copy(self) -> None:
+        mapping = self.mapping.copy()
+        mapping.add_statements([('urn:pyqudt:test:UO_Furlong', SKOS.EXACT_MATCH, 'urn:pyqudt:test:Furlong')])
+
+        self.assertEqual(2, len(mapping))
+        self.assertEqual(1, len(self.mapping))
+
+    def test_expand_curie(self) -> None:
+        self.assertEqual('uo:UO_0000065', self.mapping.expand_curie('uo:UO_0000065'))
+
+        for repo_path in UnitOntologyFactory._get_bundled_mapping_paths():
+            self.mapping.add_repo(repo_path)
+
+        self.assertEqual(NANOMOLAR_UO_IRI, self.mapping.expand_curie('uo:UO_0000065'))
+        self.assertEqual(NANOMOLAR_IRI, self.mapping.expand_curie('ops:Nanomolar'))
+
+
+if __name__ == '__main__':
+    unittest.main()